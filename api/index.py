@@ -8,6 +8,7 @@ if current_dir not in sys.path:
 
 import uuid
 import json
+import time
 import datetime
 from flask import Flask, request, jsonify, send_file, Response
 from flask_cors import CORS
@@ -16,7 +17,8 @@ from dotenv import load_dotenv
 import jwt
 from werkzeug.security import generate_password_hash, check_password_hash
 from models import db, AnalysisJob, Consultant, User, Project, Milestone, Post, Company
-from services import AIService, MatchingService, ProposalService
+from models import ConsultantIso, ConsultantIndustry, ConsultantScore, rebuild_consultant_capabilities, upgrade_schema
+from services import AIService, MatchingService, ProposalService, AnalysisQueue
 
 # Load environment variables
 # Load from project root directory
@@ -56,12 +58,30 @@ ai_service = AIService()
 matching_service = MatchingService()
 proposal_service = ProposalService()
 
+# Analysis worker pool - Vercel 서버리스에서는 응답 후 스레드가 동결되므로 기본 0 (조회 시 인라인 실행)
+analysis_queue = AnalysisQueue(
+    app,
+    ai_service.analyze,
+    workers=int(os.environ.get('ANALYSIS_WORKERS', '0' if os.environ.get('VERCEL') else '4')),
+    job_timeout=float(os.environ.get('ANALYSIS_JOB_TIMEOUT', '300')),
+    coalesce_window=float(os.environ.get('ANALYSIS_COALESCE_WINDOW', '60')),
+    on_complete=matching_service.materialize
+)
+
 # Create tables on first request
 @app.before_request
 def create_tables():
     if not hasattr(app, '_tables_created'):
         db.create_all()
+        # 기존 DB 업그레이드: 이후 추가된 analysis_job 컬럼 (create_all()은 기존 테이블에 컬럼을 추가하지 않음)
+        upgrade_schema()
+        # 기존 DB 업그레이드: 컨설턴트는 있는데 join table / 정적 점수 테이블이 비어 있으면 JSON 컬럼에서 채움
+        if Consultant.query.first() and (not (ConsultantIso.query.first() or ConsultantIndustry.query.first())
+                                         or not ConsultantScore.query.first()):
+            rebuild_consultant_capabilities()
+        matching_service.ensure_match_keys()
         app._tables_created = True
+        analysis_queue.start()
 
 # --- Auth Endpoints ---
 @app.route('/api/auth/signup', methods=['POST'])
@@ -100,6 +120,7 @@ def signup():
         )
         db.session.add(new_consultant)
         db.session.commit()
+        matching_service.refresh_consultant(new_consultant)
         
     return jsonify({'message': 'User created successfully'}), 201
 
@@ -146,9 +167,7 @@ def start_analysis():
         status='processing'
     )
     job.set_intake_data(data)
-    
-    db.session.add(job)
-    db.session.commit()
+    analysis_queue.submit(job)
     
     return jsonify({'job_id': job_id, 'message': 'Analysis started'}), 202
 
@@ -158,30 +177,76 @@ def get_analysis_status(job_id):
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    if job.status == 'processing':
-        job.status = 'analyzing'
-        db.session.commit()
-        
-        try:
-            intake_data = job.get_intake_data()
-            result = ai_service.analyze(intake_data)
-            
-            job.set_result(result)
-            job.status = 'completed'
-            db.session.commit()
-        except Exception as e:
-            job.status = 'failed'
-            db.session.commit()
-            return jsonify({'status': 'failed', 'error': str(e)})
-            
-    elif job.status == 'analyzing':
+    # 중복 요청으로 병합된 작업은 leader 작업의 상태를 따름
+    analysis_queue.resolve(job)
+    
+    # 워커가 없는 환경에서는 첫 조회 요청이 작업을 직접 실행
+    if job.status == 'processing' and not analysis_queue.enabled:
+        analysis_queue.run_now(job.leader_id or job_id)
+        analysis_queue.resolve(job)
+    
+    if job.status in ('processing', 'analyzing'):
         return jsonify({'status': 'processing'})
+    
+    if job.status == 'failed':
+        return jsonify({'status': 'failed', 'error': job.error})
 
     return jsonify({
         'status': job.status,
         'result': job.get_result()
     })
 
+@app.route('/api/analyze/<job_id>/stream', methods=['GET'])
+def stream_analysis(job_id):
+    """분석 진행 상황 Server-Sent Events 스트림 (stage -> completed | failed)"""
+    if not AnalysisJob.query.get(job_id):
+        return jsonify({'error': 'Job not found'}), 404
+    
+    def sse(event, data):
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    
+    def generate():
+        sent = 0
+        last_write = time.time()
+        deadline = time.time() + float(os.environ.get('ANALYSIS_STREAM_TIMEOUT', '300'))
+        started_inline = False
+        
+        while time.time() < deadline:
+            snapshot = analysis_queue.snapshot(job_id)
+            if snapshot is None:
+                yield sse('failed', {'error': 'Job not found'})
+                return
+            
+            # 워커가 없는 환경에서는 스트림이 열린 동안 작업을 직접 실행 (중복 요청이면 공유 대상 작업을 실행)
+            if snapshot['status'] == 'processing' and not analysis_queue.enabled and not started_inline:
+                analysis_queue.run_detached(snapshot['leader_id'] or job_id)
+                started_inline = True
+            
+            for event in snapshot['progress'][sent:]:
+                yield sse('stage', event)
+                last_write = time.time()
+            sent = len(snapshot['progress'])
+            
+            if snapshot['status'] == 'completed':
+                yield sse('completed', {'status': 'completed', 'result': snapshot['result']})
+                return
+            if snapshot['status'] == 'failed':
+                yield sse('failed', {'status': 'failed', 'error': snapshot['error']})
+                return
+            
+            if time.time() - last_write > 15:
+                yield ": keep-alive\n\n"
+                last_write = time.time()
+            # 같은 프로세스의 워커는 즉시 깨우고, 다른 프로세스의 워커는 1초 간격 DB 조회로 확인
+            analysis_queue.wait_for_update(1.0)
+        
+        yield sse('timeout', {'status': 'processing'})
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 # --- Consultant Endpoints ---
 @app.route('/api/consultants', methods=['GET'])
 def get_consultants():
@@ -196,6 +261,9 @@ def get_consultants():
     if job_id:
         job = AnalysisJob.query.get(job_id)
         if job and job.result:
+            # 분석 결과 조건 그대로면 완료 시 저장된 매칭 결과 사용
+            if not (industry or iso_codes or project_type or region):
+                return jsonify(matching_service.job_matches(job))
             analysis_result = job.get_result()
             criteria = analysis_result
             
@@ -215,6 +283,91 @@ def get_consultants():
     consultants = Consultant.query.all()
     return jsonify([c.to_dict() for c in consultants])
 
+MATCH_BATCH_MAX_ITEMS = int(os.environ.get('MATCH_BATCH_MAX_ITEMS', '100'))
+MATCH_CRITERIA_TEXT_FIELDS = ('industry', 'region', 'project_type')
+MATCH_GOV_DATA_TEXT_FIELDS = ('main_business', 'industry_code', 'address')
+
+def _criteria_error(criteria):
+    """매칭 조건 형식 오류 (없으면 None) - MatchingService._parse_criteria가 읽는 값은 문자열 / 목록 / 객체 형식이어야 함"""
+    if not isinstance(criteria, dict):
+        return None
+    for field in MATCH_CRITERIA_TEXT_FIELDS:
+        if not isinstance(criteria.get(field), (str, type(None))):
+            return f'{field} must be a string or null'
+    recommended_iso = criteria.get('recommended_iso')
+    if not isinstance(recommended_iso, (list, type(None))):
+        return 'recommended_iso must be a list or null'
+    for iso in recommended_iso or []:
+        if not isinstance(iso, dict) or not isinstance(iso.get('code'), (str, type(None))):
+            return 'recommended_iso items must be objects with a string code'
+    gov_data = criteria.get('gov_data')
+    if not isinstance(gov_data, (dict, type(None))):
+        return 'gov_data must be an object or null'
+    for field in MATCH_GOV_DATA_TEXT_FIELDS:
+        if not isinstance((gov_data or {}).get(field), (str, type(None))):
+            return f'gov_data.{field} must be a string or null'
+    return None
+
+@app.route('/api/consultants/match/batch', methods=['POST'])
+def match_consultants_batch():
+    """
+    여러 분석 작업(job_ids) / 매칭 조건(criteria)을 한 번에 매칭
+
+    Body: {"job_ids": [...], "criteria": [{"industry": ..., "recommended_iso": [...]}, ...], "limit": 20}
+    Response: {"results": [{"job_id": ..., "matches": [...]}, {"criteria_index": 0, "matches": [...]}, ...]}
+    """
+    data = request.json or {}
+    job_ids = data.get('job_ids') or []
+    criteria_list = data.get('criteria') or []
+    if not isinstance(job_ids, list) or not isinstance(criteria_list, list):
+        return jsonify({'error': 'job_ids and criteria must be lists'}), 400
+    if len(job_ids) + len(criteria_list) > MATCH_BATCH_MAX_ITEMS:
+        return jsonify({'error': f'Too many items (max {MATCH_BATCH_MAX_ITEMS})'}), 400
+    try:
+        limit = min(max(int(data.get('limit', 20)), 1), 100)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'limit must be an integer'}), 400
+    for i, job_id in enumerate(job_ids):
+        if isinstance(job_id, bool) or not isinstance(job_id, (str, int)):
+            return jsonify({'error': f'job_ids[{i}] must be a string or integer', 'job_index': i}), 400
+    # 조건 값은 문자열만 해석 가능 (목록 등은 업종 / 지역 해석 캐시 키로 쓸 수 없음)
+    for i, criteria in enumerate(criteria_list):
+        error = _criteria_error(criteria)
+        if error:
+            return jsonify({'error': f'criteria[{i}].{error}', 'criteria_index': i}), 400
+
+    # 분석 결과는 한 번의 쿼리로 조회
+    jobs = {}
+    if job_ids:
+        jobs = {job.id: job for job in AnalysisJob.query.filter(AnalysisJob.id.in_(job_ids)).all()}
+
+    results = []
+    batch = []
+    for job_id in job_ids:
+        job = jobs.get(job_id)
+        if not job or not job.result:
+            results.append({'job_id': job_id, 'error': 'Job not found or not completed'})
+            continue
+        entry = {'job_id': job_id}
+        results.append(entry)
+        stored = matching_service.materialized_matches(job, limit)
+        if stored is not None:
+            entry['matches'] = stored
+        else:
+            batch.append((entry, job.get_result()))
+    for i, criteria in enumerate(criteria_list):
+        if not isinstance(criteria, dict):
+            results.append({'criteria_index': i, 'error': 'criteria must be an object'})
+            continue
+        entry = {'criteria_index': i}
+        results.append(entry)
+        batch.append((entry, criteria))
+
+    matches = matching_service.match_batch([criteria for _, criteria in batch], limit)
+    for (entry, _), entry_matches in zip(batch, matches):
+        entry['matches'] = entry_matches
+    return jsonify({'results': results})
+
 @app.route('/api/consultants/register', methods=['POST'])
 def register_consultant():
     data = request.json
@@ -238,6 +391,7 @@ def register_consultant():
     )
     db.session.add(new_consultant)
     db.session.commit()
+    matching_service.refresh_consultant(new_consultant)
     return jsonify({'message': 'Consultant registered successfully', 'id': new_consultant.id}), 201
 
 # --- Project Endpoints ---
@@ -322,6 +476,15 @@ def get_admin_jobs():
         })
     return jsonify(results)
 
+@app.route('/api/admin/cache/stats', methods=['GET'])
+def get_cache_stats():
+    return jsonify({
+        'corp_info': ai_service.corp_info_service.cache.stats(),
+        'llm': ai_service.result_cache.stats(),
+        'http': ai_service.http.stats(),
+        'parse': ai_service.crawler.parser.stats()
+    })
+
 # --- Consultant Admin Endpoints ---
 @app.route('/api/admin/consultants/<int:consultant_id>/approve', methods=['POST'])
 def approve_consultant(consultant_id):
@@ -329,6 +492,7 @@ def approve_consultant(consultant_id):
     consultant.verified = True
     consultant.trust_score = max(consultant.trust_score or 50, 70)
     db.session.commit()
+    matching_service.refresh_consultant(consultant)
     return jsonify({'message': 'Consultant approved successfully', 'verified': True})
 
 @app.route('/api/admin/consultants/<int:consultant_id>/reject', methods=['POST'])
@@ -338,6 +502,7 @@ def reject_consultant(consultant_id):
     consultant = Consultant.query.get_or_404(consultant_id)
     db.session.delete(consultant)
     db.session.commit()
+    matching_service.remove_consultant(consultant_id)
     return jsonify({'message': f'Consultant rejected: {reason}'})
 
 @app.route('/api/admin/consultants/<int:consultant_id>/revoke', methods=['POST'])
@@ -346,6 +511,7 @@ def revoke_consultant_verification(consultant_id):
     consultant.verified = False
     consultant.trust_score = min(consultant.trust_score or 50, 50)
     db.session.commit()
+    matching_service.refresh_consultant(consultant)
     return jsonify({'message': 'Consultant verification revoked', 'verified': False})
 
 # --- Consultant Detail Endpoint ---
@@ -699,6 +865,7 @@ def seed_data():
             c = Consultant(user_id=u.id, **c_data)
             db.session.add(c)
         db.session.commit()
+        matching_service.invalidate()
     
     return jsonify({'message': 'Seed data created successfully'})
 
@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, text, inspect as sa_inspect
 from datetime import datetime
 import json
 
@@ -64,6 +65,222 @@ class Consultant(db.Model):
             'roles': json.loads(self.roles) if self.roles else []
         }
 
+# --- Consultant capability join tables ---
+# JSON 컬럼(iso_experience, industry_experience, project_types, regions)을 정규화한 검색용 테이블과
+# 정적 점수(consultant_score) 테이블.
+# Consultant가 ORM으로 insert/update/delete될 때 아래 mapper 이벤트로 자동 동기화됩니다.
+# (query.update() 같은 bulk 연산은 이벤트를 거치지 않으므로 rebuild_consultant_capabilities() 호출 필요)
+
+class ConsultantIso(db.Model):
+    __tablename__ = 'consultant_iso'
+    consultant_id = db.Column(db.Integer, db.ForeignKey('consultant.id', ondelete='CASCADE'), primary_key=True)
+    iso_code = db.Column(db.String(200), primary_key=True)
+    role = db.Column(db.String(100)) # iso_experience 값 (e.g. "Lead Auditor")
+    __table_args__ = (db.Index('ix_consultant_iso_code', 'iso_code', 'consultant_id'),)
+
+class ConsultantIndustry(db.Model):
+    __tablename__ = 'consultant_industry'
+    consultant_id = db.Column(db.Integer, db.ForeignKey('consultant.id', ondelete='CASCADE'), primary_key=True)
+    industry = db.Column(db.String(200), primary_key=True)
+    __table_args__ = (db.Index('ix_consultant_industry_industry', 'industry', 'consultant_id'),)
+
+class ConsultantProjectType(db.Model):
+    __tablename__ = 'consultant_project_type'
+    consultant_id = db.Column(db.Integer, db.ForeignKey('consultant.id', ondelete='CASCADE'), primary_key=True)
+    project_type = db.Column(db.String(200), primary_key=True)
+    __table_args__ = (db.Index('ix_consultant_project_type_type', 'project_type', 'consultant_id'),)
+
+class ConsultantRegion(db.Model):
+    __tablename__ = 'consultant_region'
+    consultant_id = db.Column(db.Integer, db.ForeignKey('consultant.id', ondelete='CASCADE'), primary_key=True)
+    region = db.Column(db.String(200), primary_key=True)
+    __table_args__ = (db.Index('ix_consultant_region_region', 'region', 'consultant_id'),)
+
+class ConsultantMatchKey(db.Model):
+    """
+    매칭 후보 검색 키 (services.consultant_query가 컨설턴트 저장 시 기록)
+
+    ISO 정규 코드 / 업종 분류 노드 / 프로젝트 유형 / 활동 시·도(시/군/구)를 해석한 결과를
+    'iso:ISO 9001', 'industry:C26', 'region:서울' 같은 문자열로 저장해 후보 조회가 key IN (...) 한 번으로 끝나도록 합니다.
+    """
+    __tablename__ = 'consultant_match_key'
+    consultant_id = db.Column(db.Integer, db.ForeignKey('consultant.id', ondelete='CASCADE'), primary_key=True)
+    key = db.Column(db.String(200), primary_key=True)
+    __table_args__ = (db.Index('ix_consultant_match_key_key', 'key', 'consultant_id'),)
+
+class ConsultantScore(db.Model):
+    """컨설턴트별 정적 매칭 점수 / 신뢰도 리더보드 (정렬 인덱스로 상위 N명을 바로 읽음)"""
+    __tablename__ = 'consultant_score'
+    consultant_id = db.Column(db.Integer, db.ForeignKey('consultant.id', ondelete='CASCADE'), primary_key=True)
+    static_score = db.Column(db.Float, nullable=False, default=0.0) # static_match_score()
+    trust_score = db.Column(db.Float, nullable=False, default=0.0) # Consultant.trust_score (NULL -> 0)
+    __table_args__ = (
+        db.Index('ix_consultant_score_static', static_score.desc(), consultant_id),
+        db.Index('ix_consultant_score_trust', trust_score.desc(), consultant_id),
+    )
+
+class MatchingSnapshot(db.Model):
+    """매칭 컬럼형 스냅샷 (services.matching_snapshot 형식) - cold start 시 컨설턴트 전체 조회/디코딩 대신 로드"""
+    __tablename__ = 'matching_snapshot'
+    id = db.Column(db.Integer, primary_key=True) # 항상 1
+    data_version = db.Column(db.Integer, nullable=False, default=0) # 컨설턴트 추가/수정/삭제마다 증가
+    snapshot_version = db.Column(db.Integer) # data를 빌드한 시점의 data_version (다르면 오래된 스냅샷)
+    format_version = db.Column(db.Integer) # matching_snapshot.FORMAT_VERSION
+    token = db.Column(db.String(32)) # 스냅샷 내용 식별자 (로컬 mmap 캐시 파일 이름)
+    keys_fingerprint = db.Column(db.String(32)) # consultant_match_key를 만든 ISO / 업종 / 지역 표 지문 (다르면 재생성)
+    built_at = db.Column(db.DateTime)
+    data = db.Column(db.LargeBinary)
+
+CAPABILITY_FIELDS = ('iso_experience', 'industry_experience', 'project_types', 'regions')
+SCORE_FIELDS = ('trust_score', 'verified', 'reviews', 'rating')
+
+
+def static_match_score(trust_score, verified, reviews, rating) -> float:
+    """컨설턴트에만 의존하는 매칭 점수: 신뢰도(최대 20) + 리뷰/평점(최대 10)"""
+    trust_points = (trust_score or 0) * 0.1
+    if verified:
+        trust_points += 10
+    score = min(trust_points, 20)
+    if (reviews or 0) > 10:
+        score += 5
+    if (rating or 0) >= 4.5:
+        score += 5
+    return score
+
+
+def _json_value(value, default):
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _json_terms(value):
+    """JSON 목록/객체 키를 중복 없는 문자열 목록으로 - 매칭과 같은 결과가 나오도록 값은 그대로 유지"""
+    if isinstance(value, dict):
+        value = list(value.keys())
+    elif isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, list):
+        return []
+    return list(dict.fromkeys(v for v in value if isinstance(v, str)))
+
+
+def consultant_capability_rows(consultant):
+    """Consultant -> {join table: insert rows}"""
+    iso = _json_value(consultant.iso_experience, {})
+    roles = iso if isinstance(iso, dict) else {}
+    regions = [r.strip() for r in (consultant.regions or '').split(',')]
+    cid = consultant.id
+    return {
+        ConsultantIso.__table__: [
+            {'consultant_id': cid, 'iso_code': code, 'role': roles.get(code) if isinstance(roles.get(code), str) else None}
+            for code in _json_terms(iso)
+        ],
+        ConsultantIndustry.__table__: [
+            {'consultant_id': cid, 'industry': term} for term in _json_terms(_json_value(consultant.industry_experience, []))
+        ],
+        ConsultantProjectType.__table__: [
+            {'consultant_id': cid, 'project_type': term} for term in _json_terms(_json_value(consultant.project_types, []))
+        ],
+        ConsultantRegion.__table__: [
+            {'consultant_id': cid, 'region': region} for region in dict.fromkeys(r for r in regions if r)
+        ],
+        ConsultantScore.__table__: [{
+            'consultant_id': cid,
+            'static_score': static_match_score(consultant.trust_score, consultant.verified,
+                                               consultant.reviews, consultant.rating),
+            'trust_score': consultant.trust_score or 0
+        }]
+    }
+
+
+def _write_capabilities(connection, consultant):
+    for table, rows in consultant_capability_rows(consultant).items():
+        connection.execute(table.delete().where(table.c.consultant_id == consultant.id))
+        if rows:
+            connection.execute(table.insert(), rows)
+
+
+def _bump_data_version(connection):
+    """저장된 매칭 스냅샷을 오래된 것으로 표시 (컨설턴트 변경과 같은 트랜잭션)"""
+    table = MatchingSnapshot.__table__
+    connection.execute(table.update().values(data_version=table.c.data_version + 1))
+
+
+@event.listens_for(Consultant, 'after_insert')
+def _consultant_inserted(mapper, connection, target):
+    _write_capabilities(connection, target)
+    _bump_data_version(connection)
+
+
+@event.listens_for(Consultant, 'after_update')
+def _consultant_updated(mapper, connection, target):
+    state = sa_inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in CAPABILITY_FIELDS + SCORE_FIELDS):
+        _write_capabilities(connection, target)
+    _bump_data_version(connection)
+
+
+@event.listens_for(Consultant, 'after_delete')
+def _consultant_deleted(mapper, connection, target):
+    # SQLite는 기본적으로 FK CASCADE가 꺼져 있으므로 직접 삭제
+    for table in consultant_capability_rows(target):
+        connection.execute(table.delete().where(table.c.consultant_id == target.id))
+    _bump_data_version(connection)
+
+
+def rebuild_consultant_capabilities():
+    """JSON 컬럼에서 join table / consultant_score 전체 재생성 (기존 DB 업그레이드 / bulk 변경 후)"""
+    connection = db.session.connection()
+    for table in (ConsultantIso.__table__, ConsultantIndustry.__table__,
+                  ConsultantProjectType.__table__, ConsultantRegion.__table__, ConsultantScore.__table__):
+        connection.execute(table.delete())
+    for consultant in Consultant.query.all():
+        for table, rows in consultant_capability_rows(consultant).items():
+            if rows:
+                connection.execute(table.insert(), rows)
+    db.session.commit()
+
+
+# 배포된 DB에 이미 있는 테이블 중 이후 컬럼이 추가된 테이블 (create_all()은 기존 테이블을 변경하지 않음)
+UPGRADED_TABLES = ('analysis_job', 'matching_snapshot')
+
+
+def upgrade_schema():
+    """
+    기존 DB 업그레이드: UPGRADED_TABLES에서 빠진 컬럼 / 인덱스 추가 (이미 있으면 아무것도 하지 않음)
+
+    Python 쪽 기본값(예: attempts=0)이 있는 컬럼은 DEFAULT로 추가하여 기존 행도 같은 값을 가집니다.
+    """
+    engine = db.engine
+    preparer = engine.dialect.identifier_preparer
+    inspector = sa_inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as connection:
+        for name in UPGRADED_TABLES:
+            table = db.metadata.tables[name]
+            if name not in existing_tables:
+                continue
+            columns = {column['name'] for column in inspector.get_columns(name)}
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                ddl = (f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} "
+                       f"{column.type.compile(dialect=engine.dialect)}")
+                default = column.default.arg if column.default is not None and column.default.is_scalar else None
+                if isinstance(default, (int, float)) and not isinstance(default, bool):
+                    ddl += f" DEFAULT {default}"
+                print(f"[DB] {name}.{column.name} 컬럼 추가")
+                connection.execute(text(ddl))
+            indexes = {index['name'] for index in inspector.get_indexes(name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(connection)
+
+
 class Project(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     company_id = db.Column(db.Integer, db.ForeignKey('user.id')) # Using User ID for simplicity in MVP
@@ -115,9 +332,17 @@ class AnalysisJob(db.Model):
     id = db.Column(db.String(36), primary_key=True) # UUID
     company_name = db.Column(db.String(100))
     url = db.Column(db.String(200))
-    status = db.Column(db.String(20), default='processing') # processing, completed, failed
+    status = db.Column(db.String(20), default='processing', index=True) # processing(queued), analyzing, completed, failed
     result = db.Column(db.Text) # JSON string
     intake_data = db.Column(db.Text) # JSON string for raw input
+    progress = db.Column(db.Text) # JSON list of stage events
+    error = db.Column(db.Text) # Failure reason (status == 'failed')
+    dedup_key = db.Column(db.String(64), index=True) # Company identity + intake params hash
+    leader_id = db.Column(db.String(36), index=True) # Set on follower jobs coalesced onto another job
+    attempts = db.Column(db.Integer, default=0) # Worker claim count
+    started_at = db.Column(db.DateTime) # Claimed by a worker
+    finished_at = db.Column(db.DateTime)
+    matches = db.Column(db.Text) # JSON materialized consultant matches (MatchingService.materialize)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     def set_result(self, result_dict):
@@ -132,3 +357,15 @@ class AnalysisJob(db.Model):
     def get_intake_data(self):
         return json.loads(self.intake_data) if self.intake_data else {}
 
+    def get_progress(self):
+        return json.loads(self.progress) if self.progress else []
+
+    def add_progress_event(self, event_dict):
+        self.progress = json.dumps(self.get_progress() + [event_dict])
+
+    def set_matches(self, matches_dict):
+        self.matches = json.dumps(matches_dict) if matches_dict is not None else None
+
+    def get_matches(self):
+        return json.loads(self.matches) if self.matches else None
+
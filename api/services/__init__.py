@@ -1,4 +1,5 @@
 from .ai_service import AIService
 from .matching_service import MatchingService
 from .proposal_service import ProposalService
+from .analysis_queue import AnalysisQueue
 
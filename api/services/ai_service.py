@@ -1,113 +1,122 @@
 import os
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 import google.generativeai as genai
-import requests
-from bs4 import BeautifulSoup
 import json
 
 # Import CorpInfoService
 from .corp_info_service import CorpInfoService
+from .http_client import HttpClient
+from .site_crawler import SiteCrawler
+from .llm_cache import LLMResultCache, prompt_cache_key
 
 class AIService:
-    def __init__(self):
+    MODEL_NAME = 'gemini-2.5-flash-lite'
+
+    def __init__(self, result_cache: LLMResultCache = None):
         # API 키는 환경변수에서 가져오기
         api_key = os.environ.get('GOOGLE_API_KEY')
         if api_key:
             genai.configure(api_key=api_key)
             # Tools 설정: Google Search Retrieval 활성화 (Grounding)
-            self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
+            self.model = genai.GenerativeModel(self.MODEL_NAME)
         else:
             self.model = None
             print("Warning: GOOGLE_API_KEY not found. AI Service will use mock data.")
         
+        # 스크래핑 / 공공데이터 API가 함께 쓰는 keep-alive HTTP 클라이언트
+        self.http = HttpClient.shared()
         # 기업정보 API 서비스 초기화
-        self.corp_info_service = CorpInfoService()
+        self.corp_info_service = CorpInfoService(http=self.http)
+        # 기업 웹사이트 인증 근거 크롤러
+        self.crawler = SiteCrawler.from_env(http=self.http)
+        # Gemini 분석 결과 캐시 (프롬프트 해시 기준)
+        self.result_cache = result_cache if result_cache is not None else LLMResultCache.from_env()
 
     def _scrape_iso_info(self, url: str, company_name: str) -> dict:
         """
         웹사이트에서 ISO 인증 관련 정보를 스크래핑합니다.
+        메인 페이지, 링크, sitemap.xml에서 인증 관련 페이지를 골라 동시에 조회합니다. (SiteCrawler)
         """
         result = {
             'site_content': '',
             'iso_mentions': [],
-            'certification_page_found': False
+            'iso_sources': {},
+            'certificate_numbers': [],
+            'expiry_dates': [],
+            'certification_page_found': False,
+            'pages_fetched': 0
         }
         
         if not url:
             return result
             
         try:
-            if not url.startswith('http'):
-                url = 'https://' + url
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            # 메인 페이지 스크래핑
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                body_text = soup.get_text(separator=' ', strip=True)
-                result['site_content'] = body_text[:1500]
-                
-                # ISO 관련 키워드 검색
-                iso_patterns = [
-                    r'ISO\s*9001',
-                    r'ISO\s*14001',
-                    r'ISO\s*45001',
-                    r'ISO\s*27001',
-                    r'ISO\s*13485',
-                    r'IATF\s*16949',
-                    r'품질경영시스템',
-                    r'환경경영시스템',
-                    r'안전보건경영시스템',
-                    r'정보보안경영시스템',
-                ]
-                
-                for pattern in iso_patterns:
-                    matches = re.findall(pattern, body_text, re.IGNORECASE)
-                    if matches:
-                        result['iso_mentions'].extend(matches)
-                
-                # 인증 관련 페이지 링크 찾기
-                cert_keywords = ['인증', 'certification', 'iso', 'quality', '품질', '환경']
-                for link in soup.find_all('a', href=True):
-                    link_text = link.get_text().lower()
-                    href = link['href'].lower()
-                    if any(kw in link_text or kw in href for kw in cert_keywords):
-                        result['certification_page_found'] = True
-                        # 인증 페이지 스크래핑 시도
-                        try:
-                            cert_url = link['href']
-                            if not cert_url.startswith('http'):
-                                cert_url = url.rstrip('/') + '/' + cert_url.lstrip('/')
-                            cert_response = requests.get(cert_url, headers=headers, timeout=5)
-                            if cert_response.status_code == 200:
-                                cert_soup = BeautifulSoup(cert_response.text, 'html.parser')
-                                cert_text = cert_soup.get_text(separator=' ', strip=True)
-                                for pattern in iso_patterns:
-                                    matches = re.findall(pattern, cert_text, re.IGNORECASE)
-                                    if matches:
-                                        result['iso_mentions'].extend(matches)
-                        except:
-                            pass
-                        break
-                
-                # 중복 제거
-                result['iso_mentions'] = list(set(result['iso_mentions']))
-                
+            result = self.crawler.crawl(url)
         except Exception as e:
             print(f"웹사이트 스크래핑 실패: {e}")
             result['site_content'] = "Website not accessible."
         
         return result
 
-    def analyze(self, intake_data):
+    def _generate(self, prompt: str) -> dict:
+        """Gemini 호출 후 응답 텍스트에서 JSON을 추출합니다."""
+        response = self.model.generate_content(prompt)
+        text = response.text
+        
+        # JSON 추출
+        if "```json" in text:
+            text = text.split("```json")[1].split("```")[0]
+        elif "```" in text:
+            text = text.split("```")[1].split("```")[0]
+        
+        return json.loads(text.strip())
+
+    def _generate_cached(self, prompt: str):
+        """
+        프롬프트 해시 기준 캐시를 거쳐 Gemini를 호출합니다.
+        
+        Returns:
+            (파싱된 응답 dict, 캐시 상태 'hit' | 'stale' | 'miss' | 'fallback')
+        """
+        key = prompt_cache_key(self.MODEL_NAME, prompt)
+        return self.result_cache.get_or_generate(key, lambda: self._generate(prompt))
+
+    def _fetch_gov_data(self, company_name: str, crno: str = '', bzno: str = '') -> dict:
+        """공공데이터 API로 기업 정보 조회 (법인등록번호 > 사업자등록번호 > 회사명)"""
+        if crno:
+            return self.corp_info_service.get_enhanced_company_info(company_name, crno=crno)
+        elif bzno:
+            return self.corp_info_service.get_enhanced_company_info(company_name, bzno=bzno)
+        return self.corp_info_service.get_enhanced_company_info(company_name)
+
+    def _run_stage(self, stage: str, on_stage, func, *args):
+        """
+        분석 단계를 실행하고 소요시간/결과를 기록합니다.
+
+        Returns:
+            (반환값 또는 None, 단계 리포트 {'status', 'elapsed_ms', 'error'?})
+        """
+        started = time.perf_counter()
+        try:
+            value = func(*args)
+            report = {'status': 'ok'}
+        except Exception as e:
+            value = None
+            report = {'status': 'error', 'error': str(e)}
+        report['elapsed_ms'] = int((time.perf_counter() - started) * 1000)
+        if on_stage:
+            on_stage(stage, report)
+        return value, report
+
+    def analyze(self, intake_data, on_stage=None):
         """
         Analyzes a company using Google Gemini with Search Grounding.
         Enhanced with DATA.go.kr 금융위원회 기업기본정보 API.
         STRICT MODE: Government Data > Search Results > User Input
+
+        공공데이터 조회와 웹사이트 스크래핑은 서로 독립적이므로 동시에 실행합니다.
+        각 단계의 결과는 result['stages']에 기록되며, on_stage(stage, report) 콜백으로도 전달됩니다.
         """
         company_name = intake_data.get('companyName', 'Unknown Company')
         url = intake_data.get('companyUrl', '')
@@ -120,23 +129,27 @@ class AIService:
         readiness = intake_data.get('readiness', '')
         
         # ==========================================
-        # STEP 0: 공공데이터 API로 기업 정보 조회 (최우선 데이터)
+        # STEP 0+1: 공공데이터 API 조회 / 웹사이트 스크래핑 (동시 실행)
         # ==========================================
-        gov_corp_data = None
         verified_employee_count = None
         verified_industry = None
         verified_established = None
         verified_is_listed = False
         verified_has_audit = False
         
-        try:
-            if crno:
-                gov_corp_data = self.corp_info_service.get_enhanced_company_info(company_name, crno=crno)
-            elif bzno:
-                gov_corp_data = self.corp_info_service.get_enhanced_company_info(company_name, bzno=bzno)
-            else:
-                gov_corp_data = self.corp_info_service.get_enhanced_company_info(company_name)
-            
+        stages = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gov_future = executor.submit(
+                self._run_stage, 'gov_data', on_stage, self._fetch_gov_data, company_name, crno, bzno
+            )
+            scrape_future = executor.submit(
+                self._run_stage, 'scrape', on_stage, self._scrape_iso_info, url, company_name
+            )
+            gov_corp_data, stages['gov_data'] = gov_future.result()
+            scrape_result, stages['scrape'] = scrape_future.result()
+        
+        if gov_corp_data is not None:
+            stages['gov_data']['found'] = bool(gov_corp_data.get('found'))
             if gov_corp_data.get('found'):
                 basic_info = gov_corp_data.get('basic_info', {})
                 risk_indicators = gov_corp_data.get('risk_indicators', {})
@@ -148,19 +161,19 @@ class AIService:
                 verified_is_listed = risk_indicators.get('is_listed', False)
                 verified_has_audit = risk_indicators.get('has_audit', False)
                 
-                print(f"✓ 공공데이터 API 조회 성공: {company_name}")
+                print(f"✓ 공공데이터 API 조회 성공: {company_name} ({stages['gov_data']['elapsed_ms']}ms)")
                 print(f"  - 직원수: {verified_employee_count}명")
                 print(f"  - 업종: {verified_industry}")
                 print(f"  - 설립일: {verified_established}")
             else:
                 print(f"✗ 공공데이터 API에서 '{company_name}' 기업정보를 찾지 못함")
-        except Exception as e:
-            print(f"✗ 공공데이터 API 오류: {e}")
+        else:
+            print(f"✗ 공공데이터 API 오류: {stages['gov_data'].get('error')}")
         
-        # ==========================================
-        # STEP 1: 웹사이트 스크래핑 (ISO 인증 정보 추출)
-        # ==========================================
-        scrape_result = self._scrape_iso_info(url, company_name)
+        if scrape_result is None:
+            scrape_result = {'site_content': '', 'iso_mentions': [], 'certification_page_found': False}
+        stages['scrape']['iso_mentions'] = len(scrape_result['iso_mentions'])
+        stages['scrape']['pages'] = scrape_result.get('pages_fetched', 0)
         site_content = scrape_result['site_content']
         iso_from_website = scrape_result['iso_mentions']
         
@@ -208,6 +221,9 @@ class AIService:
         if iso_from_website:
             website_iso_summary = f"""
             ★ 웹사이트에서 발견된 ISO 인증 관련 언급: {', '.join(iso_from_website)}
+            - 발견 페이지: {'; '.join(f"{m}: {', '.join(urls)}" for m, urls in scrape_result.get('iso_sources', {}).items())}
+            - 인증번호: {', '.join(scrape_result.get('certificate_numbers', [])) or '없음'}
+            - 유효기간 만료일: {', '.join(scrape_result.get('expiry_dates', [])) or '없음'}
             (이 정보는 참고용이며, Google 검색으로 추가 검증 필요)
             """
         
@@ -309,20 +325,15 @@ class AIService:
         # STEP 4: Gemini API 호출
         # ==========================================
         if self.model:
-            try:
-                response = self.model.generate_content(prompt)
-                text = response.text
-                
-                # JSON 추출
-                if "```json" in text:
-                    text = text.split("```json")[1].split("```")[0]
-                elif "```" in text:
-                    text = text.split("```")[1].split("```")[0]
-                
-                text = text.strip()
-                result = json.loads(text)
-                result['company_name'] = company_name
-                
+            if on_stage:
+                on_stage('llm', {'status': 'started'})
+            generated, stages['llm'] = self._run_stage('llm', on_stage, self._generate_cached, prompt)
+            
+            result = None
+            if generated is not None:
+                result, stages['llm']['cache'] = generated
+            
+            if result is not None:
                 # 회사명 추가
                 result['company_name'] = company_name
                 
@@ -359,44 +370,46 @@ class AIService:
                 if final_industry:
                     result['industry'] = final_industry
                 
+                result['stages'] = stages
                 return result
-            except Exception as e:
-                print(f"Gemini API Error: {e}")
-                import traceback
-                print(traceback.format_exc())
-                
-                # FAILOVER: 공공데이터만으로 부분 보고서 생성
-                if gov_corp_data and gov_corp_data.get('found'):
-                    info = gov_corp_data.get('basic_info', {})
-                    return {
-                        'company_name': company_name,
-                        'industry': final_industry or user_industry,
-                        'risk_score': 50,
-                        'risk_level': "분석 지연 (API Error)",
-                        'risk_factors': [
-                            f"공공데이터 확인: {info.get('established_date', 'N/A')} 설립",
-                            f"직원수: {info.get('employee_count', 'N/A')}명",
-                            f"업종: {info.get('main_business', 'N/A')}",
-                            "AI 분석 서비스 일시 장애"
-                        ],
-                        'recommended_standards': standards if standards else ["ISO 9001"],
-                        'summary': f"<p><strong>[시스템 안내]</strong> AI 분석 서비스가 일시적으로 지연되고 있습니다.</p><p><strong>금융위원회 공공데이터</strong>를 통해 확인된 정보: {company_name}은(는) {info.get('established_date', 'N/A')} 설립, {info.get('employee_count', 'N/A')}명 규모의 기업입니다. 주요 사업은 {info.get('main_business', 'N/A')}입니다.</p><p>잠시 후 다시 시도하시면 상세 분석 결과를 확인하실 수 있습니다.</p>",
-                        'evidence_links': ["https://www.data.go.kr"],
-                        'verified_data': True,
-                        'gov_data': info
-                    }
-                else:
-                    return {
-                        'company_name': company_name,
-                        'industry': user_industry,
-                        'risk_score': 0,
-                        'risk_level': "분석 실패",
-                        'risk_factors': ["AI 모델 응답 없음", "공공데이터 조회 실패"],
-                        'recommended_standards': [],
-                        'summary': f"<p>죄송합니다. 현재 분석 서비스를 이용할 수 없습니다.</p><p>오류: {str(e)}</p>",
-                        'evidence_links': [],
-                        'verified_data': False
-                    }
+            
+            error = stages['llm'].get('error', '')
+            print(f"Gemini API Error: {error}")
+            
+            # FAILOVER: 공공데이터만으로 부분 보고서 생성
+            if gov_corp_data and gov_corp_data.get('found'):
+                info = gov_corp_data.get('basic_info', {})
+                return {
+                    'company_name': company_name,
+                    'industry': final_industry or user_industry,
+                    'risk_score': 50,
+                    'risk_level': "분석 지연 (API Error)",
+                    'risk_factors': [
+                        f"공공데이터 확인: {info.get('established_date', 'N/A')} 설립",
+                        f"직원수: {info.get('employee_count', 'N/A')}명",
+                        f"업종: {info.get('main_business', 'N/A')}",
+                        "AI 분석 서비스 일시 장애"
+                    ],
+                    'recommended_standards': standards if standards else ["ISO 9001"],
+                    'summary': f"<p><strong>[시스템 안내]</strong> AI 분석 서비스가 일시적으로 지연되고 있습니다.</p><p><strong>금융위원회 공공데이터</strong>를 통해 확인된 정보: {company_name}은(는) {info.get('established_date', 'N/A')} 설립, {info.get('employee_count', 'N/A')}명 규모의 기업입니다. 주요 사업은 {info.get('main_business', 'N/A')}입니다.</p><p>잠시 후 다시 시도하시면 상세 분석 결과를 확인하실 수 있습니다.</p>",
+                    'evidence_links': ["https://www.data.go.kr"],
+                    'verified_data': True,
+                    'gov_data': info,
+                    'stages': stages
+                }
+            else:
+                return {
+                    'company_name': company_name,
+                    'industry': user_industry,
+                    'risk_score': 0,
+                    'risk_level': "분석 실패",
+                    'risk_factors': ["AI 모델 응답 없음", "공공데이터 조회 실패"],
+                    'recommended_standards': [],
+                    'summary': f"<p>죄송합니다. 현재 분석 서비스를 이용할 수 없습니다.</p><p>오류: {error}</p>",
+                    'evidence_links': [],
+                    'verified_data': False,
+                    'stages': stages
+                }
         else:
             return {
                 'company_name': company_name,
@@ -407,5 +420,6 @@ class AIService:
                 'recommended_standards': [],
                 'summary': "<p>Google AI API Key가 설정되지 않았습니다.</p>",
                 'evidence_links': [],
-                'verified_data': False
+                'verified_data': False,
+                'stages': stages
             }
@@ -0,0 +1,363 @@
+"""
+분석 작업 큐 / 워커 풀
+
+POST /api/analyze 가 저장한 AnalysisJob(status='processing')을 DB 기반 큐로 사용합니다.
+워커 스레드가 작업을 원자적으로 선점(claim)하여 AIService.analyze를 실행하고,
+상태 조회(GET /api/analyze/<job_id>)는 DB를 읽기만 합니다.
+
+상태 흐름: processing(대기) -> analyzing(워커 실행 중) -> completed / failed
+
+같은 기업 + 같은 입력값의 요청이 짧은 시간 안에 다시 들어오면 새 분석을 돌리지 않고
+기존(leader) 작업에 follower로 연결하여 결과를 공유합니다 (single-flight).
+"""
+
+import sys
+import os
+import json
+import hashlib
+import threading
+import traceback
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from models import db, AnalysisJob
+from .corp_info_service import normalize_corp_name
+
+# 분석 결과에 영향을 주는 입력 필드 (targetDate, budget 등은 분석에 쓰이지 않음)
+DEDUP_FIELDS = ('industry', 'employees', 'certStatus', 'readiness')
+
+
+def analysis_dedup_key(intake_data: dict) -> str:
+    """
+    기업 식별값(법인등록번호 > 사업자등록번호 > 정규화된 회사명 + URL)과
+    분석 입력값으로 중복 요청 판별 키를 만듭니다.
+    """
+    crno = (intake_data.get('crno') or '').replace('-', '').strip()
+    bzno = (intake_data.get('bzno') or '').replace('-', '').strip()
+    if crno:
+        identity = f"crno:{crno}"
+    elif bzno:
+        identity = f"bzno:{bzno}"
+    else:
+        url = (intake_data.get('companyUrl') or '').strip().lower()
+        for prefix in ('https://', 'http://', 'www.'):
+            if url.startswith(prefix):
+                url = url[len(prefix):]
+        identity = f"name:{normalize_corp_name(intake_data.get('companyName'))}|url:{url.rstrip('/')}"
+
+    params = {field: str(intake_data.get(field) or '').strip() for field in DEDUP_FIELDS}
+    params['standards'] = sorted(intake_data.get('standards') or [])
+    payload = json.dumps([identity, params], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class AnalysisQueue:
+    """DB(AnalysisJob 테이블) 기반 분석 작업 큐와 워커 스레드 풀"""
+
+    def __init__(self, app, handler, workers: int = 4, poll_interval: float = 2.0,
+                 job_timeout: float = 300.0, max_attempts: int = 2, coalesce_window: float = 60.0,
+                 on_complete=None):
+        """
+        Args:
+            app: Flask 앱 (워커 스레드에서 app_context 생성용)
+            handler: handler(intake_data, on_stage) -> result(dict) 분석 함수
+                     on_stage(stage, report)로 단계 진행 상황을 알리면 작업의 progress에 기록됩니다.
+            workers: 워커 스레드 수 (0이면 비활성화, 조회 요청에서 인라인 실행)
+            poll_interval: 새 작업 알림이 없을 때 DB를 다시 확인하는 주기(초)
+            job_timeout: 'analyzing' 상태로 이 시간(초)을 넘긴 작업은 워커가 죽은 것으로 보고 재선점
+            max_attempts: 작업당 최대 실행 횟수
+            coalesce_window: 같은 요청이 이 시간(초) 안에 다시 들어오면 기존 작업 결과를 공유 (0이면 비활성화)
+            on_complete: on_complete(job) - 작업 완료 직후(commit 전) 호출되는 후처리 (예: 매칭 결과 저장)
+        """
+        self.app = app
+        self.handler = handler
+        self.workers = max(int(workers), 0)
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.max_attempts = max_attempts
+        self.coalesce_window = coalesce_window
+        self.on_complete = on_complete
+
+        self._threads = []
+        self._submit_lock = threading.Lock()
+        self._progress_lock = threading.Lock()
+        self._progress_cond = threading.Condition()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def start(self):
+        """워커 스레드 시작 (여러 번 호출해도 한 번만 시작)"""
+        with self._lock:
+            if self._threads or not self.enabled:
+                return
+            self._stop.clear()
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker_loop, name=f"analysis-worker-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+            print(f"[Queue] 분석 워커 {self.workers}개 시작")
+
+    def stop(self, timeout: float = 5.0):
+        """워커 스레드 종료 (테스트/종료 시)"""
+        self._stop.set()
+        self._wakeup.set()
+        with self._lock:
+            for t in self._threads:
+                t.join(timeout)
+            self._threads = []
+
+    def notify(self):
+        """새 작업이 등록되었음을 워커에 알림"""
+        self._wakeup.set()
+
+    def submit(self, job):
+        """
+        새 작업을 큐에 등록합니다.
+        진행 중이거나 최근 완료된 동일 요청(leader)이 있으면 follower로 연결하여 중복 실행을 막습니다.
+
+        Args:
+            job: 저장 전 AnalysisJob (intake_data 설정됨)
+
+        Returns:
+            저장된 job
+        """
+        job.dedup_key = analysis_dedup_key(job.get_intake_data())
+
+        with self._submit_lock:
+            leader = self._find_leader(job.dedup_key) if self.coalesce_window > 0 else None
+            if leader is not None:
+                job.leader_id = leader.id
+                if leader.status == 'completed':
+                    job.result = leader.result
+                    job.matches = leader.matches
+                    job.status = 'completed'
+                    job.finished_at = datetime.utcnow()
+                print(f"[Queue] 중복 분석 요청 병합: {job.id} -> {leader.id}")
+            db.session.add(job)
+            db.session.commit()
+
+        if job.leader_id is None:
+            self.notify()
+        return job
+
+    def resolve(self, job):
+        """
+        follower 작업이면 leader의 진행 상태/결과를 반영합니다.
+        (leader 완료 직후 등록된 follower처럼 완료 전파를 놓친 경우를 위한 조회 시점 보정)
+        """
+        if job.leader_id is None or job.status in ('completed', 'failed'):
+            return job
+        leader = AnalysisJob.query.get(job.leader_id)
+        if leader is None:
+            job.leader_id = None
+            job.status = 'processing'
+            db.session.commit()
+            self.notify()
+        elif leader.status in ('completed', 'failed'):
+            self._copy_outcome(leader, job)
+            db.session.commit()
+        return job
+
+    def run_now(self, job_id: str) -> bool:
+        """
+        작업을 현재 스레드에서 즉시 실행 (워커 비활성화 환경, 예: Vercel 서버리스)
+
+        Returns:
+            이 호출에서 작업을 선점하여 실행했으면 True
+        """
+        if not self._claim(job_id):
+            return False
+        self._execute(job_id)
+        return True
+
+    def run_detached(self, job_id: str):
+        """워커가 없는 환경에서 작업을 별도 스레드로 실행 (SSE 스트림이 진행 상황을 내보내는 동안)"""
+        def run():
+            with self.app.app_context():
+                self.run_now(job_id)
+
+        threading.Thread(target=run, name=f"analysis-inline-{job_id[:8]}", daemon=True).start()
+
+    def snapshot(self, job_id: str):
+        """
+        작업의 현재 상태 (새 app context / 세션으로 조회하므로 스트리밍 루프에서 반복 호출 가능)
+
+        Returns:
+            {'status', 'progress', 'result', 'error', 'leader_id'} 또는 None
+            (leader_id: 다른 작업의 실행 결과를 공유하는 작업이면 그 작업 ID - 직접 실행할 때는 이 작업을 선점)
+        """
+        with self.app.app_context():
+            job = AnalysisJob.query.get(job_id)
+            if job is None:
+                return None
+            self.resolve(job)
+            progress_job = job
+            if job.leader_id and job.status not in ('completed', 'failed'):
+                progress_job = AnalysisJob.query.get(job.leader_id) or job
+            return {
+                'status': job.status,
+                'progress': progress_job.get_progress(),
+                'result': job.get_result(),
+                'error': job.error,
+                'leader_id': job.leader_id
+            }
+
+    def wait_for_update(self, timeout: float):
+        """이 프로세스에서 진행 상황이 기록되거나 timeout이 지날 때까지 대기"""
+        with self._progress_cond:
+            self._progress_cond.wait(timeout)
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _worker_loop(self):
+        while not self._stop.is_set():
+            processed = False
+            try:
+                with self.app.app_context():
+                    job_id = self._claim_next()
+                    if job_id:
+                        self._execute(job_id)
+                        processed = True
+            except Exception as e:
+                print(f"[Queue] 워커 오류: {e}")
+                print(traceback.format_exc())
+
+            if processed:
+                continue
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _find_leader(self, dedup_key: str):
+        """같은 키의 진행 중 작업 또는 coalesce_window 내에 완료된 작업"""
+        since = datetime.utcnow() - timedelta(seconds=self.coalesce_window)
+        return AnalysisJob.query.filter(
+            AnalysisJob.dedup_key == dedup_key,
+            AnalysisJob.leader_id.is_(None),
+            AnalysisJob.status.in_(('processing', 'analyzing')) |
+            ((AnalysisJob.status == 'completed') & (AnalysisJob.finished_at >= since))
+        ).order_by(AnalysisJob.created_at.desc()).first()
+
+    def _claimable(self, now):
+        cutoff = now - timedelta(seconds=self.job_timeout)
+        return AnalysisJob.leader_id.is_(None) & (
+            (AnalysisJob.status == 'processing') |
+            ((AnalysisJob.status == 'analyzing') & (AnalysisJob.started_at < cutoff))
+        )
+
+    def _claim_next(self):
+        """대기 중인 가장 오래된 작업(또는 타임아웃된 작업)을 선점"""
+        candidates = AnalysisJob.query.with_entities(AnalysisJob.id).filter(
+            self._claimable(datetime.utcnow())
+        ).order_by(AnalysisJob.created_at).limit(5).all()
+        db.session.rollback()
+
+        for (job_id,) in candidates:
+            if self._claim(job_id):
+                return job_id
+        return None
+
+    def _claim(self, job_id: str) -> bool:
+        """
+        조건부 UPDATE로 작업을 원자적으로 선점합니다.
+        여러 워커/프로세스가 같은 작업을 동시에 가져가지 않도록 영향받은 행 수로 판정합니다.
+        """
+        now = datetime.utcnow()
+        updated = AnalysisJob.query.filter(AnalysisJob.id == job_id, self._claimable(now)).update({
+            AnalysisJob.status: 'analyzing',
+            AnalysisJob.started_at: now,
+            AnalysisJob.attempts: db.func.coalesce(AnalysisJob.attempts, 0) + 1
+        }, synchronize_session=False)
+        db.session.commit()
+        return updated == 1
+
+    def _execute(self, job_id: str):
+        job = AnalysisJob.query.get(job_id)
+        if job is None:
+            return
+
+        if (job.attempts or 0) > self.max_attempts:
+            self._finish(job, error='최대 재시도 횟수 초과')
+            return
+
+        intake_data = job.get_intake_data()
+        # 긴 분석 동안 DB 트랜잭션/커넥션을 잡고 있지 않도록 먼저 종료
+        db.session.commit()
+        self._record_stage(job_id, 'started', {'status': 'ok'})
+
+        def on_stage(stage, report):
+            self._record_stage(job_id, stage, report)
+
+        try:
+            result = self.handler(intake_data, on_stage)
+        except Exception as e:
+            print(f"[Queue] 분석 실패 ({job_id}): {e}")
+            print(traceback.format_exc())
+            self._finish(job, error=str(e))
+            return
+
+        self._finish(job, result=result)
+
+    def _finish(self, job, result=None, error=None):
+        if error is not None:
+            job.status = 'failed'
+            job.error = error
+        else:
+            job.set_result(result)
+            job.status = 'completed'
+        job.finished_at = datetime.utcnow()
+
+        if job.status == 'completed' and self.on_complete is not None:
+            try:
+                self.on_complete(job)
+            except Exception as e:
+                # 후처리 실패로 분석 결과를 잃지 않도록 로그만 남김
+                print(f"[Queue] 완료 후처리 실패 ({job.id}): {e}")
+
+        # 대기 중인 follower 작업에 결과 전파
+        followers = AnalysisJob.query.filter(
+            AnalysisJob.leader_id == job.id,
+            AnalysisJob.status.in_(('processing', 'analyzing'))
+        ).all()
+        for follower in followers:
+            self._copy_outcome(job, follower)
+        db.session.commit()
+        self._notify_progress()
+
+    def _record_stage(self, job_id: str, stage: str, report: dict):
+        """
+        단계 이벤트를 작업의 progress에 추가합니다.
+        분석 단계는 다른 스레드(스크래핑/공공데이터 executor)에서 호출되므로 별도 app context를 사용합니다.
+        """
+        event = dict(report, stage=stage, at=datetime.utcnow().isoformat())
+        try:
+            with self._progress_lock, self.app.app_context():
+                job = AnalysisJob.query.get(job_id)
+                if job is not None:
+                    job.add_progress_event(event)
+                    db.session.commit()
+        except Exception as e:
+            print(f"[Queue] 진행 상황 기록 실패 ({job_id}): {e}")
+        self._notify_progress()
+
+    def _notify_progress(self):
+        with self._progress_cond:
+            self._progress_cond.notify_all()
+
+    @staticmethod
+    def _copy_outcome(leader, follower):
+        follower.status = leader.status
+        follower.result = leader.result
+        follower.matches = leader.matches
+        follower.error = leader.error
+        follower.finished_at = leader.finished_at or datetime.utcnow()
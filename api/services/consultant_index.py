@@ -0,0 +1,147 @@
+"""
+컨설턴트 매칭 레코드 (프로세스 메모리)
+
+매칭 요청마다 Consultant.query.all() + JSON 파싱을 반복하지 않도록
+컨설턴트별 매칭 속성을 한 번만 디코딩해 두고, 변경된 컨설턴트만 갱신합니다.
+(컬럼형 스냅샷 ConsultantMatrix가 이 레코드로 빌드됨)
+"""
+
+import sys
+import os
+import json
+import time
+import hashlib
+import threading
+from functools import lru_cache
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from models import static_match_score as static_score
+from . import regions
+from . import industry_taxonomy
+from . import iso_registry
+from .iso_registry import REGISTRY, normalize_all
+
+
+@lru_cache(maxsize=1)
+def lookup_fingerprint() -> str:
+    """
+    ISO 정규화 / 업종 분류 / 지역 표의 지문 (16자리 hex)
+
+    해석 결과를 저장해 두는 데이터(consultant_match_key 검색 키, 매칭 스냅샷)가 지금 코드의 표로 만들어졌는지
+    비교하는 데 씁니다. 표를 고친 배포 후에는 지문이 달라지므로 저장된 데이터를 다시 만듭니다.
+    """
+    tables = (iso_registry.STANDARDS, iso_registry.ALIASES, industry_taxonomy.NODES,
+              regions.NATIONWIDE_ALIASES, regions.PROVINCES, regions.ADJACENCY, regions.TIER_POINTS)
+    encoded = json.dumps(tables, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def _load_json(value, default):
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_tuple(value):
+    """JSON 값(dict 키 / list / 문자열)을 문자열 튜플로 변환"""
+    if isinstance(value, dict):
+        return tuple(value.keys())
+    if isinstance(value, (list, tuple)):
+        return tuple(v for v in value if isinstance(v, str))
+    if isinstance(value, str):
+        return (value,)
+    return ()
+
+
+class ConsultantRecord:
+    """매칭에 필요한 컨설턴트 속성 (JSON 디코딩 완료 상태)"""
+
+    __slots__ = ('id', 'name', 'avatar', 'specialty', 'experience', 'rating', 'reviews',
+                 'match_reason', 'verified', 'trust_score', 'iso', 'iso_mask', 'industries', 'industry_nodes',
+                 'specialty_nodes', 'project_types', 'regions', 'static_score')
+
+    def __init__(self, id, name=None, avatar=None, specialty=None, experience=None, rating=None,
+                 reviews=None, match_reason=None, verified=False, trust_score=None,
+                 iso=(), industries=(), project_types=(), regions=()):
+        self.id = id
+        self.name = name
+        self.avatar = avatar
+        self.specialty = specialty
+        self.experience = experience
+        self.rating = rating
+        self.reviews = reviews
+        self.match_reason = match_reason
+        self.verified = verified
+        self.trust_score = trust_score
+        # 정규화된 ISO 코드와 비트마스크 (iso_registry)
+        self.iso = normalize_all(iso)
+        self.iso_mask = REGISTRY.mask(self.iso)
+        self.industries = tuple(industries)
+        # 업종 경험 / 전문분야 -> 업종 분류 노드 (industry_taxonomy)
+        self.industry_nodes = industry_taxonomy.resolve_all(self.industries)
+        self.specialty_nodes = industry_taxonomy.resolve(specialty) if specialty else frozenset()
+        self.project_types = tuple(project_types)
+        self.regions = tuple(regions)
+        self.static_score = static_score(trust_score, verified, reviews, rating)
+
+    @classmethod
+    def from_model(cls, consultant):
+        return cls(
+            id=consultant.id,
+            name=consultant.name,
+            avatar=consultant.avatar,
+            specialty=consultant.specialty,
+            experience=consultant.experience,
+            rating=consultant.rating,
+            reviews=consultant.reviews,
+            match_reason=consultant.match_reason,
+            verified=consultant.verified,
+            trust_score=consultant.trust_score,
+            iso=_as_tuple(_load_json(consultant.iso_experience, {})),
+            industries=_as_tuple(_load_json(consultant.industry_experience, [])),
+            project_types=_as_tuple(_load_json(consultant.project_types, [])),
+            regions=regions.split_regions(consultant.regions)
+        )
+
+
+class ConsultantIndex:
+    """id -> ConsultantRecord (빌드/변경마다 version 증가 - ConsultantMatrix 재빌드 판단용)"""
+
+    def __init__(self):
+        self.records = {}
+        self.built_at = None
+        # 빌드/변경마다 증가 - 파생 스냅샷(ConsultantMatrix)의 재빌드 여부 판단용
+        self.version = 0
+        self.lock = threading.RLock()
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def build(self, records):
+        with self.lock:
+            self.records = {record.id: record for record in records}
+            self.built_at = time.time()
+            self.version += 1
+
+    def upsert(self, record):
+        with self.lock:
+            self.records[record.id] = record
+            self.version += 1
+
+    def remove(self, consultant_id):
+        with self.lock:
+            self.records.pop(consultant_id, None)
+            self.version += 1
+
+    def sorted_records(self):
+        """id 오름차순 레코드 목록"""
+        with self.lock:
+            return [self.records[cid] for cid in sorted(self.records)]
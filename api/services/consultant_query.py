@@ -0,0 +1,195 @@
+"""
+컨설턴트 후보 SQL 조회 (consultant_match_key 검색 키 + consultant_score)
+
+프로세스 메모리에 전체 풀을 올리지 않고(서버리스 cold start 등) 점수를 받을 수 있는 후보만 DB에서 가져옵니다.
+- 저장 시: ISO 정규화 / 업종 분류 노드 / 활동 시·도(시/군/구) 해석 결과를 검색 키로 기록 (Consultant 모델 이벤트)
+- 후보: 대상의 ISO / 업종 / 프로젝트 유형 / 전문분야 / 인근 시·도 키를 key IN (...) 한 번으로 (ix_consultant_match_key_key)
+- 제외: 활동 지역이 모두 먼 컨설턴트 (먼 시·도 키 EXCEPT 허용 시·도 키)
+- 나머지: consultant_score 정적 점수 인덱스 순서로 상위 k명만 (Fallback은 신뢰도 인덱스)
+
+해석은 저장할 때 한 번만 하므로 조회 시에는 용어 목록을 읽거나 파이썬으로 해석하지 않습니다.
+ISO / 업종 / 지역 표가 바뀌면(lookup_fingerprint) ensure_match_keys()가 키를 다시 만듭니다.
+SQLite / PostgreSQL 모두에서 같은 SQL이 동작하도록 SQLAlchemy 표현식만 사용합니다.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from sqlalchemy import select, event, inspect as sa_inspect
+from models import (db, Consultant, ConsultantMatchKey, ConsultantScore, MatchingSnapshot, CAPABILITY_FIELDS)
+from .consultant_index import ConsultantRecord, lookup_fingerprint
+from . import regions
+from . import industry_taxonomy
+
+KEY_LENGTH = ConsultantMatchKey.__table__.c.key.type.length
+KEY_FIELDS = CAPABILITY_FIELDS + ('specialty',)
+
+
+def _key(kind, value) -> str:
+    return f"{kind}:{value}"[:KEY_LENGTH]
+
+
+def _node_key(kind, node) -> str:
+    """업종 분류 노드는 코드로, 분류에 없는 업종 문자열은 '='를 붙여 그대로"""
+    if industry_taxonomy.TAXONOMY.is_node(node):
+        return _key(kind, industry_taxonomy.TAXONOMY.codes[node])
+    return _key(kind, '=' + node)
+
+
+def _region_key(province, district=None) -> str:
+    return _key('region', f"{province}/{district}" if district else province)
+
+
+def match_keys(record) -> list:
+    """ConsultantRecord -> 검색 키 목록 (중복 없음)"""
+    keys = [_key('iso', code) for code in record.iso]
+    keys += [_node_key('industry', node) for node in record.industry_nodes]
+    keys += [_node_key('specialty', node) for node in record.specialty_nodes]
+    keys += [_key('project_type', t) for t in record.project_types]
+    for province, district in regions.resolve_all(record.regions):
+        keys.append(_region_key(province))
+        if district:
+            keys.append(_region_key(province, district))
+    return list(dict.fromkeys(keys))
+
+
+def target_keys(target) -> list:
+    """
+    점수를 받을 수 있는 컨설턴트의 검색 키 (대상 업종 노드는 이미 상위/하위 포함)
+
+    Args:
+        target: MatchingService._parse_criteria 결과
+    """
+    keys = [_key('iso', code) for code in target['iso']]
+    for node in target['industry_nodes']:
+        keys.append(_node_key('industry', node))
+        keys.append(_node_key('specialty', node))
+    if target['project_type']:
+        keys.append(_key('project_type', target['project_type']))
+    target_region = target.get('region')
+    if target_region is not None:
+        # 전국 활동은 TIER_ADJACENT, 같은 시/도는 시/군/구와 관계없이 가점 대상
+        keys.append(_region_key(regions.NATIONWIDE))
+        keys += [_region_key(p) for p, t in regions.TIERS[target_region[0]].items() if t in regions.TIER_POINTS]
+    return list(dict.fromkeys(keys))
+
+
+def excluded_query(target_region, max_tier):
+    """해석 가능한 활동 지역이 있지만 모두 max_tier보다 먼 컨설턴트 id 쿼리 (없으면 None)"""
+    if target_region is None:
+        return None
+    province, district = target_region
+    allowed, far = [], []
+    for other, other_tier in regions.TIERS[province].items():
+        (allowed if other_tier <= max_tier else far).append(_region_key(other))
+    (allowed if regions.TIER_ADJACENT <= max_tier else far).append(_region_key(regions.NATIONWIDE))
+    if district and regions.TIER_DISTRICT <= max_tier < regions.TIER_PROVINCE:
+        # 같은 시/도 중 같은 시/군/구만 허용 (시/도 키는 먼 쪽에 남음)
+        allowed.append(_region_key(province, district))
+    if not far:
+        return None
+    query = select(ConsultantMatchKey.consultant_id).where(ConsultantMatchKey.key.in_(far))
+    if allowed:
+        query = query.except_(select(ConsultantMatchKey.consultant_id).where(ConsultantMatchKey.key.in_(allowed)))
+    return query
+
+
+def by_static_score(query):
+    """정적 점수 내림차순(동점은 id 순) 정렬 - ix_consultant_score_static 사용"""
+    return (query.join(ConsultantScore, ConsultantScore.consultant_id == Consultant.id)
+            .order_by(ConsultantScore.static_score.desc(), Consultant.id))
+
+
+def load_candidates(target, limit, region_max_tier=regions.TIER_FAR):
+    """
+    Returns:
+        (후보 Consultant 목록, 후보가 아닌 컨설턴트 중 정적 점수 상위 limit명) - 지역 조건으로 제외된 컨설턴트는 빠짐
+    """
+    keys = target_keys(target)
+    excluded = excluded_query(target.get('region'), region_max_tier)
+
+    eligible = Consultant.query
+    if excluded is not None:
+        eligible = eligible.filter(Consultant.id.notin_(excluded))
+    if not keys:
+        return [], by_static_score(eligible).limit(limit).all()
+    query = select(ConsultantMatchKey.consultant_id).where(ConsultantMatchKey.key.in_(keys))
+    candidates = eligible.filter(Consultant.id.in_(query)).all()
+    top_static = by_static_score(eligible.filter(Consultant.id.notin_(query))).limit(limit).all()
+    return candidates, top_static
+
+
+def top_trusted(limit=3):
+    """신뢰도 상위 컨설턴트 (동점은 id 순) - ix_consultant_score_trust 사용"""
+    return (Consultant.query.join(ConsultantScore, ConsultantScore.consultant_id == Consultant.id)
+            .order_by(ConsultantScore.trust_score.desc(), Consultant.id).limit(limit).all())
+
+
+# ----------------------------------------------------------------------
+# 검색 키 기록 (models의 join table 이벤트와 같은 트랜잭션)
+# ----------------------------------------------------------------------
+
+def _write_keys(connection, consultant):
+    table = ConsultantMatchKey.__table__
+    connection.execute(table.delete().where(table.c.consultant_id == consultant.id))
+    rows = [{'consultant_id': consultant.id, 'key': key} for key in match_keys(ConsultantRecord.from_model(consultant))]
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+@event.listens_for(Consultant, 'after_insert')
+def _consultant_inserted(mapper, connection, target):
+    _write_keys(connection, target)
+
+
+@event.listens_for(Consultant, 'after_update')
+def _consultant_updated(mapper, connection, target):
+    state = sa_inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in KEY_FIELDS):
+        _write_keys(connection, target)
+
+
+@event.listens_for(Consultant, 'after_delete')
+def _consultant_deleted(mapper, connection, target):
+    # SQLite는 기본적으로 FK CASCADE가 꺼져 있으므로 직접 삭제
+    table = ConsultantMatchKey.__table__
+    connection.execute(table.delete().where(table.c.consultant_id == target.id))
+
+
+def rebuild_match_keys():
+    """consultant_match_key 전체 재생성 (기존 DB 업그레이드 / 표 변경 / bulk 변경 후)"""
+    connection = db.session.connection()
+    table = ConsultantMatchKey.__table__
+    connection.execute(table.delete())
+    for consultant in Consultant.query.all():
+        rows = [{'consultant_id': consultant.id, 'key': key}
+                for key in match_keys(ConsultantRecord.from_model(consultant))]
+        if rows:
+            connection.execute(table.insert(), rows)
+    fingerprint = lookup_fingerprint()
+    if MatchingSnapshot.query.filter(MatchingSnapshot.id == 1).update(
+            {MatchingSnapshot.keys_fingerprint: fingerprint}, synchronize_session=False) == 0:
+        db.session.add(MatchingSnapshot(id=1, data_version=0, keys_fingerprint=fingerprint))
+    db.session.commit()
+
+
+def ensure_match_keys() -> bool:
+    """
+    검색 키가 비어 있거나 다른 표(지문)로 만들어졌으면 다시 만듦
+
+    Returns:
+        다시 만들었으면 True
+    """
+    if not Consultant.query.first():
+        return False
+    stored = db.session.query(MatchingSnapshot.keys_fingerprint).filter(MatchingSnapshot.id == 1).scalar()
+    if stored == lookup_fingerprint() and ConsultantMatchKey.query.first():
+        return False
+    print(f"[DB] consultant_match_key 재생성 (지문 {stored} -> {lookup_fingerprint()})")
+    rebuild_match_keys()
+    return True
@@ -0,0 +1,150 @@
+"""
+공공데이터(data.go.kr) 기업정보 조회 캐시
+
+금융위원회 기업기본정보 API는 느리고 일일 호출 한도가 있으므로,
+조회 결과를 로컬 SQLite 파일에 TTL과 함께 저장합니다.
+
+- 엔드포인트별 TTL (기업개요 / 계열회사 / 종속기업)
+- "결과 없음" 응답은 짧은 TTL로 네거티브 캐싱
+- 프로세스 메모리 캐시를 앞단에 두어 반복 조회는 SQLite도 거치지 않음
+- 엔드포인트별 hit / miss 카운터
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+
+def _default_cache_path():
+    # Vercel 서버리스는 /tmp만 쓰기 가능
+    if os.environ.get('VERCEL'):
+        return '/tmp/corp_cache.db'
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'corp_cache.db')
+
+
+class CorpInfoCache:
+    """data.go.kr 조회 결과 TTL 캐시 (SQLite + 메모리)"""
+
+    # 엔드포인트별 기본 TTL (초)
+    DEFAULT_TTLS = {
+        'outline': 7 * 24 * 3600,     # getCorpOutline_V2
+        'affiliate': 7 * 24 * 3600,   # getAffiliate_V2
+        'subsidiary': 7 * 24 * 3600,  # getConsSubsComp_V2
+    }
+    DEFAULT_NEGATIVE_TTL = 6 * 3600
+    MEMORY_MAX_ENTRIES = 10000
+
+    def __init__(self, path: str = None, ttls: dict = None, negative_ttl: float = None, clock=time.time):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:' 가능). 첫 사용 시점에 연결합니다.
+            ttls: 엔드포인트별 TTL 덮어쓰기 {'outline': 초, ...}
+            negative_ttl: "결과 없음" 응답 TTL (초)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.path = path or _default_cache_path()
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.negative_ttl = self.DEFAULT_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self.clock = clock
+
+        self._conn = None
+        self._lock = threading.Lock()
+        self._memory = {}
+        self._stats = {}
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정으로 캐시 생성 (CORP_CACHE_PATH, CORP_CACHE_TTL_<ENDPOINT>, CORP_CACHE_NEGATIVE_TTL)"""
+        ttls = {}
+        for endpoint in cls.DEFAULT_TTLS:
+            value = os.environ.get(f'CORP_CACHE_TTL_{endpoint.upper()}')
+            if value:
+                ttls[endpoint] = float(value)
+        negative_ttl = os.environ.get('CORP_CACHE_NEGATIVE_TTL')
+        return cls(
+            path=os.environ.get('CORP_CACHE_PATH'),
+            ttls=ttls,
+            negative_ttl=float(negative_ttl) if negative_ttl else None
+        )
+
+    def get(self, endpoint: str, key: str):
+        """
+        캐시 조회
+
+        Returns:
+            저장된 응답 딕셔너리의 얕은 복사본 또는 None (miss / 만료)
+        """
+        now = self.clock()
+        cache_key = (endpoint, key)
+
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                row = self._connection().execute(
+                    'SELECT value, expires_at FROM corp_cache WHERE endpoint = ? AND key = ?',
+                    (endpoint, key)
+                ).fetchone()
+                if row is not None:
+                    entry = (json.loads(row[0]), row[1])
+                    self._memory[cache_key] = entry
+
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    self._memory.pop(cache_key, None)
+                self._count(endpoint, 'misses')
+                return None
+
+            value = entry[0]
+            self._count(endpoint, 'negative_hits' if value.get('not_found') else 'hits')
+            return dict(value)
+
+    def set(self, endpoint: str, key: str, value: dict, negative: bool = False):
+        """응답 저장 (negative=True면 네거티브 TTL 적용)"""
+        ttl = self.negative_ttl if negative else self.ttls.get(endpoint, self.DEFAULT_NEGATIVE_TTL)
+        expires_at = self.clock() + ttl
+
+        with self._lock:
+            if len(self._memory) >= self.MEMORY_MAX_ENTRIES:
+                self._memory.clear()
+            self._memory[(endpoint, key)] = (value, expires_at)
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO corp_cache (endpoint, key, value, expires_at) VALUES (?, ?, ?, ?)',
+                (endpoint, key, json.dumps(value, ensure_ascii=False), expires_at)
+            )
+            conn.commit()
+            self._count(endpoint, 'stores')
+
+    def purge_expired(self) -> int:
+        """만료된 항목 삭제, 삭제된 행 수 반환"""
+        now = self.clock()
+        with self._lock:
+            self._memory = {k: v for k, v in self._memory.items() if v[1] > now}
+            conn = self._connection()
+            deleted = conn.execute('DELETE FROM corp_cache WHERE expires_at <= ?', (now,)).rowcount
+            conn.commit()
+        return deleted
+
+    def stats(self) -> dict:
+        """엔드포인트별 hits / negative_hits / misses / stores 카운터"""
+        with self._lock:
+            return {endpoint: dict(counters) for endpoint, counters in self._stats.items()}
+
+    def _count(self, endpoint: str, name: str):
+        counters = self._stats.setdefault(endpoint, {'hits': 0, 'negative_hits': 0, 'misses': 0, 'stores': 0})
+        counters[name] += 1
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS corp_cache ('
+                'endpoint TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL, '
+                'PRIMARY KEY (endpoint, key))'
+            )
+            self._conn.commit()
+        return self._conn
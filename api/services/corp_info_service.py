@@ -11,7 +11,27 @@ API 명세:
 import os
 import requests
 from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, wait
 import json
+import re
+
+try:
+    from .corp_cache import CorpInfoCache
+    from .http_client import HttpClient
+except ImportError:
+    # api/services를 sys.path에 넣고 단독으로 import하는 루트 스크립트 (test_corp_api.py, test_samsung_simple.py)
+    from corp_cache import CorpInfoCache
+    from http_client import HttpClient
+
+
+def normalize_corp_name(name: str) -> str:
+    """회사명 정규화 (공백, 괄호 제거 후 소문자) - 매칭 및 캐시 키에 사용"""
+    if not name:
+        return ""
+    name = name.replace(" ", "").replace("　", "")
+    # (주), (유), (합) 등 제거
+    name = re.sub(r'\([^)]*\)', '', name)
+    return name.lower()
 
 
 class CorpInfoService:
@@ -19,12 +39,43 @@ class CorpInfoService:
     
     BASE_URL = "http://apis.data.go.kr/1160100/service/GetCorpBasicInfoService_V2"
     
-    def __init__(self):
+    # 계열회사/종속기업 동시 조회 전체 제한시간 (초)
+    RELATED_TIMEOUT = 10
+    
+    def __init__(self, cache: CorpInfoCache = None, http: HttpClient = None):
         # API 키는 환경변수에서 가져오기 (기본값은 제공된 인증키)
         self.api_key = os.environ.get(
             'DATA_GO_KR_API_KEY', 
             '3d5ffc75a14cccb5038feb87bbf1b03f36591801bd4469fbfaf1d39f90a62ff8'
         )
+        # 조회 결과 캐시 (법인등록번호 / 정규화된 회사명 기준)
+        self.cache = cache if cache is not None else CorpInfoCache.from_env()
+        # apis.data.go.kr keep-alive 연결 재사용 (프로세스 공용, 호스트 빈 자리는 응답 제한시간까지 대기 - queue_timeout)
+        self.http = http if http is not None else HttpClient.shared()
+    
+    @staticmethod
+    def _cache_key(crno: str = None, corp_name: str = None, **extra) -> str:
+        """조회 캐시 키 - 법인등록번호가 있으면 번호만, 없으면 API에 보내는 법인명 그대로"""
+        crno_clean = (crno or '').replace('-', '').replace(' ', '')
+        parts = [f"crno={crno_clean}"] if crno_clean else [f"name={corp_name or ''}"]
+        parts.extend(f"{k}={v}" for k, v in sorted(extra.items()))
+        return '|'.join(parts)
+    
+    @staticmethod
+    def _is_empty_result(data: dict) -> bool:
+        """
+        정상 응답(resultCode 00)이지만 항목이 없는 경우 - 네거티브 캐싱 대상
+
+        header / resultCode가 없는 응답(오류 페이지, 형식이 다른 응답)은 결과 없음으로 보지 않음
+        """
+        response = data.get('response') if isinstance(data, dict) else None
+        if not isinstance(response, dict) or not isinstance(response.get('header'), dict):
+            return False
+        if response['header'].get('resultCode') != '00':
+            return False
+        body = response.get('body') if isinstance(response.get('body'), dict) else {}
+        items = body.get('items')
+        return not (isinstance(items, dict) and items.get('item'))
     
     def get_corp_outline(self, corp_name: str = None, crno: str = None, num_of_rows: int = 10, page_no: int = 1) -> dict:
         """
@@ -41,6 +92,11 @@ class CorpInfoService:
         """
         url = f"{self.BASE_URL}/getCorpOutline_V2"
         
+        cache_key = self._cache_key(crno, corp_name, rows=num_of_rows, page=page_no)
+        cached = self.cache.get('outline', cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'serviceKey': self.api_key,
             'resultType': 'json',
@@ -48,18 +104,18 @@ class CorpInfoService:
             'pageNo': page_no
         }
         
-        # 법인명 또는 법인등록번호로 검색
+        # 법인등록번호로 검색 (법인등록번호가 있으면 법인명은 보내지 않음 - 캐시 키와 같은 조건), 없으면 법인명으로 검색
         if crno:
             # 하이픈 제거 및 공백 제거
             crno_clean = crno.replace('-', '').replace(' ', '')
             params['crno'] = crno_clean
             print(f"[API] 법인등록번호로 조회: {crno_clean}")
-        if corp_name:
+        elif corp_name:
             params['corpNm'] = corp_name
             print(f"[API] 법인명으로 조회: {corp_name}")
             
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10, queue_timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -91,13 +147,23 @@ class CorpInfoService:
                         item_list = [item_list]
                     
                     print(f"[API] {len(item_list)}개 결과 발견")
-                    return {
+                    result = {
                         'success': True,
                         'total_count': total_count,
                         'items': item_list
                     }
-                elif total_count == 0:
+                    self.cache.set('outline', cache_key, result)
+                    return result
+                elif self._is_empty_result(data):
                     print(f"[API] 검색 결과 없음 (totalCount=0)")
+                    result = {
+                        'success': False,
+                        'message': 'No data found in response',
+                        'items': [],
+                        'not_found': True
+                    }
+                    self.cache.set('outline', cache_key, result, negative=True)
+                    return result
                 else:
                     print(f"[API] items 구조 이상: {items}")
             
@@ -122,7 +188,7 @@ class CorpInfoService:
                 'items': []
             }
     
-    def get_affiliate(self, crno: str, bas_dt: str = None, num_of_rows: int = 10, page_no: int = 1) -> dict:
+    def get_affiliate(self, crno: str, bas_dt: str = None, num_of_rows: int = 10, page_no: int = 1, timeout: float = 10) -> dict:
         """
         계열회사 조회
         
@@ -131,12 +197,18 @@ class CorpInfoService:
             bas_dt: 기준일자 (YYYYMMDD)
             num_of_rows: 한 페이지 결과 수
             page_no: 페이지 번호
+            timeout: 요청 제한시간 (초)
             
         Returns:
             계열회사 정보 딕셔너리
         """
         url = f"{self.BASE_URL}/getAffiliate_V2"
         
+        cache_key = self._cache_key(crno, bas_dt=bas_dt or '', rows=num_of_rows, page=page_no)
+        cached = self.cache.get('affiliate', cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'serviceKey': self.api_key,
             'resultType': 'json',
@@ -149,7 +221,7 @@ class CorpInfoService:
             params['basDt'] = bas_dt
             
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=timeout, queue_timeout=timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -163,11 +235,23 @@ class CorpInfoService:
                     if isinstance(item_list, dict):
                         item_list = [item_list]
                     
-                    return {
+                    result = {
                         'success': True,
                         'total_count': body.get('totalCount', 0),
                         'items': item_list
                     }
+                    self.cache.set('affiliate', cache_key, result)
+                    return result
+                
+                if self._is_empty_result(data):
+                    result = {
+                        'success': False,
+                        'message': 'No data found',
+                        'items': [],
+                        'not_found': True
+                    }
+                    self.cache.set('affiliate', cache_key, result, negative=True)
+                    return result
             
             return {
                 'success': False,
@@ -183,7 +267,7 @@ class CorpInfoService:
                 'items': []
             }
     
-    def get_subsidiary(self, crno: str, bas_dt: str = None, num_of_rows: int = 10, page_no: int = 1) -> dict:
+    def get_subsidiary(self, crno: str, bas_dt: str = None, num_of_rows: int = 10, page_no: int = 1, timeout: float = 10) -> dict:
         """
         연결대상종속기업 조회
         
@@ -192,12 +276,18 @@ class CorpInfoService:
             bas_dt: 기준일자 (YYYYMMDD)
             num_of_rows: 한 페이지 결과 수
             page_no: 페이지 번호
+            timeout: 요청 제한시간 (초)
             
         Returns:
             종속기업 정보 딕셔너리
         """
         url = f"{self.BASE_URL}/getConsSubsComp_V2"
         
+        cache_key = self._cache_key(crno, bas_dt=bas_dt or '', rows=num_of_rows, page=page_no)
+        cached = self.cache.get('subsidiary', cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'serviceKey': self.api_key,
             'resultType': 'json',
@@ -210,7 +300,7 @@ class CorpInfoService:
             params['basDt'] = bas_dt
             
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=timeout, queue_timeout=timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -224,11 +314,23 @@ class CorpInfoService:
                     if isinstance(item_list, dict):
                         item_list = [item_list]
                     
-                    return {
+                    result = {
                         'success': True,
                         'total_count': body.get('totalCount', 0),
                         'items': item_list
                     }
+                    self.cache.set('subsidiary', cache_key, result)
+                    return result
+                
+                if self._is_empty_result(data):
+                    result = {
+                        'success': False,
+                        'message': 'No data found',
+                        'items': [],
+                        'not_found': True
+                    }
+                    self.cache.set('subsidiary', cache_key, result, negative=True)
+                    return result
             
             return {
                 'success': False,
@@ -244,7 +346,8 @@ class CorpInfoService:
                 'items': []
             }
     
-    def get_enhanced_company_info(self, company_name: str = None, crno: str = None, bzno: str = None) -> dict:
+    def get_enhanced_company_info(self, company_name: str = None, crno: str = None, bzno: str = None,
+                                  include_related: bool = True, related_timeout: float = None) -> dict:
         """
         종합 기업 정보 조회 (AI 분석 보강용)
         법인등록번호 또는 사업자등록번호가 있으면 우선 사용하여 더 정확한 결과 제공
@@ -253,6 +356,8 @@ class CorpInfoService:
             company_name: 회사명 (옵션, crno/bzno가 없을 때 사용)
             crno: 법인등록번호 (13자리, 옵션)
             bzno: 사업자등록번호 (10자리, 옵션)
+            include_related: False면 계열회사/종속기업 조회를 생략 (basic_info만 필요할 때)
+            related_timeout: 계열회사/종속기업 동시 조회 전체 제한시간 (초, 기본 RELATED_TIMEOUT)
             
         Returns:
             종합 기업 정보 딕셔너리
@@ -325,19 +430,40 @@ class CorpInfoService:
             # 3. 법인등록번호가 있으면 계열회사/종속기업 조회
             # 파라미터로 받은 crno 우선, 없으면 API 결과에서 가져온 crno 사용
             final_crno = crno or item.get('crno')
-            if final_crno:
-                # 계열회사 조회
-                affiliate_data = self.get_affiliate(final_crno)
-                if affiliate_data['success']:
-                    result['affiliates'] = affiliate_data['items']
-                
-                # 종속기업 조회
-                subsidiary_data = self.get_subsidiary(final_crno)
-                if subsidiary_data['success']:
-                    result['subsidiaries'] = subsidiary_data['items']
+            if final_crno and include_related:
+                result.update(self._get_related_companies(final_crno, related_timeout or self.RELATED_TIMEOUT))
         
         return result
     
+    def _get_related_companies(self, crno: str, timeout: float) -> dict:
+        """
+        계열회사/종속기업을 동시에 조회합니다.
+        두 요청에 하나의 전체 제한시간을 적용하며, 시간 내에 끝나지 않은 쪽은 빈 목록으로 둡니다.
+        
+        Returns:
+            {'affiliates': [...], 'subsidiaries': [...]}
+        """
+        related = {'affiliates': [], 'subsidiaries': []}
+        
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = {
+            executor.submit(self.get_affiliate, crno, timeout=timeout): 'affiliates',
+            executor.submit(self.get_subsidiary, crno, timeout=timeout): 'subsidiaries',
+        }
+        done, not_done = wait(futures, timeout=timeout)
+        # 제한시간을 넘긴 요청은 기다리지 않음 (requests 자체 timeout으로 곧 종료됨)
+        executor.shutdown(wait=False)
+        
+        for future in done:
+            data = future.result()
+            if data['success']:
+                related[futures[future]] = data['items']
+        
+        if not_done:
+            print(f"[API] 관계사 조회 제한시간 초과 ({timeout}s): {', '.join(futures[f] for f in not_done)}")
+        
+        return related
+    
     def _select_best_match(self, items: list, company_name: str = None) -> dict:
         """
         여러 검색 결과 중에서 가장 정확한 항목을 선택합니다.
@@ -362,24 +488,14 @@ class CorpInfoService:
         if len(items) == 1:
             return items[0]
         
-        # 회사명 정규화 (공백, 괄호 제거)
-        def normalize_name(name):
-            if not name:
-                return ""
-            name = name.replace(" ", "").replace("　", "")
-            # (주), (유), (합) 등 제거
-            import re
-            name = re.sub(r'\([^)]*\)', '', name)
-            return name.lower()
-        
-        normalized_search = normalize_name(company_name) if company_name else ""
+        normalized_search = normalize_corp_name(company_name) if company_name else ""
         
         # 각 항목에 점수 부여
         scored_items = []
         for item in items:
             score = 0
             corp_name = item.get('corpNm', '')
-            normalized_corp = normalize_name(corp_name)
+            normalized_corp = normalize_corp_name(corp_name)
             
             # 1. 정확 일치 (가장 높은 점수) - 원본 이름 기준
             if company_name and corp_name:
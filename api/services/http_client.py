@@ -0,0 +1,239 @@
+"""
+외부 HTTP 호출 공용 클라이언트 (웹사이트 스크래핑 / data.go.kr 공공데이터 API)
+
+requests.get을 매번 호출하면 요청마다 DNS 조회, TCP/TLS 연결을 새로 맺습니다.
+호스트별 requests.Session을 재사용해 keep-alive 연결을 유지하고, 같은 호스트로 가는 동시 요청 수를 제한합니다.
+
+- 호스트(scheme://host:port)별 Session + 커넥션 풀 (최근 사용 호스트 HTTP_MAX_HOSTS개 유지)
+- 호스트별 동시 요청 수 제한 (HTTP_MAX_PER_HOST, 호스트별 예외는 HTTP_HOST_LIMITS - data.go.kr 기본 16)
+  빈 자리를 connect timeout 동안 기다리고 넘기면 HostBusy (queue_timeout으로 더 오래 기다릴 수 있음 - data.go.kr API 호출)
+- connect / read timeout 기본값 (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+- 호스트별 요청 수 / 에러 수 / 지연 시간 카운터 (stats())
+- stream(): 본문을 청크로 읽는 동안 호스트 자리를 잡고 있다가 with 블록이 끝나면 연결 반환
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HostBusy(requests.exceptions.ConnectTimeout):
+    """호스트별 동시 요청 수 제한으로 대기 시간(connect timeout 또는 queue_timeout) 안에 요청을 시작하지 못함"""
+
+
+class _Host:
+    __slots__ = ('session', 'slots', 'stats')
+
+    def __init__(self, max_per_host: int):
+        self.session = requests.Session()
+        # 동시 요청 수는 slots로 제한하므로 풀 크기를 같게 두면 연결이 버려지지 않음
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_per_host)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.slots = threading.BoundedSemaphore(max_per_host)
+        self.stats = {'requests': 0, 'errors': 0, 'http_errors': 0, 'busy': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+
+
+class HttpClient:
+    """호스트별 keep-alive 세션 풀"""
+
+    DEFAULT_MAX_PER_HOST = 4
+    DEFAULT_MAX_HOSTS = 64
+    DEFAULT_CONNECT_TIMEOUT = 3.05
+    DEFAULT_READ_TIMEOUT = 10.0
+    # 분석 하나가 기업개요 + 계열회사/종속기업을 동시에 조회하므로 공공데이터 API는 더 많이 허용
+    DEFAULT_HOST_LIMITS = {'apis.data.go.kr': 16}
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_per_host: int = None, max_hosts: int = None,
+                 connect_timeout: float = None, read_timeout: float = None, headers: dict = None,
+                 host_limits: dict = None):
+        """
+        Args:
+            max_per_host: 호스트별 최대 동시 요청 수 (= 커넥션 풀 크기)
+            max_hosts: 세션을 유지할 최대 호스트 수 (오래 사용하지 않은 호스트부터 정리)
+            connect_timeout: 연결 제한시간 (초, 호스트 빈 자리 대기 포함)
+            read_timeout: 응답 읽기 제한시간 (초)
+            headers: 모든 요청의 기본 헤더
+            host_limits: 호스트 이름(host 또는 host:port)별 최대 동시 요청 수 (DEFAULT_HOST_LIMITS에 덮어씀)
+        """
+        self.max_per_host = max_per_host or self.DEFAULT_MAX_PER_HOST
+        self.max_hosts = max_hosts or self.DEFAULT_MAX_HOSTS
+        self.connect_timeout = connect_timeout or self.DEFAULT_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout or self.DEFAULT_READ_TIMEOUT
+        self.headers = dict(headers or {})
+        self.host_limits = dict(self.DEFAULT_HOST_LIMITS, **(host_limits or {}))
+        self._hosts = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """
+        환경변수 설정으로 생성 (HTTP_MAX_PER_HOST, HTTP_MAX_HOSTS, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+        HTTP_HOST_LIMITS - "apis.data.go.kr=16,example.com=2")
+        """
+        def number(name, cast):
+            value = os.environ.get(name)
+            return cast(value) if value else None
+
+        host_limits = {}
+        for entry in os.environ.get('HTTP_HOST_LIMITS', '').split(','):
+            name, _, limit = entry.partition('=')
+            if name.strip() and limit.strip():
+                host_limits[name.strip().lower()] = int(limit)
+
+        return cls(
+            max_per_host=number('HTTP_MAX_PER_HOST', int),
+            max_hosts=number('HTTP_MAX_HOSTS', int),
+            connect_timeout=number('HTTP_CONNECT_TIMEOUT', float),
+            read_timeout=number('HTTP_READ_TIMEOUT', float),
+            host_limits=host_limits
+        )
+
+    @classmethod
+    def shared(cls):
+        """프로세스 공용 클라이언트 (AIService / CorpInfoService 기본값)"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.from_env()
+            return cls._shared
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def _limit(self, key: str) -> int:
+        """호스트(scheme://host:port)의 최대 동시 요청 수"""
+        parts = urlsplit(key)
+        return self.host_limits.get(parts.netloc, self.host_limits.get(parts.hostname, self.max_per_host))
+
+    def _host(self, key: str) -> _Host:
+        with self._lock:
+            host = self._hosts.get(key)
+            if host is None:
+                host = self._hosts[key] = _Host(self._limit(key))
+                while len(self._hosts) > self.max_hosts:
+                    # 진행 중인 요청은 이미 가져간 연결로 끝나고, 풀만 정리됨
+                    _, evicted = self._hosts.popitem(last=False)
+                    evicted.session.close()
+            else:
+                self._hosts.move_to_end(key)
+            return host
+
+    def _timeout(self, timeout):
+        """None -> 기본 (connect, read), 숫자 -> read timeout (connect는 기본값과 작은 쪽), 튜플 -> 그대로"""
+        if timeout is None:
+            return (self.connect_timeout, self.read_timeout)
+        if isinstance(timeout, tuple):
+            return timeout
+        return (min(self.connect_timeout, timeout), timeout)
+
+    def get(self, url: str, params: dict = None, headers: dict = None, timeout=None, **kwargs) -> requests.Response:
+        return self.request('GET', url, params=params, headers=headers, timeout=timeout, **kwargs)
+
+    def _acquire(self, url: str, timeout, queue_timeout=None):
+        key = self.host_key(url)
+        host = self._host(key)
+        if not host.slots.acquire(timeout=timeout[0] if queue_timeout is None else queue_timeout):
+            self._record(host, busy=True)
+            raise HostBusy(f"Too many concurrent requests to {key}")
+        return host
+
+    def request(self, method: str, url: str, headers: dict = None, timeout=None, queue_timeout: float = None,
+                **kwargs) -> requests.Response:
+        """
+        요청 실행 (응답 본문까지 읽은 뒤 연결을 풀에 반환)
+
+        Args:
+            queue_timeout: 호스트 빈 자리 대기 시간 (초, 기본 connect timeout) - 응답을 기다려야 하는 API 호출은
+                           read timeout 정도로 주어 동시 요청이 몰려도 곧바로 실패하지 않게 함
+
+        Raises:
+            requests.exceptions.RequestException (HostBusy 포함)
+        """
+        timeout = self._timeout(timeout)
+        merged_headers = dict(self.headers, **(headers or {}))
+        host = self._acquire(url, timeout, queue_timeout)
+        started = time.perf_counter()
+        try:
+            response = host.session.request(method, url, headers=merged_headers, timeout=timeout, **kwargs)
+            # stream이 아니면 requests가 본문을 이미 읽었으므로 여기서 자리를 반환해도 됨
+            response.content
+        except requests.exceptions.RequestException:
+            self._record(host, elapsed=time.perf_counter() - started, error=True)
+            raise
+        finally:
+            host.slots.release()
+        self._record(host, elapsed=time.perf_counter() - started, http_error=response.status_code >= 400)
+        return response
+
+    @contextmanager
+    def stream(self, url: str, params: dict = None, headers: dict = None, timeout=None, **kwargs):
+        """
+        스트리밍 GET - 헤더만 받은 응답을 넘기고, 블록 안에서 iter_content()로 필요한 만큼만 읽음
+
+        블록이 끝나면 응답을 닫고 호스트 자리를 반환합니다. 본문을 끝까지 읽지 않았으면 연결은 재사용되지 않습니다.
+
+        Raises:
+            requests.exceptions.RequestException (HostBusy 포함)
+        """
+        timeout = self._timeout(timeout)
+        merged_headers = dict(self.headers, **(headers or {}))
+        host = self._acquire(url, timeout)
+        started = time.perf_counter()
+        response = None
+        error = False
+        try:
+            response = host.session.get(url, params=params, headers=merged_headers, timeout=timeout,
+                                        stream=True, **kwargs)
+            yield response
+        except requests.exceptions.RequestException:
+            error = True
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            host.slots.release()
+            self._record(host, elapsed=time.perf_counter() - started, error=error,
+                         http_error=not error and response is not None and response.status_code >= 400)
+
+    def _record(self, host: _Host, elapsed: float = 0.0, error: bool = False, http_error: bool = False,
+                busy: bool = False):
+        with self._lock:
+            stats = host.stats
+            if busy:
+                stats['busy'] += 1
+                return
+            elapsed_ms = elapsed * 1000
+            stats['requests'] += 1
+            stats['errors'] += int(error)
+            stats['http_errors'] += int(http_error)
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+    def stats(self) -> dict:
+        """호스트별 requests / errors / http_errors / busy / avg_ms / max_ms"""
+        with self._lock:
+            result = {}
+            for key, host in self._hosts.items():
+                stats = dict(host.stats)
+                total_ms = stats.pop('total_ms')
+                stats['avg_ms'] = round(total_ms / stats['requests'], 1) if stats['requests'] else 0.0
+                stats['max_ms'] = round(stats['max_ms'], 1)
+                result[key] = stats
+            return result
+
+    def close(self):
+        with self._lock:
+            for host in self._hosts.values():
+                host.session.close()
+            self._hosts.clear()
@@ -0,0 +1,178 @@
+"""
+업종 분류 체계 (KSIC 한국표준산업분류 대분류/중분류 기반)
+
+컨설턴트 업종 경험("Manufacturing", "제조", "IT/Software"), 분석 결과 업종, 공공데이터 업종
+(sicNm "전자부품, 컴퓨터, 영상, 음향 및 통신장비 제조업", enpMainBizNm "반도체 제조 및 판매")을
+모두 같은 분류 노드로 변환해 부분 문자열 비교 없이 노드 집합 교집합으로 업종 일치를 판단합니다.
+
+- 노드 id = NODES의 위치 (항목은 뒤에만 추가 - 저장된 매칭 조건과 호환)
+- 별칭은 한 번만 하나의 정규식(긴 별칭 우선)으로 컴파일, 영문 별칭은 단어 경계에서만 일치 ("IT" != "Unit")
+- 분류에 없는 업종 문자열은 정규화한 문자열 자체를 노드로 사용 (같은 표기끼리만 일치)
+- 상위/하위 업종도 일치로 봄: 제조업(C) 컨설턴트 <-> 반도체(C26) 기업
+"""
+
+import re
+from functools import lru_cache
+
+# (코드, 상위 코드, 한글명, 영문명, 별칭)
+NODES = (
+    ('SVC', None, '서비스업', 'Service', ('서비스', 'services')),
+    ('A', None, '농업, 임업 및 어업', 'Agriculture, forestry and fishing', ('농업', '임업', '어업', '수산', '축산', 'agriculture', 'fishery')),
+    ('B', None, '광업', 'Mining', ('mining',)),
+    ('C', None, '제조업', 'Manufacturing', ('제조', '생산', '공장', '부품', 'factory', 'parts', 'production')),
+    ('D', None, '전기, 가스, 증기 및 공기조절 공급업', 'Energy', ('에너지', '전력', '가스', 'electricity', 'utilities', 'power')),
+    ('E', None, '수도, 하수 및 폐기물 처리, 원료 재생업', 'Environment', ('환경', '폐기물', '재활용', '하수', 'waste', 'recycling', 'environmental')),
+    ('F', None, '건설업', 'Construction', ('건설', '건축', '토목', '시공', 'building', 'civil engineering')),
+    ('G', 'SVC', '도매 및 소매업', 'Wholesale and retail', ('도매', '소매', '유통', '무역', '상사', '전자상거래', 'retail', 'wholesale', 'distribution', 'trading', 'e-commerce', 'commerce')),
+    ('H', 'SVC', '운수 및 창고업', 'Transportation', ('운수', '운송', '택배', '해운', 'transport', 'transportation', 'shipping')),
+    ('I', 'SVC', '숙박 및 음식점업', 'Hospitality', ('숙박', '음식점', '호텔', '외식', '요식', 'hotel', 'restaurant', 'food service')),
+    ('J', 'SVC', '정보통신업', 'IT', ('정보통신', '정보기술', 'ict', 'it', 'information technology', 'internet', '인터넷', '플랫폼', 'platform')),
+    ('K', 'SVC', '금융 및 보험업', 'Finance', ('금융', '은행', '증권', '투자', '카드', 'financial', 'bank', 'banking', 'fintech', '핀테크')),
+    ('L', 'SVC', '부동산업', 'Real estate', ('부동산', 'real estate', 'property')),
+    ('M', 'SVC', '전문, 과학 및 기술 서비스업', 'Professional services', ('전문 서비스', '컨설팅', '법무', '회계', '광고', 'consulting', 'legal', 'accounting', 'advertising')),
+    ('N', 'SVC', '사업시설 관리, 사업 지원 및 임대 서비스업', 'Business support', ('사업시설 관리', '사업 지원', '시설관리', '인력공급', '임대', 'facility management', 'outsourcing', 'rental')),
+    ('O', None, '공공 행정, 국방 및 사회보장 행정', 'Public administration', ('공공', '행정', '국방', '공공기관', 'public', 'government', 'defense')),
+    ('P', 'SVC', '교육 서비스업', 'Education', ('교육', '학교', '학원', '대학', 'education', 'school', 'university', 'training')),
+    ('Q', 'SVC', '보건업 및 사회복지 서비스업', 'Health and social work', ('보건', 'health')),
+    ('R', 'SVC', '예술, 스포츠 및 여가관련 서비스업', 'Arts and recreation', ('예술', '스포츠', '여가', '공연', 'sports', 'entertainment', 'leisure')),
+    ('S', 'SVC', '협회 및 단체, 수리 및 기타 개인 서비스업', 'Other services', ('협회', '단체', '수리', 'repair', 'association')),
+    ('T', None, '가구 내 고용활동 및 달리 분류되지 않은 자가 소비 생산활동', 'Household activities', ()),
+    ('U', None, '국제 및 외국기관', 'International organizations', ('국제기구', 'international organization')),
+    # 제조업 중분류
+    ('C10', 'C', '식료품 제조업', 'Food', ('식품', '식료품', '농산물 가공', 'food', 'haccp')),
+    ('C11', 'C', '음료 제조업', 'Beverage', ('음료', '주류', 'beverage')),
+    ('C13', 'C', '섬유제품 제조업', 'Textile', ('섬유', '방직', 'textile')),
+    ('C14', 'C', '의복, 의복 액세서리 및 모피제품 제조업', 'Apparel', ('의복', '의류', '패션', 'apparel', 'clothing', 'fashion')),
+    ('C17', 'C', '펄프, 종이 및 종이제품 제조업', 'Paper', ('펄프', '제지', '종이', 'paper', 'pulp')),
+    ('C19', 'C', '코크스, 연탄 및 석유정제품 제조업', 'Petroleum', ('석유정제', '정유', 'petroleum', 'refinery', 'refining')),
+    ('C20', 'C', '화학 물질 및 화학제품 제조업', 'Chemical', ('화학', '석유화학', '화장품', '도료', '비료', 'chemical', 'chemicals', 'petrochemical', 'cosmetics')),
+    ('C21', 'C', '의료용 물질 및 의약품 제조업', 'Pharmaceutical', ('의약품', '제약', '바이오', '백신', 'pharmaceutical', 'pharmaceuticals', 'pharma', 'biotech', 'bio', 'biotechnology')),
+    ('C22', 'C', '고무 및 플라스틱제품 제조업', 'Rubber and plastics', ('고무', '플라스틱', '타이어', 'rubber', 'plastic', 'plastics')),
+    ('C23', 'C', '비금속 광물제품 제조업', 'Non-metallic minerals', ('비금속', '시멘트', '유리', '세라믹', 'cement', 'glass', 'ceramic', 'ceramics')),
+    ('C24', 'C', '1차 금속 제조업', 'Basic metals', ('1차 금속', '철강', '제철', '금속', '비철금속', 'steel', 'metal', 'metals')),
+    ('C25', 'C', '금속 가공제품 제조업; 기계 및 가구 제외', 'Fabricated metal', ('금속가공', '금속 가공', '금형', '주조', '단조', '도금', 'fabricated metal', 'metalworking')),
+    ('C26', 'C', '전자부품, 컴퓨터, 영상, 음향 및 통신장비 제조업', 'Electronics', ('전자부품', '반도체', '디스플레이', '전자', '통신장비', 'pcb', 'semiconductor', 'semiconductors', 'electronics', 'electronic', 'display')),
+    ('C27', 'C', '의료, 정밀, 광학 기기 및 시계 제조업', 'Medical and precision instruments', ('의료기기', '정밀기기', '광학기기', '계측기', 'medical device', 'medical devices', 'precision instruments')),
+    ('C28', 'C', '전기장비 제조업', 'Electrical equipment', ('전기장비', '전기기기', '배터리', '이차전지', '2차전지', '전선', 'electrical equipment', 'battery', 'batteries')),
+    ('C29', 'C', '기타 기계 및 장비 제조업', 'Machinery', ('기계', '산업기계', '장비 제조', 'machinery', 'machine', 'equipment manufacturing')),
+    ('C30', 'C', '자동차 및 트레일러 제조업', 'Automotive', ('자동차', '자동차부품', '자동차 부품', '모빌리티', 'automotive', 'automobile', 'vehicle', 'auto parts')),
+    ('C31', 'C', '기타 운송장비 제조업', 'Other transport equipment', ('조선', '선박', '항공', '우주', '철도차량', '방산', 'shipbuilding', 'aerospace', 'aircraft')),
+    ('C32', 'C', '가구 제조업', 'Furniture', ('가구', 'furniture')),
+    # 서비스업 중분류
+    ('H52', 'H', '창고 및 운송관련 서비스업', 'Logistics', ('물류', '창고', '풀필먼트', 'logistics', 'warehouse', 'warehousing', 'supply chain')),
+    ('J58', 'J', '출판업', 'Publishing', ('출판', '소프트웨어 개발 및 공급', '게임', 'publishing', 'game', 'games')),
+    ('J61', 'J', '우편 및 통신업', 'Telecommunications', ('통신', '통신사', '이동통신', 'telecom', 'telecommunications')),
+    ('J62', 'J', '컴퓨터 프로그래밍, 시스템 통합 및 관리업', 'Software', ('소프트웨어', '프로그래밍', '시스템 통합', '시스템통합', 'si', 'sw', '솔루션', 'software', 'saas', 'programming', 'system integration')),
+    ('J63', 'J', '정보서비스업', 'Information services', ('정보서비스', '데이터', '클라우드', '포털', 'data', 'cloud', 'hosting')),
+    ('K65', 'K', '보험 및 연금업', 'Insurance', ('보험', '연금', 'insurance')),
+    ('M70', 'M', '연구개발업', 'R&D', ('연구개발', '연구소', 'r&d', 'research')),
+    ('M72', 'M', '건축 기술, 엔지니어링 및 기타 과학기술 서비스업', 'Engineering services', ('엔지니어링', '설계', '감리', '측량', '시험 분석', 'engineering', 'testing')),
+    ('Q86', 'Q', '보건업', 'Healthcare', ('의료', '병원', '의원', '헬스케어', 'medical', 'healthcare', 'hospital', 'clinic')),
+    ('Q87', 'Q', '사회복지 서비스업', 'Social work', ('사회복지', '복지', '요양', 'social welfare', 'nursing')),
+)
+
+
+def _normalize(text):
+    return ' '.join(text.lower().split())
+
+
+class IndustryTaxonomy:
+    """업종 노드 / 별칭 정규식 / 상하위 관계 (NODES로 한 번만 컴파일)"""
+
+    def __init__(self, nodes=NODES):
+        self.codes = tuple(node[0] for node in nodes)
+        self.ids = {code: i for i, code in enumerate(self.codes)}
+        self.labels = tuple(node[2] for node in nodes)
+        self.parents = tuple(self.ids[node[1]] if node[1] else None for node in nodes)
+
+        # 상위 + 하위 + 자기 자신
+        related = [{i} for i in range(len(nodes))]
+        ancestors = [set() for _ in range(len(nodes))]
+        for i in range(len(nodes)):
+            parent = self.parents[i]
+            while parent is not None:
+                ancestors[i].add(parent)
+                related[i].add(parent)
+                related[parent].add(i)
+                parent = self.parents[parent]
+        self.related = tuple(frozenset(r) for r in related)
+        self.ancestors = tuple(frozenset(a) for a in ancestors)
+
+        aliases = {}
+        for i, (code, _, name_ko, name_en, extra) in enumerate(nodes):
+            for alias in (name_ko, name_en) + tuple(extra):
+                aliases.setdefault(_normalize(alias), i)
+        self.aliases = aliases
+        patterns = []
+        for alias in sorted(aliases, key=len, reverse=True):
+            pattern = r'\s*'.join(re.escape(part) for part in alias.split(' '))
+            if alias.isascii():
+                pattern = r'(?<![a-z0-9])' + pattern + r'(?![a-z0-9])'
+            patterns.append(f'(?P<n{aliases[alias]}_{len(patterns)}>{pattern})')
+        self._pattern = re.compile('|'.join(patterns))
+
+    def is_node(self, node) -> bool:
+        """분류 체계 노드인지 (분류에 없는 업종 문자열이면 False)"""
+        return isinstance(node, int)
+
+    def label(self, node) -> str:
+        return self.labels[node] if self.is_node(node) else node
+
+    def resolve(self, text) -> frozenset:
+        """
+        업종 문자열 -> 노드 집합
+
+        문자열 안의 별칭을 모두 찾고, 하나도 없으면 정규화한 문자열 자체를 노드로 사용합니다. (빈 값은 빈 집합)
+        하위 업종과 그 상위 업종이 같이 나오면("반도체 제조") 하위 업종만 남깁니다.
+        """
+        if not isinstance(text, str):
+            return frozenset()
+        normalized = _normalize(text)
+        if not normalized:
+            return frozenset()
+        found = {int(match.lastgroup[1:].split('_')[0]) for match in self._pattern.finditer(normalized)}
+        if not found:
+            return frozenset((normalized,))
+        broader = set()
+        for node in found:
+            broader |= self.ancestors[node]
+        return frozenset(found - broader)
+
+    def expand(self, nodes) -> frozenset:
+        """상위/하위 업종까지 포함한 노드 집합"""
+        expanded = set()
+        for node in nodes:
+            expanded |= self.related[node] if self.is_node(node) else {node}
+        return frozenset(expanded)
+
+
+TAXONOMY = IndustryTaxonomy()
+
+
+@lru_cache(maxsize=8192)
+def resolve(text) -> frozenset:
+    return TAXONOMY.resolve(text)
+
+
+def resolve_all(terms) -> frozenset:
+    """여러 업종 문자열 -> 노드 집합 (컨설턴트 업종 경험)"""
+    nodes = frozenset()
+    for term in terms:
+        nodes |= resolve(term)
+    return nodes
+
+
+def target_nodes(*texts) -> list:
+    """
+    매칭 대상 업종 노드 (상위/하위 포함, JSON 저장 가능한 정렬된 목록)
+
+    앞의 문자열부터 보고, 분류 체계 노드가 나오면 거기서 멈춥니다.
+    (분석 결과 업종 -> 공공데이터 주요사업 -> 표준산업분류명 순)
+    """
+    nodes = set()
+    for text in texts:
+        resolved = resolve(text)
+        nodes |= resolved
+        if any(TAXONOMY.is_node(node) for node in resolved):
+            break
+    return sorted(TAXONOMY.expand(nodes), key=lambda node: (not TAXONOMY.is_node(node), node))
@@ -0,0 +1,111 @@
+"""
+ISO 표준 정규화 레지스트리
+
+컨설턴트 데이터("ISO 9001" 키, "9001" 목록)와 LLM이 생성한 recommended_iso("ISO 9001:2015", "ISO/IEC 27001",
+"KS Q ISO 9001", "IATF16949" ...)를 하나의 정규 코드로 통일하고, 각 표준에 비트 위치를 부여합니다.
+컨설턴트 ISO 경험은 정수 비트마스크로 보관하여 ISO 겹침 = popcount(컨설턴트 마스크 & 요청 마스크)로 계산합니다.
+
+STANDARDS의 순서가 곧 비트 위치이므로 항목은 뒤에만 추가합니다.
+목록에 없는 표준은 처음 등장할 때 다음 비트를 할당합니다. (프로세스 내에서만 유효)
+"""
+
+import re
+import threading
+
+STANDARDS = (
+    'ISO 9001', 'ISO 14001', 'ISO 45001', 'ISO 27001', 'ISO 13485', 'IATF 16949', 'ISO 50001',
+    'ISO 22000', 'ISO 37001', 'ISO 37301', 'ISO 22301', 'ISO 20000-1', 'ISO 27701', 'ISO 17025',
+    'ISO 14064', 'FSSC 22000', 'ISO 26000', 'ISO 31000', 'ISO 55001', 'ISO 41001', 'ISO 21001',
+    'ISO 28000', 'ISO 39001', 'ISO 42001', 'AS 9100', 'ISO 46001',
+)
+
+# 정규화 후 다른 표준으로 연결할 코드 (개정/대체된 표준, 흔한 표기)
+ALIASES = {
+    'OHSAS 18001': 'ISO 45001',
+    'ISO 18001': 'ISO 45001',
+    'ISO 16949': 'IATF 16949',
+    'ISO 20000': 'ISO 20000-1',
+    'ISO 9100': 'AS 9100',
+}
+
+_YEAR = re.compile(r'[:：]\s*(19|20)\d{2}\b|\(\s*(19|20)\d{2}\s*\)')
+_NUMBER = re.compile(r'(\d{4,5})(?:\s*-\s*(\d{1,2}))?')
+_FAMILIES = (('IATF', 'IATF'), ('TS 16949', 'IATF'), ('TS16949', 'IATF'), ('FSSC', 'FSSC'),
+             ('OHSAS', 'OHSAS'), ('AS9100', 'AS'), ('AS 9100', 'AS'))
+
+
+def normalize(code):
+    """
+    표준 코드 문자열 -> 정규 코드 (빈 값이면 None)
+
+    예: "9001", "iso9001:2015", "KS Q ISO 9001" -> "ISO 9001" / "ISO/IEC 27001:2022" -> "ISO 27001"
+    번호를 찾을 수 없는 값은 공백을 정리한 대문자 문자열을 그대로 사용합니다.
+    """
+    if not isinstance(code, str):
+        return None
+    text = ' '.join(code.upper().split())
+    if not text:
+        return None
+
+    match = _NUMBER.search(_YEAR.sub('', text))
+    if match is None:
+        return text
+
+    family = 'ISO'
+    for marker, name in _FAMILIES:
+        if marker in text:
+            family = name
+            break
+    canonical = f"{family} {match.group(1)}"
+    if match.group(2):
+        canonical += f"-{match.group(2)}"
+    return ALIASES.get(canonical, canonical)
+
+
+def normalize_all(codes):
+    """정규화 + 중복 제거 (입력 순서 유지)"""
+    return tuple(dict.fromkeys(c for c in (normalize(code) for code in codes) if c))
+
+
+def popcount(value: int) -> int:
+    return bin(value).count('1')
+
+
+class IsoRegistry:
+    """정규 코드 <-> 비트 위치"""
+
+    def __init__(self, standards=STANDARDS):
+        self._bits = {}
+        self._codes = []
+        self._lock = threading.Lock()
+        for code in standards:
+            self.bit(code)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def bit(self, code: str) -> int:
+        """정규 코드의 비트 위치 (처음 보는 코드는 새 비트 할당)"""
+        position = self._bits.get(code)
+        if position is None:
+            with self._lock:
+                position = self._bits.get(code)
+                if position is None:
+                    position = len(self._codes)
+                    self._codes.append(code)
+                    self._bits[code] = position
+        return position
+
+    def mask(self, codes) -> int:
+        """정규 코드 목록 -> 비트마스크"""
+        value = 0
+        for code in codes:
+            value |= 1 << self.bit(code)
+        return value
+
+    def codes(self, mask: int):
+        """비트마스크 -> 정규 코드 목록 (비트 순서)"""
+        return [code for position, code in enumerate(list(self._codes)) if mask >> position & 1]
+
+
+REGISTRY = IsoRegistry()
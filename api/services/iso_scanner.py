@@ -0,0 +1,156 @@
+"""
+ISO 인증 언급 스캐너 (스크래핑 본문용)
+
+패턴 10개를 각각 re.findall로 돌리면 본문을 10번 읽고, 결과도 입력 표기 그대로("ISO9001", "iso 9001",
+"품질경영시스템")라 같은 인증이 여러 번 나옵니다. 모든 패턴을 이름 붙은 그룹 하나의 정규식으로 합쳐
+본문을 한 번만 훑고, 결과를 정규 코드(iso_registry.normalize)로 돌려줍니다.
+본문은 한 번 소문자로 바꾼 뒤 대소문자 구분 정규식으로 검색하고, 분기의 첫 글자가 아닌 위치는 바로 건너뜁니다.
+
+찾는 것 (kind, value):
+- 'iso': 표준 번호 표기 ("ISO 9001:2015", "KS Q ISO 9001", "ISO/IEC 27001", "IATF16949", "OHSAS 18001",
+  "ISO 9001/14001/45001" 같은 나열) 및 한글/영문 경영시스템 명칭 -> 정규 코드 (STANDARDS에 있는 것만)
+- 'cert_no': "인증번호 / 등록번호 / Certificate No." 뒤의 번호
+- 'expiry': "유효기간 / 만료일 / Valid until / Expiry date" 뒤의 날짜 (기간이면 끝 날짜) -> YYYY-MM-DD
+"""
+
+import re
+
+from .iso_registry import STANDARDS, ALIASES, normalize
+
+KNOWN_CODES = frozenset(STANDARDS)
+
+# 경영시스템 명칭 -> 정규 코드 (공백은 있어도 없어도 됨)
+KOREAN_NAMES = {
+    '품질 경영 시스템': 'ISO 9001',
+    '환경 경영 시스템': 'ISO 14001',
+    '안전 보건 경영 시스템': 'ISO 45001',
+    '보건 안전 경영 시스템': 'ISO 45001',
+    '정보 보호 경영 시스템': 'ISO 27001',
+    '정보 보안 경영 시스템': 'ISO 27001',
+    '개인 정보 보호 경영 시스템': 'ISO 27701',
+    '의료 기기 품질 경영 시스템': 'ISO 13485',
+    '에너지 경영 시스템': 'ISO 50001',
+    '식품 안전 경영 시스템': 'ISO 22000',
+    '부패 방지 경영 시스템': 'ISO 37001',
+    '규범 준수 경영 시스템': 'ISO 37301',
+    '준법 경영 시스템': 'ISO 37301',
+    '비즈니스 연속성 경영 시스템': 'ISO 22301',
+    '사업 연속성 경영 시스템': 'ISO 22301',
+    'IT 서비스 경영 시스템': 'ISO 20000-1',
+    '자산 경영 시스템': 'ISO 55001',
+    '도로 교통 안전 경영 시스템': 'ISO 39001',
+    '인공 지능 경영 시스템': 'ISO 42001',
+}
+
+ENGLISH_NAMES = {
+    'quality management system': 'ISO 9001',
+    'environmental management system': 'ISO 14001',
+    'occupational health and safety management system': 'ISO 45001',
+    'information security management system': 'ISO 27001',
+    'privacy information management system': 'ISO 27701',
+    'medical devices quality management system': 'ISO 13485',
+    'energy management system': 'ISO 50001',
+    'food safety management system': 'ISO 22000',
+    'anti-bribery management system': 'ISO 37001',
+    'compliance management system': 'ISO 37301',
+    'business continuity management system': 'ISO 22301',
+    'IT service management system': 'ISO 20000-1',
+    'asset management system': 'ISO 55001',
+    'road traffic safety management system': 'ISO 39001',
+    'artificial intelligence management system': 'ISO 42001',
+}
+
+_YEAR = r'(?:19|20)\d{2}(?!\d)'
+# 표준 번호 하나: 번호[-파트][:연도]
+_ITEM = r'\d{4,5}(?!\d)(?:\s*-\s*\d{1,2}(?!\d))?(?:\s*[:：\-]\s*' + _YEAR + r')?'
+_FAMILY = r'(?:ks\s*[a-z]\s*)?(?:iso\s*/\s*(?:iec|ts)|iso|iatf|ohsas|fssc)'
+_DATE = r'(?:19|20)\d{2}\s*[.\-/년]\s*\d{1,2}\s*[.\-/월]\s*\d{1,2}(?!\d)\s*일?'
+_CERT_LABELS = r'인증\s*(?:서\s*)?번호|등록\s*번호|certificate\s*(?:no\b\.?|number)|cert\.?\s*no\b\.?|registration\s*(?:no\b\.?|number)'
+_EXPIRY_LABELS = (r'유효\s*기간|유효\s*일자|만료\s*일자?|인증\s*기간|valid(?:ity)?(?:\s*(?:until|thru|through|to|date))?'
+                  r'|expir(?:y|ation)(?:\s*date)?')
+
+
+def _name_key(text: str) -> str:
+    key = re.sub(r'[\s\-]+', '', text.lower())
+    return key[:-1] if key.endswith('systems') else key
+
+
+def _name_words(names: dict):
+    return [re.split(r'[\s\-]+', name.lower()) for name in sorted(names, key=len, reverse=True)]
+
+
+def _name_pattern(names: dict, separator: str) -> str:
+    return '|'.join(separator.join(re.escape(word) for word in words) for words in _name_words(names))
+
+
+_NAME_CODES = {_name_key(name): code for names in (KOREAN_NAMES, ENGLISH_NAMES) for name, code in names.items()}
+
+# 각 분기가 시작할 수 있는 첫 글자 - 이 글자가 아닌 위치는 분기를 시도하지 않고 건너뜀
+_FIRST_CHARS = ''.join(sorted(
+    {'k', 'i', 'o', 'f', 'a', 't', '인', '등', 'c', 'r', '유', '만', 'v', 'e'}
+    | {words[0][0] for names in (KOREAN_NAMES, ENGLISH_NAMES) for words in _name_words(names)}
+))
+
+# 본문을 소문자로 바꾼 뒤 대소문자 구분으로 검색 (IGNORECASE는 sre의 첫 글자 검색 최적화를 끔)
+# 영문 단어 중간(앞 글자가 a-z)에서는 어떤 분기도 시작하지 않음
+_SCANNER = re.compile(
+    r'(?=[' + re.escape(_FIRST_CHARS) + r'])(?<![a-z])(?:'
+    + r'(?P<iso>(?<![a-z0-9])(?:' + _FAMILY + r'\s*[-.]?\s*' + _ITEM
+    + r'(?:\s*(?:[/,&·]|및|and)\s*' + _ITEM + r')*'
+    + r'|as\s*9100[a-d]?(?![a-z0-9])|ts\s*16949(?!\d)))'
+    + r'|(?P<name_ko>' + _name_pattern(KOREAN_NAMES, r'\s*') + r')'
+    + r'|(?P<name_en>(?:' + _name_pattern(ENGLISH_NAMES, r'[\s\-]+') + r')s?(?![a-z]))'
+    + r'|(?P<cert_no>(?:' + _CERT_LABELS + r')\s*[:：#.]?\s*(?P<cert_value>[a-z0-9][a-z0-9\-/.]{2,30}[a-z0-9]))'
+    + r'|(?P<expiry>(?:' + _EXPIRY_LABELS + r')\s*[:：]?\s*(?:' + _DATE + r'\s*(?:~|-|–|부터|to)\s*)?'
+    + r'(?P<expiry_date>' + _DATE + r')))'
+)
+_CODE_FAMILY = re.compile(_FAMILY)
+_CODE_ITEM = re.compile(r'(\d{4,5})(?!\d)(?:\s*-\s*(\d{1,2})(?!\d))?(?:\s*[:：\-]\s*' + _YEAR + r')?')
+_DIGITS = re.compile(r'\d+')
+
+
+def _codes(text: str):
+    """표준 번호 표기 (나열 포함, 소문자) -> 정규 코드"""
+    family = _CODE_FAMILY.match(text)
+    prefix = family.group(0) if family else text[:2]
+    for number, part in _CODE_ITEM.findall(text[len(family.group(0)) if family else 0:]):
+        code = normalize(f"{prefix} {number}" + (f"-{part}" if part else ''))
+        code = ALIASES.get(code, code)
+        if code in KNOWN_CODES:
+            yield code
+
+
+def _date(text: str):
+    year, month, day = (int(n) for n in _DIGITS.findall(text)[:3])
+    if 1 <= month <= 12 and 1 <= day <= 31:
+        return f"{year:04d}-{month:02d}-{day:02d}"
+    return None
+
+
+def scan(text: str) -> list:
+    """
+    본문 한 번 훑기 -> [(kind, value)] (등장 순서, 중복 포함)
+
+    kind: 'iso' (정규 코드) / 'cert_no' / 'expiry' (YYYY-MM-DD)
+    """
+    hits = []
+    for match in _SCANNER.finditer(text.lower()):
+        kind = match.lastgroup
+        if kind == 'iso':
+            hits.extend(('iso', code) for code in _codes(match.group('iso')))
+        elif kind in ('name_ko', 'name_en'):
+            hits.append(('iso', _NAME_CODES[_name_key(match.group(kind))]))
+        elif kind == 'cert_no':
+            value = match.group('cert_value').upper()
+            if any(c.isdigit() for c in value):
+                hits.append(('cert_no', value))
+        else:
+            value = _date(match.group('expiry_date'))
+            if value:
+                hits.append(('expiry', value))
+    return hits
+
+
+def iso_codes(text: str) -> list:
+    """본문의 ISO 정규 코드 (중복 제거, 등장 순서)"""
+    return list(dict.fromkeys(value for kind, value in scan(text) if kind == 'iso'))
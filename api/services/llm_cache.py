@@ -0,0 +1,156 @@
+"""
+Gemini 분석 결과 캐시 (content-addressed, stale-while-revalidate)
+
+프롬프트는 공공데이터 / 스크래핑 결과 / 입력값으로부터 결정적으로 만들어지므로
+정규화한 프롬프트의 해시를 키로 파싱된 모델 응답을 저장합니다.
+
+- age < ttl              : fresh - 그대로 반환
+- ttl <= age < ttl+stale : stale - 즉시 반환하고 백그라운드에서 갱신
+- 그 이후                 : miss - 동기 호출, 단 Gemini 장애 시 남아 있는 항목으로 대체
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+def _default_cache_path():
+    # Vercel 서버리스는 /tmp만 쓰기 가능
+    if os.environ.get('VERCEL'):
+        return '/tmp/llm_cache.db'
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'llm_cache.db')
+
+
+def prompt_cache_key(model_name: str, prompt: str) -> str:
+    """모델명 + 공백 정규화된 프롬프트의 SHA-256"""
+    normalized = ' '.join(prompt.split())
+    return hashlib.sha256(f"{model_name}\n{normalized}".encode('utf-8')).hexdigest()
+
+
+class LLMResultCache:
+    """파싱된 LLM 응답 캐시 (SQLite)"""
+
+    DEFAULT_TTL = 24 * 3600
+    DEFAULT_STALE_TTL = 7 * 24 * 3600
+
+    def __init__(self, path: str = None, ttl: float = None, stale_ttl: float = None, clock=time.time):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:' 가능). 첫 사용 시점에 연결합니다.
+            ttl: fresh 유지 시간 (초)
+            stale_ttl: ttl 이후 stale 상태로 즉시 반환하며 백그라운드 갱신하는 기간 (초)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.path = path or _default_cache_path()
+        self.ttl = self.DEFAULT_TTL if ttl is None else ttl
+        self.stale_ttl = self.DEFAULT_STALE_TTL if stale_ttl is None else stale_ttl
+        self.clock = clock
+
+        self._conn = None
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'fallbacks': 0}
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정으로 캐시 생성 (LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_STALE_TTL)"""
+        ttl = os.environ.get('LLM_CACHE_TTL')
+        stale_ttl = os.environ.get('LLM_CACHE_STALE_TTL')
+        return cls(
+            path=os.environ.get('LLM_CACHE_PATH'),
+            ttl=float(ttl) if ttl else None,
+            stale_ttl=float(stale_ttl) if stale_ttl else None
+        )
+
+    def get_or_generate(self, key: str, generate):
+        """
+        캐시 조회 후 필요하면 generate()를 호출합니다.
+
+        Args:
+            key: prompt_cache_key() 결과
+            generate: 인자 없이 파싱된 응답(dict)을 반환하는 함수
+
+        Returns:
+            (응답 dict, 캐시 상태 'hit' | 'stale' | 'miss' | 'fallback')
+        """
+        entry = self._load(key)
+        if entry is not None:
+            value, age = entry
+            if age < self.ttl:
+                self._count('hits')
+                return value, 'hit'
+            if age < self.ttl + self.stale_ttl:
+                self._count('stale_hits')
+                self._refresh_in_background(key, generate)
+                return value, 'stale'
+
+        self._count('misses')
+        try:
+            value = generate()
+        except Exception:
+            # Gemini 장애 시 만료된 항목이라도 있으면 사용
+            if entry is None:
+                raise
+            self._count('fallbacks')
+            return entry[0], 'fallback'
+
+        self.store(key, value)
+        return value, 'miss'
+
+    def store(self, key: str, value: dict):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False), self.clock())
+            )
+            conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def _load(self, key: str):
+        """(새로 디코딩된 값, 경과 시간) 또는 None - 호출자가 값을 수정해도 캐시에 영향 없음"""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT value, created_at FROM llm_cache WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), self.clock() - row[1]
+
+    def _refresh_in_background(self, key: str, generate):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.store(key, generate())
+                self._count('refreshes')
+            except Exception as e:
+                print(f"[LLM Cache] 백그라운드 갱신 실패: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name='llm-cache-refresh', daemon=True).start()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS llm_cache ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._conn.commit()
+        return self._conn
@@ -0,0 +1,190 @@
+"""
+NumPy 벡터화 매칭 엔진
+
+ConsultantIndex의 레코드로부터 컬럼형 스냅샷(ConsultantMatrix)을 만들고,
+요청마다 전체 컨설턴트 풀을 몇 번의 배열 연산으로 채점한 뒤 argpartition으로 top-k를 고릅니다.
+
+점수 계산 순서(ISO -> 업종 -> 프로젝트 유형 -> 정적 점수 -> 지역)와 부동소수점 연산은
+MatchingService._score와 동일하게 유지하여 같은 점수/순위를 보장합니다.
+행 순서는 컨설턴트 id 오름차순이며, 동점은 id 순으로 정렬합니다.
+"""
+
+import time
+
+import numpy as np
+
+from . import regions
+
+# 거리 단계 -> 지역 가점
+_TIER_POINTS = np.zeros(regions.TIER_UNKNOWN + 1, dtype=np.float64)
+for _tier, _points in regions.TIER_POINTS.items():
+    _TIER_POINTS[_tier] = _points
+
+
+def _mask_words(masks, words: int) -> np.ndarray:
+    """정수 비트마스크 목록 -> (len, words) uint64 배열 (words를 넘는 비트는 버림)"""
+    array = np.zeros((len(masks), words), dtype=np.uint64)
+    for w in range(words):
+        shift = 64 * w
+        array[:, w] = np.fromiter(((m >> shift) & 0xFFFFFFFFFFFFFFFF for m in masks), dtype=np.uint64, count=len(masks))
+    return array
+
+
+if hasattr(np, 'bitwise_count'):
+    def _popcount(values: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(values).astype(np.int64)
+else:
+    _BYTE_COUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+    def _popcount(values: np.ndarray) -> np.ndarray:
+        return _BYTE_COUNTS[values.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+def _postings(term_to_rows: dict) -> dict:
+    return {term: np.asarray(sorted(rows), dtype=np.int64) for term, rows in term_to_rows.items()}
+
+
+class ConsultantMatrix:
+    """매칭용 컬럼형 컨설턴트 스냅샷 (불변, 변경 시 새로 빌드)"""
+
+    def __init__(self, records):
+        """
+        Args:
+            records: id 오름차순 ConsultantRecord 목록
+        """
+        records = list(records)
+        n = len(records)
+        ids = np.fromiter((r.id for r in records), dtype=np.int64, count=n)
+
+        # 4. Trust Score (최대 20) + 5. 리뷰, 평점 보너스 = 레코드의 정적 점수
+        trust = np.fromiter((r.trust_score or 0 for r in records), dtype=np.float64, count=n)
+        static = np.fromiter((r.static_score for r in records), dtype=np.float64, count=n)
+
+        # ISO: 스냅샷 안에서 비트 위치를 정한 표준 비트마스크 (64비트 단위 word 배열)
+        iso_codes = sorted({code for r in records for code in r.iso})
+        iso_bits = {code: i for i, code in enumerate(iso_codes)}
+        masks = [sum(1 << iso_bits[code] for code in r.iso) for r in records]
+        iso_words = _mask_words(masks, max(1, (len(iso_codes) + 63) // 64))
+
+        # 업종 / 전문분야 (분류 노드) / 프로젝트 유형 / 활동 지역 (용어) -> 행 번호 배열
+        industries, specialties, project_types, region_terms = {}, {}, {}, {}
+        for row, r in enumerate(records):
+            for node in r.industry_nodes:
+                industries.setdefault(node, []).append(row)
+            for node in r.specialty_nodes:
+                specialties.setdefault(node, []).append(row)
+            for term in set(r.project_types):
+                project_types.setdefault(term, []).append(row)
+            for term in r.regions:
+                region_terms.setdefault(term, []).append(row)
+
+        self._set_columns(
+            records, ids, trust, static, iso_codes, iso_words,
+            _postings(industries), _postings(specialties), _postings(project_types), _postings(region_terms),
+            # Fallback: 신뢰도 상위 3명 (동점은 id 순)
+            np.lexsort((ids, -trust))[:3],
+            time.time()
+        )
+
+    @classmethod
+    def from_columns(cls, records, ids, trust, static, iso_codes, iso_words, industry_rows, specialty_rows,
+                     project_type_rows, region_rows, fallback_rows, built_at):
+        """이미 계산된 컬럼(공유 스냅샷 등)으로 생성 - records는 행 번호로 조회 가능한 시퀀스"""
+        matrix = cls.__new__(cls)
+        matrix._set_columns(records, ids, trust, static, iso_codes, iso_words, industry_rows, specialty_rows,
+                            project_type_rows, region_rows, fallback_rows, built_at)
+        return matrix
+
+    def _set_columns(self, records, ids, trust, static, iso_codes, iso_words, industry_rows, specialty_rows,
+                     project_type_rows, region_rows, fallback_rows, built_at):
+        self.records = records
+        self.size = len(ids)
+        self.ids = ids
+        self.trust = trust
+        self.static = static
+        self.iso_codes = list(iso_codes)
+        self.iso_bits = {code: i for i, code in enumerate(self.iso_codes)}
+        self.iso_words = iso_words
+        self.industry_rows = industry_rows
+        self.specialty_rows = specialty_rows
+        self.project_type_rows = project_type_rows
+        self.region_rows = region_rows
+        self.fallback_rows = fallback_rows
+        self.built_at = built_at
+
+    def _mask(self, postings: dict, nodes) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        for node in nodes:
+            rows = postings.get(node)
+            if rows is not None:
+                mask[rows] = True
+        return mask
+
+    def region_tiers(self, target_region) -> np.ndarray:
+        """컨설턴트별 대상 지역과의 최소 거리 단계 (지역 정보 없음 = TIER_UNKNOWN)"""
+        tiers = np.full(self.size, regions.TIER_UNKNOWN, dtype=np.int64)
+        for term, rows in self.region_rows.items():
+            term_tier = regions.tier(regions.resolve(term), target_region)
+            if term_tier != regions.TIER_UNKNOWN:
+                tiers[rows] = np.minimum(tiers[rows], term_tier)
+        return tiers
+
+    def score(self, target: dict, region_max_tier: int = regions.TIER_FAR) -> np.ndarray:
+        """
+        전체 컨설턴트 점수 배열 (지역 조건으로 제외된 컨설턴트는 -inf)
+
+        Args:
+            target: MatchingService._parse_criteria 결과 ({'iso', 'industry_nodes', 'project_type', 'region'})
+            region_max_tier: 이 단계보다 먼 지역에서만 활동하는 컨설턴트는 제외
+        """
+        score = np.zeros(self.size, dtype=np.float64)
+
+        # 1. ISO Match (30 points)
+        target_iso = target['iso']
+        if target_iso:
+            # 스냅샷에 없는 표준은 아무도 보유하지 않음 (분모에는 포함)
+            target_mask = sum(1 << self.iso_bits[code] for code in target_iso if code in self.iso_bits)
+            target_words = _mask_words([target_mask], self.iso_words.shape[1])[0]
+            hits = np.zeros(self.size, dtype=np.int64)
+            for w, word in enumerate(target_words):
+                if word:
+                    hits += _popcount(self.iso_words[:, w] & word)
+            score += (hits / len(target_iso)) * 30
+
+        # 2. Industry Match (25 points) / 전문분야 fallback (15 points)
+        industry_mask = self._mask(self.industry_rows, target['industry_nodes'])
+        specialty_mask = self._mask(self.specialty_rows, target['industry_nodes'])
+        score += np.where(industry_mask, 25.0, np.where(specialty_mask, 15.0, 0.0))
+
+        # 3. Project Type Match (15 points)
+        project_type = target['project_type']
+        if project_type and project_type in self.project_type_rows:
+            project_mask = np.zeros(self.size, dtype=bool)
+            project_mask[self.project_type_rows[project_type]] = True
+            score += np.where(project_mask, 15.0, 0.0)
+
+        # 4. Trust Score / 5. Role/Size
+        score += self.static
+
+        # 6. Region Proximity (10 points) / 먼 지역 컨설턴트 제외
+        if target.get('region') is not None:
+            tiers = self.region_tiers(target['region'])
+            score += _TIER_POINTS[tiers]
+            score[(tiers > region_max_tier) & (tiers != regions.TIER_UNKNOWN)] = -np.inf
+        return score
+
+    def top_k(self, score: np.ndarray, k: int) -> np.ndarray:
+        """점수 내림차순(동점은 id 오름차순) 상위 k개 행 번호"""
+        n = self.size
+        if n == 0 or k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        if k < n:
+            part = np.argpartition(-score, k - 1)[:k]
+            kth = score[part].min()
+            above = np.flatnonzero(score > kth)
+            ties = np.flatnonzero(score == kth)[:k - len(above)]
+            rows = np.concatenate([above, ties])
+        else:
+            rows = np.arange(n)
+        rows = rows[np.isfinite(score[rows])]
+        return rows[np.lexsort((rows, -score[rows]))]
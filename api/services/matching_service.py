@@ -1,150 +1,502 @@
 import sys
 import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 
 # Add parent directory to path for imports
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from models import Consultant
-import json
+from models import db, Consultant, AnalysisJob
+from .consultant_index import ConsultantIndex, ConsultantRecord
+from .matching_engine import ConsultantMatrix
+from . import matching_snapshot
+from . import consultant_query
+from . import regions
+from . import industry_taxonomy
+from .iso_registry import REGISTRY, normalize_all, popcount
+
+STRATEGIES = ('vector', 'sql')
 
 class MatchingService:
-    def match_consultants(self, criteria):
+    def __init__(self, index_max_age: float = None, strategy: str = None,
+                 materialize_limit: int = 20, materialize_spare: int = None, materialize_days: float = None,
+                 region_max_tier: int = None, snapshot_dir: str = None, snapshot_store: bool = None):
+        """
+        Args:
+            index_max_age: 메모리 레코드(ConsultantIndex) 최대 유지 시간(초). 다른 프로세스에서 변경된 컨설턴트를 반영하기 위해
+                           이 시간이 지나면 DB에서 다시 빌드합니다. (기본: MATCH_INDEX_MAX_AGE 또는 300)
+            strategy: 'vector' (NumPy 전체 풀 채점, 기본),
+                      'sql' (저장 시 해석한 검색 키로 후보만 DB에서 조회 - 메모리 풀 없음)
+                      (기본: MATCH_STRATEGY 또는 'vector')
+            materialize_limit: 분석 작업에 저장할 매칭 결과 수
+            materialize_spare: 컨설턴트 삭제/점수 하락에 대비해 추가로 저장할 순위 수
+                               (기본: MATCH_MATERIALIZE_SPARE 또는 10)
+            materialize_days: 완료 후 이 기간(일) 안의 작업만 컨설턴트 변경 시 갱신
+                              (기본: MATCH_MATERIALIZE_DAYS 또는 30, 이후에는 조회 시 다시 계산)
+            region_max_tier: 지역(region)을 요청했을 때 이 거리 단계보다 먼 지역에서만 활동하는 컨설턴트 제외
+                             (기업 주소에서 추정한 지역은 가점에만 사용)
+                             (0 같은 시/군/구 ~ 4 전국, 기본: MATCH_REGION_MAX_TIER 또는 3 = 두 단계 인접 시/도까지)
+            snapshot_dir: 'vector' 전략에서 워커 프로세스끼리 컬럼형 스냅샷을 공유할 디렉터리 (matching_snapshot)
+                          (기본: MATCH_SNAPSHOT_DIR, 비어 있으면 워커마다 따로 빌드)
+            snapshot_store: 'vector' 전략에서 스냅샷을 DB에 저장해 두고 cold start 시 로드 (snapshot_dir가 없을 때)
+                            (기본: MATCH_SNAPSHOT_STORE, Vercel에서는 1)
+        """
+        if index_max_age is None:
+            index_max_age = float(os.environ.get('MATCH_INDEX_MAX_AGE', '300'))
+        if strategy is None:
+            strategy = os.environ.get('MATCH_STRATEGY', 'vector')
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown matching strategy: {strategy}")
+        if materialize_spare is None:
+            materialize_spare = int(os.environ.get('MATCH_MATERIALIZE_SPARE', '10'))
+        if materialize_days is None:
+            materialize_days = float(os.environ.get('MATCH_MATERIALIZE_DAYS', '30'))
+        self.index_max_age = index_max_age
+        self.strategy = strategy
+        self.materialize_limit = materialize_limit
+        self.materialize_spare = materialize_spare
+        self.materialize_days = materialize_days
+        if region_max_tier is None:
+            region_max_tier = int(os.environ.get('MATCH_REGION_MAX_TIER', str(regions.TIER_NEAR)))
+        self.region_max_tier = region_max_tier
+        self.index = ConsultantIndex()
+        self._matrix = None
+        self._matrix_version = None
+        if snapshot_dir is None:
+            snapshot_dir = os.environ.get('MATCH_SNAPSHOT_DIR', '')
+        self.shared = None
+        if snapshot_dir and strategy == 'vector':
+            self.shared = matching_snapshot.SharedSnapshot(snapshot_dir)
+        if snapshot_store is None:
+            snapshot_store = os.environ.get('MATCH_SNAPSHOT_STORE', '1' if os.environ.get('VERCEL') else '0') == '1'
+        self.stored = None
+        if snapshot_store and strategy == 'vector' and self.shared is None:
+            self.stored = matching_snapshot.StoredSnapshot()
+
+    # ------------------------------------------------------------------
+    # 메모리 레코드 관리
+    # ------------------------------------------------------------------
+
+    def ensure_index(self):
+        """메모리 레코드가 없거나 오래되었으면 DB에서 빌드"""
+        index = self.index
+        if index.is_built and time.time() - index.built_at < self.index_max_age:
+            return index
+        with index.lock:
+            if not index.is_built or time.time() - index.built_at >= self.index_max_age:
+                consultants = Consultant.query.order_by(Consultant.id).all()
+                index.build(ConsultantRecord.from_model(c) for c in consultants)
+        return index
+
+    def refresh_consultant(self, consultant):
+        """컨설턴트 등록/승인/승인취소 후 호출 - 해당 컨설턴트만 메모리 레코드/저장된 매칭 결과에 반영"""
+        record = ConsultantRecord.from_model(consultant)
+        if self.index.is_built:
+            self.index.upsert(record)
+        if self.shared is not None:
+            self._publish_snapshot()
+        if self.stored is not None:
+            # 모델 이벤트가 data_version을 올렸으므로 다음 요청 대신 지금 다시 저장
+            self._stored_matrix()
+        self._update_materialized(record.id, record)
+
+    def remove_consultant(self, consultant_id):
+        """컨설턴트 삭제(반려) 후 호출"""
+        if self.index.is_built:
+            self.index.remove(consultant_id)
+        if self.shared is not None:
+            self._publish_snapshot()
+        if self.stored is not None:
+            self._stored_matrix()
+        self._update_materialized(consultant_id)
+
+    def invalidate(self):
+        """대량 변경(시드 데이터 등) 후 호출 - 다음 매칭 시 전체 재빌드, 저장된 매칭 결과는 조회 시 다시 계산"""
+        self.index.built_at = None
+        if self.shared is not None:
+            self._publish_snapshot()
+        if self.stored is not None:
+            self.stored.invalidate()
+        AnalysisJob.query.filter(AnalysisJob.matches.isnot(None)).update(
+            {AnalysisJob.matches: None}, synchronize_session=False
+        )
+        db.session.commit()
+
+    def ensure_match_keys(self):
+        """기동 시 호출 - 'sql' 전략 검색 키(consultant_match_key)가 비었거나 ISO / 업종 / 지역 표가 바뀌었으면 재생성"""
+        if self.strategy == 'sql':
+            consultant_query.ensure_match_keys()
+
+    def ensure_matrix(self):
+        """메모리 레코드 버전이 바뀌었으면 컬럼형 스냅샷을 다시 빌드 (index.lock 안에서 호출)"""
+        if self.shared is not None:
+            return self._shared_matrix()
+        if self.stored is not None:
+            return self._stored_matrix()
+        index = self.ensure_index()
+        if self._matrix is None or self._matrix_version != index.version:
+            self._matrix = ConsultantMatrix(index.sorted_records())
+            self._matrix_version = index.version
+        return self._matrix
+
+    def _shared_matrix(self):
+        """공유 스냅샷에 연결 - 없거나 오래되었으면 한 워커만 DB에서 빌드해 게시"""
+        matrix = self.shared.current()
+        if matrix is not None and time.time() - matrix.built_at < self.index_max_age:
+            return matrix
+        with self.shared.lock():
+            # 잠금을 기다리는 동안 다른 워커가 게시했을 수 있음
+            matrix = self.shared.current()
+            if matrix is None or time.time() - matrix.built_at >= self.index_max_age:
+                self._publish_snapshot(locked=True)
+                matrix = self.shared.current()
+        return matrix
+
+    def _publish_snapshot(self, locked=False):
+        """DB 전체로 컬럼형 스냅샷을 빌드해 새 세대로 게시 (컨설턴트 변경은 드물어 전체 재빌드)"""
+        if not locked:
+            with self.shared.lock():
+                return self._publish_snapshot(locked=True)
+        consultants = Consultant.query.order_by(Consultant.id).all()
+        matrix = ConsultantMatrix(ConsultantRecord.from_model(c) for c in consultants)
+        generation = self.shared.publish(matching_snapshot.encode(matrix))
+        print(f"[Match] Published shared snapshot generation {generation} ({matrix.size} consultants)")
+
+    def _stored_matrix(self):
+        """DB에 저장된 최신 스냅샷 - 없거나 data_version이 바뀌었으면 DB에서 빌드해 저장"""
+        matrix, data_version = self.stored.current()
+        if matrix is None:
+            consultants = Consultant.query.order_by(Consultant.id).all()
+            matrix = ConsultantMatrix(ConsultantRecord.from_model(c) for c in consultants)
+            self.stored.store(matrix, data_version)
+        return matrix
+
+    # ------------------------------------------------------------------
+    # 매칭
+    # ------------------------------------------------------------------
+
+    def match_consultants(self, criteria, limit=20):
         """
         Matches consultants based on multi-dimensional criteria.
         Algorithm:
-        1. Filter (Region, Budget - not fully impl in MVP)
+        1. Filter (Region - 대상 지역에서 먼 지역에서만 활동하는 컨설턴트 제외, Budget - not fully impl in MVP)
         2. Score (Weighted Sum)
            - ISO Match (30%)
            - Industry Match (25%)
            - Project Type Match (15%)
            - Trust Score (20%)
            - Role/Size Match (10%)
+           - Region Proximity (+10, 대상 지역이 있을 때만)
+
+        strategy='vector': 컬럼형 스냅샷으로 전체 풀을 배열 연산으로 채점하고 top-k만 상세 계산
+        strategy='sql': 검색 키(consultant_match_key)에 걸리는 후보만 채점하고,
+                        나머지는 정적 점수 순서대로 필요한 만큼만 읽어 전체 채점과 같은 순위를 만듭니다.
         """
-        
-        target_industry = criteria.get('industry', '')
-        target_iso = [iso['code'] for iso in criteria.get('recommended_iso', [])]
-        target_project_type = criteria.get('project_type', '')
-        target_region = criteria.get('region', '')
-        
-        # Get all consultants
-        all_consultants = Consultant.query.all()
-        
-        scored_consultants = []
-        
-        for consultant in all_consultants:
-            score = 0
-            match_details = []
-            
-            # 1. ISO Match (30 points)
-            iso_score = 0
-            consultant_iso = json.loads(consultant.iso_experience) if consultant.iso_experience else {}
-            matched_iso = []
-            for iso in target_iso:
-                if iso in consultant_iso:
-                    iso_score += 1
-                    matched_iso.append(iso)
-            
-            if target_iso:
-                iso_points = (iso_score / len(target_iso)) * 30
-                score += iso_points
-                if matched_iso:
-                    match_details.append(f"ISO {', '.join(matched_iso)} 경험")
-
-            # 2. Industry Match (25 points)
-            consultant_industries = json.loads(consultant.industry_experience) if consultant.industry_experience else []
-            if self._is_industry_match(consultant_industries, target_industry):
-                score += 25
-                match_details.append(f"{target_industry} 분야 전문")
-            elif consultant.specialty and target_industry in consultant.specialty: # Fallback
-                score += 15
-                match_details.append(f"{target_industry} 관련 경험")
-
-            # 3. Project Type Match (15 points)
-            consultant_projects = json.loads(consultant.project_types) if consultant.project_types else []
-            if target_project_type and target_project_type in consultant_projects:
-                score += 15
-                match_details.append(f"{target_project_type} 프로젝트 경험")
-
-            # 4. Trust Score (20 points)
-            # Base trust score (0-100) -> 0-10 points
-            # Verified badge -> +10 points
-            trust_points = (consultant.trust_score or 0) * 0.1
-            if consultant.verified:
-                trust_points += 10
-            score += min(trust_points, 20)
-            
-            # 5. Role/Size Match (10 points)
-            # Simplified for MVP: Bonus for high ratings/reviews if specific role not requested
-            if (consultant.reviews or 0) > 10:
-                score += 5
-            if (consultant.rating or 0) >= 4.5:
-                score += 5
-
-            scored_consultants.append({
-                'consultant': consultant,
-                'score': score,
-                'match_details': match_details
-            })
-            
-        # Sort by score desc
-        scored_consultants.sort(key=lambda x: x['score'], reverse=True)
-        
+        return self.match_batch([criteria], limit)[0]
+
+    def match_batch(self, criteria_list, limit=20):
+        """
+        여러 매칭 조건을 한 번에 채점
+
+        컨설턴트 풀(메모리 레코드/스냅샷)을 한 번만 확인하고 같은 스냅샷으로 모든 조건을 채점합니다.
+
+        Args:
+            criteria_list: match_consultants와 같은 형식의 criteria 목록
+            limit: 조건별 최대 결과 수
+
+        Returns:
+            조건 순서대로 매칭 결과 목록
+        """
+        targets = [self._parse_criteria(criteria) for criteria in criteria_list]
+        with self._pool() as index:
+            return [self._results(self._top(index, target, limit), index) for target in targets]
+
+    @contextmanager
+    def _pool(self):
+        """매칭에 사용할 컨설턴트 풀 (메모리 레코드, 'sql' 전략이나 공유/저장 스냅샷이면 None)"""
+        if self.strategy == 'sql' or self.shared is not None or self.stored is not None:
+            yield None
+            return
+        index = self.ensure_index()
+        with index.lock:
+            yield index
+
+    def _pool_size(self, index):
+        if self.strategy == 'sql':
+            return Consultant.query.count()
+        return self.ensure_matrix().size
+
+    def _top(self, index, target, k):
+        """점수 내림차순(동점은 id 순) 상위 k명의 채점 결과 (_pool() 안에서 호출)"""
+        if self.strategy == 'sql':
+            candidates, top_static = consultant_query.load_candidates(target, k, self._region_limit(target))
+            scored_consultants = [self._score(ConsultantRecord.from_model(c), target) for c in candidates]
+            return self._merge_static(scored_consultants, [ConsultantRecord.from_model(c) for c in top_static], k)
+
+        matrix = self.ensure_matrix()
+        rows = matrix.top_k(matrix.score(target, self._region_limit(target)), k)
+        # 상위 k명만 사유(match_details)까지 계산
+        return [self._score(matrix.records[row], target) for row in rows]
+
+    def _merge_static(self, scored_consultants, static_records, k):
+        # 후보가 아닌 컨설턴트의 점수 = 정적 점수
+        for record in static_records:
+            scored_consultants.append({'consultant': record, 'score': record.static_score, 'match_details': []})
+
+        # Sort by score desc (동점은 id 순)
+        scored_consultants.sort(key=lambda x: (-x['score'], x['consultant'].id))
+        return scored_consultants[:k]
+
+    def _results(self, scored_consultants, index):
         # Fallback: If no good matches (score < 10), pick top rated consultants
         if not scored_consultants or scored_consultants[0]['score'] < 10:
-             # Get top 3 by trust score
-             top_consultants = sorted(all_consultants, key=lambda x: x.trust_score or 0, reverse=True)[:3]
-             results = []
-             for c in top_consultants:
-                 results.append({
-                    'id': c.id,
-                    'name': c.name,
-                    'avatar': c.avatar,
-                    'specialty': c.specialty,
-                    'experience': c.experience,
-                    'rating': c.rating,
-                    'reviews': c.reviews,
-                    'matchReason': "분야별 최우수 전문가 (강력 추천)",
-                    'matchScore': 95, # Artificial high score for fallback
-                    'verified': c.verified,
-                    'trustScore': c.trust_score
-                })
-             return results
+            return [self._fallback_result(c) for c in self._fallback_consultants(index)]
 
         # Return top matches
-        results = []
-        for item in scored_consultants[:20]: # Return top 20 for pagination
-            c = item['consultant']
-            
-            results.append({
-                'id': c.id,
-                'name': c.name,
-                'avatar': c.avatar,
-                'specialty': c.specialty,
-                'experience': c.experience,
-                'rating': c.rating,
-                'reviews': c.reviews,
-                'matchReason': item['match_details'][0] if item['match_details'] else c.match_reason,
-                'matchScore': round(item['score']),
-                'verified': c.verified,
-                'trustScore': c.trust_score
-            })
-            
-        return results
-
-    def _is_industry_match(self, consultant_industries, target_industry):
-        if not target_industry:
+        return [self._result(item) for item in scored_consultants]
+
+    def _fallback_consultants(self, index):
+        """신뢰도 상위 3명 (동점은 id 순)"""
+        if self.strategy == 'sql':
+            return [ConsultantRecord.from_model(c) for c in consultant_query.top_trusted(3)]
+        matrix = self.ensure_matrix()
+        return [matrix.records[row] for row in matrix.fallback_rows]
+
+    # ------------------------------------------------------------------
+    # 분석 작업별 매칭 결과 저장 (완료 시 1회 계산, 컨설턴트 변경 시 해당 컨설턴트만 재채점)
+    # ------------------------------------------------------------------
+
+    def materialize(self, job):
+        """
+        완료된 분석 작업의 상위 매칭 결과를 계산해 job.matches에 저장합니다. (commit은 호출자)
+        AnalysisQueue의 on_complete 콜백으로 사용됩니다.
+        """
+        criteria = job.get_result()
+        if not criteria:
+            job.set_matches(None)
+            return None
+
+        target = self._parse_criteria(criteria)
+        capacity = self.materialize_limit + self.materialize_spare
+        with self._pool() as index:
+            scored_consultants = self._top(index, target, capacity)
+            pool_size = self._pool_size(index)
+
+        stored = {
+            'target': target,
+            'limit': self.materialize_limit,
+            'capacity': capacity,
+            # 전체 컨설턴트가 목록에 들어 있는지 (이 경우 누구든 순위에 바로 삽입 가능)
+            'complete': len(scored_consultants) >= pool_size,
+            'items': [self._stored_item(item) for item in scored_consultants]
+        }
+        job.set_matches(stored)
+        return stored
+
+    def materialized_matches(self, job, limit=20):
+        """저장된 매칭 결과 (없거나 fallback 대상이면 None)"""
+        stored = job.get_matches()
+        if not stored or limit > stored['limit']:
+            return None
+        items = stored['items']
+        if not items or items[0]['score'] < 10:
+            return None
+        return [item['result'] for item in items[:limit]]
+
+    def job_matches(self, job, limit=20):
+        """
+        분석 작업의 매칭 결과 - 저장된 결과가 있으면 그대로 반환하고,
+        없으면(기능 도입 전 작업, 시드 후 무효화 등) 계산해서 저장합니다.
+        """
+        matches = self.materialized_matches(job, limit)
+        if matches is not None:
+            return matches
+        if job.matches is None and limit <= self.materialize_limit:
+            self.materialize(job)
+            db.session.commit()
+            matches = self.materialized_matches(job, limit)
+            if matches is not None:
+                return matches
+        return self.match_consultants(job.get_result(), limit)
+
+    def _stored_item(self, item):
+        return {'score': item['score'], 'result': self._result(item)}
+
+    @staticmethod
+    def _stored_key(item):
+        return (-item['score'], item['result']['id'])
+
+    def _update_materialized(self, consultant_id, record=None):
+        """최근 완료된 작업들의 저장된 매칭 결과에 컨설턴트 한 명의 변경(record=None이면 삭제)을 반영"""
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=self.materialize_days)
+            jobs = AnalysisJob.query.filter(
+                AnalysisJob.status == 'completed',
+                AnalysisJob.matches.isnot(None),
+                AnalysisJob.finished_at >= cutoff
+            ).all()
+            rebuilt = 0
+            for job in jobs:
+                stored = job.get_matches()
+                if self._apply_change(stored, consultant_id, record):
+                    job.set_matches(stored)
+                else:
+                    self.materialize(job)
+                    rebuilt += 1
+            if jobs:
+                db.session.commit()
+                print(f"[Match] 컨설턴트 {consultant_id} 변경 반영: 작업 {len(jobs)}건 (전체 재계산 {rebuilt}건)")
+        except Exception as e:
+            db.session.rollback()
+            print(f"[Match] 저장된 매칭 결과 갱신 실패 (consultant {consultant_id}): {e}")
+
+    def _apply_change(self, stored, consultant_id, record):
+        """
+        저장된 목록은 '전체 풀의 정확한 상위 len(items)명'입니다.
+        변경된 컨설턴트를 빼고 다시 채점해 넣되, 목록 끝보다 낮으면(목록 밖 순위를 모르므로) 넣지 않습니다.
+
+        Returns:
+            False면 목록이 limit보다 짧아져 전체 재계산 필요
+        """
+        if 'industry_nodes' not in stored['target'] or 'region_filter' not in stored['target']:
+            # 업종 분류 / 요청 지역 구분 도입 전에 저장된 조건 - 전체 재계산
+            return False
+        items = [item for item in stored['items'] if item['result']['id'] != consultant_id]
+
+        if record is not None and not self._is_region_excluded(record, stored['target']):
+            item = self._stored_item(self._score(record, stored['target']))
+            key = self._stored_key(item)
+            if stored['complete'] or (items and key < self._stored_key(items[-1])):
+                position = 0
+                while position < len(items) and self._stored_key(items[position]) < key:
+                    position += 1
+                items.insert(position, item)
+                if len(items) > stored['capacity']:
+                    del items[stored['capacity']:]
+                    stored['complete'] = False
+
+        if not stored['complete'] and len(items) < stored['limit']:
+            return False
+        stored['items'] = items
+        return True
+
+    def _parse_criteria(self, criteria):
+        gov_data = criteria.get('gov_data')
+        gov_data = gov_data if isinstance(gov_data, dict) else {}
+        industry = criteria.get('industry', '')
+        requested_region = self._resolve_region(criteria.get('region'))
+        return {
+            'industry': industry or gov_data.get('main_business') or '',
+            # 업종 분류 노드 (분석 결과 업종을 해석할 수 없으면 공공데이터 주요사업 / 표준산업분류명 사용)
+            'industry_nodes': industry_taxonomy.target_nodes(industry, gov_data.get('main_business'),
+                                                             gov_data.get('industry_code')),
+            'iso': list(normalize_all(iso.get('code') for iso in (criteria.get('recommended_iso') or []) if isinstance(iso, dict))),
+            'project_type': criteria.get('project_type', ''),
+            # 대상 지역: 요청 지역 또는 공공데이터 기업 주소 (주소에서 추정한 지역은 가점에만 사용)
+            'region': requested_region or self._resolve_region(gov_data.get('address')),
+            # 먼 지역 컨설턴트 제외는 지역을 직접 요청했을 때만
+            'region_filter': requested_region is not None
+        }
+
+    def _resolve_region(self, text):
+        """지역 표기 -> (시/도, 시/군/구) - 없거나 '전국'이면 None"""
+        region = regions.resolve(text or '')
+        if region is None or region[0] == regions.NATIONWIDE:
+            return None
+        return region
+
+    def _region_limit(self, target):
+        """제외 기준 거리 단계 (지역을 요청하지 않았으면 TIER_FAR = 제외 없음)"""
+        return self.region_max_tier if target['region_filter'] else regions.TIER_FAR
+
+    def _is_region_excluded(self, record, target):
+        if target['region'] is None or not target['region_filter']:
             return False
-        
-        # Direct match
-        if target_industry in consultant_industries:
-            return True
-            
-        # Keyword match (Simple version)
-        for ind in consultant_industries:
-            if target_industry in ind or ind in target_industry:
-                return True
-                
-        return False
+        tier = regions.best_tier(record.regions, target['region'])
+        return tier != regions.TIER_UNKNOWN and tier > self.region_max_tier
+
+    def _score(self, record, target):
+        """컨설턴트 한 명의 매칭 점수 (가중합)"""
+        score = 0
+        match_details = []
+
+        # 1. ISO Match (30 points) - 정규화된 표준 비트마스크의 AND popcount
+        target_iso = target['iso']
+        if target_iso:
+            overlap = record.iso_mask & REGISTRY.mask(target_iso)
+            iso_points = (popcount(overlap) / len(target_iso)) * 30
+            score += iso_points
+            if overlap:
+                matched_iso = [iso for iso in target_iso if overlap >> REGISTRY.bit(iso) & 1]
+                match_details.append(f"ISO {', '.join(matched_iso)} 경험")
+
+        # 2. Industry Match (25 points) - 업종 분류 노드 교집합
+        target_industry = target['industry']
+        if self._is_industry_match(record.industry_nodes, target['industry_nodes']):
+            score += 25
+            match_details.append(f"{target_industry} 분야 전문")
+        elif self._is_industry_match(record.specialty_nodes, target['industry_nodes']): # Fallback
+            score += 15
+            match_details.append(f"{target_industry} 관련 경험")
+
+        # 3. Project Type Match (15 points)
+        target_project_type = target['project_type']
+        if target_project_type and target_project_type in record.project_types:
+            score += 15
+            match_details.append(f"{target_project_type} 프로젝트 경험")
+
+        # 4. Trust Score (20 points) + 5. Role/Size Match (10 points)
+        # 컨설턴트에만 의존하므로 저장 시 미리 계산한 정적 점수 사용 (models.static_match_score)
+        score += record.static_score
+
+        # 6. Region Proximity (10 points)
+        target_region = target['region']
+        if target_region is not None:
+            tier = regions.best_tier(record.regions, target_region)
+            score += regions.TIER_POINTS.get(tier, 0)
+            if tier <= regions.TIER_PROVINCE:
+                match_details.append(f"{regions.region_label(target_region)} 지역 활동")
+
+        return {
+            'consultant': record,
+            'score': score,
+            'match_details': match_details
+        }
+
+    def _result(self, item):
+        c = item['consultant']
+        return {
+            'id': c.id,
+            'name': c.name,
+            'avatar': c.avatar,
+            'specialty': c.specialty,
+            'experience': c.experience,
+            'rating': c.rating,
+            'reviews': c.reviews,
+            'matchReason': item['match_details'][0] if item['match_details'] else c.match_reason,
+            'matchScore': round(item['score']),
+            'verified': c.verified,
+            'trustScore': c.trust_score
+        }
+
+    def _fallback_result(self, c):
+        return {
+            'id': c.id,
+            'name': c.name,
+            'avatar': c.avatar,
+            'specialty': c.specialty,
+            'experience': c.experience,
+            'rating': c.rating,
+            'reviews': c.reviews,
+            'matchReason': "분야별 최우수 전문가 (강력 추천)",
+            'matchScore': 95, # Artificial high score for fallback
+            'verified': c.verified,
+            'trustScore': c.trust_score
+        }
 
+    def _is_industry_match(self, consultant_nodes, target_nodes):
+        """컨설턴트 업종 노드와 대상 업종 노드(상위/하위 포함 목록)가 겹치는지"""
+        return not consultant_nodes.isdisjoint(target_nodes)
@@ -0,0 +1,410 @@
+"""
+여러 워커 프로세스가 공유하는 매칭 스냅샷 (ConsultantMatrix 바이너리 직렬화)
+
+gunicorn 등 멀티 프로세스 WSGI에서 워커마다 ConsultantIndex / ConsultantMatrix를 따로 빌드하면
+메모리가 워커 수만큼 늘어나고 워커마다 cold start 빌드 비용이 듭니다.
+한 워커가 빌드한 스냅샷을 공유 디렉터리(기본 /dev/shm, tmpfs)의 파일로 게시하고
+모든 워커는 mmap + np.frombuffer로 복사 없이 붙습니다. (페이지 캐시를 공유하므로 메모리는 한 벌)
+
+파일 형식 (모든 섹션은 8바이트 정렬):
+    MAGIC(8) | 헤더 길이(8) | JSON 헤더 | 섹션...
+    헤더: 형식 버전, 표 지문, 세대, 빌드 시각, 행 수, ISO 비트 순서, 용어 목록, 섹션 (이름 -> dtype, offset, shape)
+    표 지문(lookup_fingerprint): 레코드의 ISO 정규화 / 업종 노드 / 지역 해석은 빌드 시점의 표로 계산되므로
+    표가 바뀐 배포에서는 형식 버전이 다를 때와 같이 스냅샷을 쓰지 않고 다시 빌드합니다.
+    섹션: ids / trust / static / iso_words / fallback / 게시 목록(CSR: offsets + rows) / 레코드(JSON 행 + offsets)
+
+게시 절차:
+    1. 빌드 잠금(fcntl) 안에서 새 세대 파일을 임시 이름으로 쓴 뒤 os.replace (부분 파일이 보이지 않음)
+    2. 제어 파일(mmap 8바이트)의 세대 번호를 갱신 - 워커는 요청마다 세대만 비교하고 바뀌었을 때만 다시 붙음
+    3. 두 세대 이전 파일 삭제 (이미 붙은 워커의 mmap은 unlink 후에도 유효)
+
+서버리스(Vercel)처럼 프로세스가 매번 새로 뜨는 환경에서는 같은 형식의 스냅샷을 DB(matching_snapshot 테이블)에
+저장해 두고(StoredSnapshot), cold start 시 컨설턴트 전체 조회/디코딩 대신 한 행을 읽어 로컬 파일로 mmap합니다.
+컨설턴트 변경은 모델 이벤트가 data_version을 올려 표시하므로 오래된 스냅샷은 버전 비교만으로 감지됩니다.
+"""
+
+import sys
+import os
+import json
+import mmap
+import struct
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows 로컬 개발 - 단일 프로세스이므로 잠금 없이 동작
+    fcntl = None
+
+from models import db, MatchingSnapshot
+from .consultant_index import ConsultantRecord, lookup_fingerprint
+from .matching_engine import ConsultantMatrix
+
+MAGIC = b'IMSNAP01'
+FORMAT_VERSION = 1
+ALIGN = 8
+
+POSTING_GROUPS = ('industry_rows', 'specialty_rows', 'project_type_rows', 'region_rows')
+RECORD_FIELDS = ('id', 'name', 'avatar', 'specialty', 'experience', 'rating', 'reviews', 'match_reason',
+                 'verified', 'trust_score', 'iso', 'industries', 'project_types', 'regions')
+
+
+def default_directory() -> str:
+    """공유 메모리 tmpfs(/dev/shm)가 있으면 사용, 없으면 임시 디렉터리"""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+def encode(matrix: ConsultantMatrix, generation: int = 0) -> bytes:
+    """ConsultantMatrix -> 스냅샷 바이트"""
+    sections = []
+
+    def add(name, array):
+        sections.append((name, np.ascontiguousarray(array)))
+
+    add('ids', matrix.ids.astype(np.int64))
+    add('trust', matrix.trust.astype(np.float64))
+    add('static', matrix.static.astype(np.float64))
+    add('iso_words', matrix.iso_words.astype(np.uint64))
+    add('fallback', np.asarray(matrix.fallback_rows, dtype=np.int64))
+
+    terms = {}
+    for group in POSTING_GROUPS:
+        postings = getattr(matrix, group)
+        keys = list(postings)
+        lengths = [len(postings[key]) for key in keys]
+        terms[group] = keys
+        add(group + '.offsets', np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))).astype(np.int64))
+        rows = [postings[key] for key in keys]
+        add(group + '.rows', np.concatenate(rows).astype(np.int64) if rows else np.zeros(0, dtype=np.int64))
+
+    blobs = [json.dumps([getattr(record, field) for field in RECORD_FIELDS], ensure_ascii=False).encode('utf-8')
+             for record in matrix.records]
+    add('records.offsets', np.concatenate(([0], np.cumsum([len(b) for b in blobs], dtype=np.int64))).astype(np.int64))
+    add('records.blob', np.frombuffer(b''.join(blobs), dtype=np.uint8))
+
+    layout = {}
+    offset = 0
+    for name, array in sections:
+        layout[name] = [array.dtype.str, offset, list(array.shape)]
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'fingerprint': lookup_fingerprint(),
+        'generation': generation,
+        'built_at': matrix.built_at,
+        'size': matrix.size,
+        'iso_codes': matrix.iso_codes,
+        'terms': terms,
+        'sections': layout
+    }, ensure_ascii=False).encode('utf-8')
+    header += b' ' * (_aligned(len(header)) - len(header))
+
+    out = bytearray(len(MAGIC) + 8 + len(header) + offset)
+    out[:len(MAGIC)] = MAGIC
+    struct.pack_into('<q', out, len(MAGIC), len(header))
+    base = len(MAGIC) + 8 + len(header)
+    out[len(MAGIC) + 8:base] = header
+    for name, array in sections:
+        start = base + layout[name][1]
+        out[start:start + array.nbytes] = array.tobytes()
+    return bytes(out)
+
+
+def decode(buffer) -> ConsultantMatrix:
+    """
+    스냅샷 바이트(bytes / mmap) -> ConsultantMatrix
+
+    숫자 컬럼과 게시 목록은 buffer를 그대로 가리키는 읽기 전용 뷰이고, 레코드는 조회할 때 디코딩합니다.
+    """
+    header = read_header(buffer)
+    base = len(MAGIC) + 8 + header['header_size']
+
+    def section(name):
+        dtype, offset, shape = header['sections'][name]
+        count = int(np.prod(shape)) if shape else 1
+        return np.frombuffer(buffer, dtype=np.dtype(dtype), count=count, offset=base + offset).reshape(shape)
+
+    postings = {}
+    for group in POSTING_GROUPS:
+        offsets = section(group + '.offsets')
+        rows = section(group + '.rows')
+        postings[group] = {key: rows[offsets[i]:offsets[i + 1]] for i, key in enumerate(header['terms'][group])}
+
+    return ConsultantMatrix.from_columns(
+        records=SnapshotRecords(section('records.blob'), section('records.offsets')),
+        ids=section('ids'),
+        trust=section('trust'),
+        static=section('static'),
+        iso_codes=header['iso_codes'],
+        iso_words=section('iso_words'),
+        industry_rows=postings['industry_rows'],
+        specialty_rows=postings['specialty_rows'],
+        project_type_rows=postings['project_type_rows'],
+        region_rows=postings['region_rows'],
+        fallback_rows=section('fallback'),
+        built_at=header['built_at']
+    )
+
+
+def read_header(buffer) -> dict:
+    """스냅샷 헤더 (형식이 다르거나 다른 ISO / 업종 / 지역 표로 빌드되었으면 ValueError)"""
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError('not a matching snapshot')
+    (size,) = struct.unpack_from('<q', buffer, len(MAGIC))
+    header = json.loads(bytes(buffer[len(MAGIC) + 8:len(MAGIC) + 8 + size]).decode('utf-8'))
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError('unsupported snapshot version: %s' % header.get('version'))
+    if header.get('fingerprint') != lookup_fingerprint():
+        raise ValueError('snapshot built with other lookup tables: %s' % header.get('fingerprint'))
+    header['header_size'] = size
+    return header
+
+
+def _aligned(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+class SnapshotRecords:
+    """행 번호 -> ConsultantRecord (처음 조회할 때 JSON 행을 디코딩, 매칭 결과 상위 k명만 디코딩됨)"""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+        self._cache = {}
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        return (self[row] for row in range(len(self)))
+
+    def __getitem__(self, row):
+        row = int(row)
+        record = self._cache.get(row)
+        if record is None:
+            if not 0 <= row < len(self):
+                raise IndexError(row)
+            start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+            values = json.loads(self._blob[start:end].tobytes().decode('utf-8'))
+            record = ConsultantRecord(**dict(zip(RECORD_FIELDS, values)))
+            self._cache[row] = record
+        return record
+
+
+def _map_file(path: str):
+    """파일 전체를 읽기 전용 mmap (fd는 바로 닫아도 매핑은 유지)"""
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SharedSnapshot:
+    """
+    공유 디렉터리의 세대별 스냅샷 파일 게시 / 연결
+
+    워커는 current()로 최신 세대에 붙고, 빌드하는 워커는 lock() 안에서 publish()합니다.
+    이전 세대 mmap은 명시적으로 닫지 않습니다. (요청 처리 중인 뷰가 남아 있을 수 있음 - 참조가 없어지면 해제)
+    """
+
+    def __init__(self, directory: str = None, name: str = 'insightmatch-match'):
+        self.directory = directory or default_directory()
+        self.name = name
+        os.makedirs(self.directory, exist_ok=True)
+        self.generation = 0
+        self.matrix = None
+        self._control = None
+        self._attach_lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def path(self, generation: int) -> str:
+        return os.path.join(self.directory, '%s.%d.snap' % (self.name, generation))
+
+    @contextmanager
+    def lock(self):
+        """프로세스 간 빌드 잠금 (같은 프로세스의 스레드끼리도 배타적)"""
+        with self._build_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.directory, self.name + '.lock'), 'a') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def published_generation(self) -> int:
+        """제어 파일에 기록된 현재 세대 (게시된 스냅샷이 없으면 0)"""
+        control = self._control_map()
+        if control is None:
+            return 0
+        return struct.unpack_from('<q', control, 0)[0]
+
+    def current(self):
+        """최신 세대 ConsultantMatrix (게시된 스냅샷이 없거나 형식 / 표 지문이 다르면 None)"""
+        generation = self.published_generation()
+        if generation == self.generation:
+            return self.matrix
+        try:
+            buffer = _map_file(self.path(generation))
+        except FileNotFoundError:
+            # 그 사이 더 새로운 세대가 게시되어 삭제됨 - 다음 요청에서 다시 붙음
+            return self.matrix
+        try:
+            matrix = decode(buffer)
+        except ValueError as e:
+            # 이전 배포가 게시한 세대 - 호출자가 다시 빌드해 새 세대로 게시
+            print(f"[Match] Shared snapshot generation {generation} ignored: {e}")
+            return None
+        with self._attach_lock:
+            if generation > self.generation:
+                self.matrix, self.generation = matrix, generation
+                print(f"[Match] Attached shared snapshot generation {generation} ({matrix.size} consultants)")
+        return self.matrix
+
+    def publish(self, data: bytes) -> int:
+        """
+        새 세대 스냅샷 게시 (lock() 안에서 호출)
+
+        Returns:
+            게시한 세대 번호
+        """
+        generation = self.published_generation() + 1
+        path = self.path(generation)
+        temp = path + '.%d.tmp' % os.getpid()
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+
+        control = self._control_map(create=True)
+        struct.pack_into('<q', control, 0, generation)
+        control.flush()
+
+        stale = self.path(generation - 2)
+        if os.path.exists(stale):
+            os.remove(stale)
+        return generation
+
+    def _control_map(self, create: bool = False):
+        if self._control is None:
+            path = os.path.join(self.directory, self.name + '.ctl')
+            if not os.path.exists(path):
+                if not create:
+                    return None
+                with open(path, 'ab') as f:
+                    f.write(b'\0' * 8)
+            with open(path, 'r+b') as f:
+                self._control = mmap.mmap(f.fileno(), 8)
+        return self._control
+
+
+class StoredSnapshot:
+    """
+    DB에 저장된 스냅샷 (matching_snapshot 테이블, 행 id=1) + 로컬 mmap 캐시 파일
+
+    current()는 버전 컬럼만 조회하고(BLOB 제외), 같은 스냅샷이면 이미 붙은 행렬을 그대로 반환합니다.
+    프로세스에 처음 붙을 때만 BLOB을 읽어 캐시 디렉터리에 쓰고 mmap합니다. (같은 인스턴스의 다음 cold start는 파일만 mmap)
+    """
+
+    def __init__(self, directory: str = None, name: str = 'insightmatch-stored'):
+        self.directory = directory or default_directory()
+        self.name = name
+        os.makedirs(self.directory, exist_ok=True)
+        self.token = None
+        self.matrix = None
+        self._lock = threading.Lock()
+
+    def path(self, token: str) -> str:
+        return os.path.join(self.directory, '%s.%s.snap' % (self.name, token))
+
+    def state(self):
+        """(data_version, snapshot_version, format_version, token) - 행이 없으면 None"""
+        return (db.session.query(MatchingSnapshot.data_version, MatchingSnapshot.snapshot_version,
+                                 MatchingSnapshot.format_version, MatchingSnapshot.token)
+                .filter(MatchingSnapshot.id == 1).first())
+
+    def current(self):
+        """
+        최신 스냅샷 ConsultantMatrix
+
+        Returns:
+            (matrix, data_version) - 저장된 스냅샷이 없거나 오래되었으면 matrix는 None
+        """
+        state = self.state()
+        if state is None:
+            return None, None
+        data_version, snapshot_version, format_version, token = state
+        if format_version != FORMAT_VERSION or snapshot_version != data_version:
+            return None, data_version
+        with self._lock:
+            if token != self.token:
+                matrix = self._attach(token)
+                if matrix is None:
+                    return None, data_version
+                self.matrix, self.token = matrix, token
+            return self.matrix, data_version
+
+    def invalidate(self):
+        """bulk 변경(모델 이벤트 없음) 후 호출 - 저장된 스냅샷을 오래된 것으로 표시 (commit은 호출자)"""
+        MatchingSnapshot.query.filter(MatchingSnapshot.id == 1).update(
+            {MatchingSnapshot.data_version: MatchingSnapshot.data_version + 1}, synchronize_session=False
+        )
+
+    def _attach(self, token):
+        path = self.path(token)
+        if not os.path.exists(path):
+            data = (db.session.query(MatchingSnapshot.data)
+                    .filter(MatchingSnapshot.id == 1, MatchingSnapshot.token == token).scalar())
+            if data is None:
+                # 그 사이 다른 인스턴스가 새로 저장함
+                return None
+            temp = path + '.%d.tmp' % os.getpid()
+            with open(temp, 'wb') as f:
+                f.write(data)
+            os.replace(temp, path)
+            if self.token is not None and os.path.exists(self.path(self.token)):
+                os.remove(self.path(self.token))
+        try:
+            matrix = decode(_map_file(path))
+        except ValueError as e:
+            # 형식 / 표 지문이 다름 - 형식 버전 컬럼이 다를 때와 같이 다시 빌드
+            print(f"[Match] Stored snapshot {token} ignored: {e}")
+            os.remove(path)
+            return None
+        print(f"[Match] Loaded stored snapshot {token} ({matrix.size} consultants)")
+        return matrix
+
+    def store(self, matrix: ConsultantMatrix, data_version):
+        """
+        빌드한 스냅샷 저장 (data_version은 빌드 전에 current()로 읽은 값 - 빌드 중 변경이 있으면 다음 조회에서 다시 빌드)
+        """
+        token = uuid.uuid4().hex
+        values = {
+            'snapshot_version': data_version or 0,
+            'format_version': FORMAT_VERSION,
+            'token': token,
+            'built_at': datetime.utcnow(),
+            'data': encode(matrix)
+        }
+        try:
+            if data_version is None:
+                db.session.add(MatchingSnapshot(id=1, data_version=0, **values))
+            else:
+                MatchingSnapshot.query.filter(MatchingSnapshot.id == 1).update(values, synchronize_session=False)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"[Match] 매칭 스냅샷 저장 실패: {e}")
+            return
+        with self._lock:
+            self.matrix, self.token = matrix, token
+        print(f"[Match] Stored snapshot {token} ({matrix.size} consultants, data version {data_version or 0})")
@@ -0,0 +1,238 @@
+"""
+스트리밍 HTML 본문 추출 (스크래핑용)
+
+응답 전체를 response.text로 받고 BeautifulSoup 트리를 만든 뒤 앞부분만 잘라 쓰면
+수 MB짜리 랜딩 페이지에서 버릴 텍스트를 위해 메모리와 CPU를 씁니다.
+청크 단위로 디코딩하면서 html.parser로 바로 텍스트를 뽑고, 필요한 만큼만 보관합니다.
+
+- 문자셋: Content-Type charset > BOM > <meta charset> > UTF-8 검사 실패 시 CP949 (EUC-KR 상위 집합)
+- 본문 미리보기는 preview_chars까지만 보관, 나머지 텍스트는 키워드 스캔만 하고 버림
+- max_text 글자를 스캔했거나 max_bytes를 받으면 중단 (truncated)
+- script / style / noscript / template 안의 텍스트는 제외, 링크(href, 링크 텍스트)는 선택적으로 수집
+"""
+
+import re
+import codecs
+from html.parser import HTMLParser
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_MAX_TEXT = 200000
+MAX_LINKS = 2000
+# 청크 경계에 걸친 키워드를 놓치지 않도록 다음 스캔에 다시 포함하는 글자 수
+SCAN_OVERLAP = 64
+SCAN_BLOCK = 8192
+
+SKIP_TAGS = frozenset(('script', 'style', 'noscript', 'template'))
+
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?\s*([\w\-:.]+)', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w\-:.]+)', re.IGNORECASE)
+# 국내 사이트에서 흔한 표기 -> 상위 호환 코덱
+_CHARSET_ALIASES = {'euc_kr': 'cp949', 'ks_c_5601-1987': 'cp949', 'ksc5601': 'cp949', 'iso2022_kr': 'cp949'}
+
+
+def _codec(name):
+    if not name:
+        return None
+    name = name.strip().lower()
+    name = _CHARSET_ALIASES.get(name, name)
+    try:
+        codec = codecs.lookup(name).name
+    except LookupError:
+        return None
+    return _CHARSET_ALIASES.get(codec, codec)
+
+
+def sniff_charset(content_type: str, head: bytes) -> str:
+    """응답 헤더와 본문 앞부분으로 문자셋 결정"""
+    match = _HEADER_CHARSET.search(content_type or '')
+    codec = _codec(match.group(1)) if match else None
+    if codec:
+        return codec
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    match = _META_CHARSET.search(head[:4096])
+    codec = _codec(match.group(1).decode('ascii', 'ignore')) if match else None
+    if codec:
+        return codec
+    try:
+        # 마지막 글자가 청크 경계에서 잘렸을 수 있으므로 final=False
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+class PageExtractor(HTMLParser):
+    """청크 단위로 feed()하는 본문 텍스트 / 링크 / 키워드 추출기"""
+
+    def __init__(self, scan=None, preview_chars: int = 1500, max_text: int = DEFAULT_MAX_TEXT,
+                 collect_links: bool = True):
+        """
+        Args:
+            scan: 텍스트 -> 언급 목록 함수 (예: iso_scanner.scan, 없으면 스캔하지 않음)
+            preview_chars: 보관할 본문 앞부분 글자 수
+            max_text: 스캔할 최대 본문 글자 수 (넘으면 done)
+            collect_links: <a href> 수집 여부
+        """
+        super().__init__(convert_charrefs=True)
+        self.scan = scan
+        self.preview_chars = preview_chars
+        self.max_text = max_text
+        self.collect_links = collect_links
+        self.preview = []
+        self.preview_length = 0
+        self.text_length = 0
+        self.mentions = []
+        self.links = []
+        self._skip = 0
+        self._anchor = None
+        # html.parser는 청크 경계에서 텍스트를 나눠 넘기므로 텍스트 노드 하나를 모았다가 태그 경계에서 처리
+        self._node = []
+        self._node_length = 0
+        self._node_started = False
+        self._pending = ''
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        self._end_node()
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag == 'a' and self.collect_links and len(self.links) < MAX_LINKS:
+            href = dict(attrs).get('href')
+            if href:
+                self._anchor = (href, [])
+
+    def handle_startendtag(self, tag, attrs):
+        self._end_node()
+
+    def handle_endtag(self, tag):
+        self._end_node()
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag == 'a' and self._anchor is not None:
+            href, parts = self._anchor
+            self.links.append((href, ' '.join(parts)))
+            self._anchor = None
+
+    def handle_comment(self, data):
+        self._end_node()
+
+    def handle_data(self, data):
+        if self._skip or self.done:
+            return
+        self._node.append(data)
+        self._node_length += len(data)
+        if self._node_length >= SCAN_BLOCK:
+            # 아주 긴 텍스트 노드는 모으지 않고 나눠서 처리
+            self._end_node(partial=True)
+
+    def _end_node(self, partial: bool = False):
+        if not self._node:
+            return
+        text = ''.join(self._node)
+        self._node = []
+        self._node_length = 0
+        if not self._node_started:
+            text = text.lstrip()
+        if not partial:
+            text = text.rstrip()
+        if text:
+            self._add_text(text, separator='' if partial else ' ')
+            self._node_started = partial
+        elif not partial:
+            self._node_started = False
+
+    def _add_text(self, text: str, separator: str):
+        # get_text(separator=' ', strip=True)와 같은 공백 규칙
+        if self._anchor is not None:
+            self._anchor[1].append(text)
+        if self.preview_length < self.preview_chars:
+            self.preview.append(text + separator)
+            self.preview_length += len(text) + len(separator)
+        self.text_length += len(text) + len(separator)
+        if self.scan is not None:
+            self._pending += text + separator
+            if len(self._pending) >= SCAN_BLOCK:
+                self._flush(final=False)
+        if self.text_length >= self.max_text:
+            self.done = True
+
+    def _flush(self, final: bool):
+        if not self._pending:
+            return
+        self.mentions.extend(self.scan(self._pending))
+        # 경계에 걸친 키워드는 다음 블록에서 다시 찾음 (중복은 호출자가 set으로 합침)
+        self._pending = '' if final else self._pending[-SCAN_OVERLAP:]
+
+    def finish(self):
+        self.close()
+        self._end_node()
+        if self.scan is not None:
+            self._flush(final=True)
+        return ''.join(self.preview).strip()[:self.preview_chars]
+
+
+def extract(chunks, content_type: str = None, scan=None, preview_chars: int = 1500,
+            max_bytes: int = DEFAULT_MAX_BYTES, max_text: int = DEFAULT_MAX_TEXT, collect_links: bool = True) -> dict:
+    """
+    바이트 청크 스트림 -> 본문 미리보기 / 언급 / 링크
+
+    Returns:
+        {'text': 본문 앞부분, 'mentions': [...], 'links': [(href, 링크 텍스트)], 'encoding': 문자셋,
+         'bytes': 읽은 바이트 수, 'truncated': 상한에 걸려 중간에 멈췄는지}
+    """
+    extractor = PageExtractor(scan=scan, preview_chars=preview_chars, max_text=max_text,
+                              collect_links=collect_links)
+    decoder = None
+    encoding = None
+    head = b''
+    received = 0
+    truncated = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if received + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - received]
+            truncated = True
+        received += len(chunk)
+        if decoder is None:
+            # 문자셋은 앞부분(최대 4KB)을 모은 뒤 결정
+            head += chunk
+            if len(head) < 4096 and not truncated:
+                continue
+            chunk, head = head, b''
+            encoding = sniff_charset(content_type, chunk)
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        extractor.feed(decoder.decode(chunk))
+        if extractor.done:
+            truncated = True
+        if truncated:
+            break
+    if decoder is None:
+        encoding = sniff_charset(content_type, head)
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        extractor.feed(decoder.decode(head))
+    extractor.feed(decoder.decode(b'', final=True))
+    text = extractor.finish()
+    return {
+        'text': text,
+        'mentions': extractor.mentions,
+        'links': extractor.links,
+        'encoding': encoding,
+        'bytes': received,
+        'truncated': truncated
+    }
+
+
+def read_capped(chunks, max_bytes: int = DEFAULT_MAX_BYTES) -> bytes:
+    """청크 스트림을 max_bytes까지만 모음 (sitemap.xml 등)"""
+    parts = []
+    received = 0
+    for chunk in chunks:
+        parts.append(chunk[:max_bytes - received])
+        received += len(parts[-1])
+        if received >= max_bytes:
+            break
+    return b''.join(parts)
@@ -0,0 +1,163 @@
+"""
+스크래핑 HTML 파싱 프로세스 풀
+
+HTML 파싱 / 텍스트 추출 / ISO 스캔은 순수 파이썬 CPU 작업이라 웹 요청 스레드에서 실행하면 GIL을 잡고 있는 동안
+같은 워커의 다른 요청(매칭 조회, 상태 폴링 등)이 함께 멈춥니다. 고정 개수의 ProcessPoolExecutor에서 실행하고
+결과(본문 앞부분, 언급 목록, 링크)만 돌려받습니다.
+
+- 워커 수 고정 (SCRAPE_PARSE_WORKERS, 0 = 풀 없이 요청 스레드에서 스트리밍 파싱 - Vercel 기본값)
+- 대기 작업 수 제한 (워커 수 x PENDING_PER_WORKER) - 빈 자리를 timeout 동안 기다리고 넘기면 ParseTimeout
+- 작업별 제한시간 (SCRAPE_PARSE_TIMEOUT, 호출자의 남은 예산과 작은 쪽) - 넘기면 결과를 버리고 ParseTimeout
+- 워커 프로세스가 죽으면 (BrokenProcessPool) 다음 호출에서 풀을 다시 만듦
+- 풀을 만들 수 없는 환경(세마포어 미지원 등)에서는 요청 스레드에서 파싱
+
+풀을 쓰면 본문은 스트림에서 max_bytes까지 받은 뒤 한 번에 워커로 넘깁니다.
+워커 프로세스는 forkserver(없으면 spawn)로 시작하므로 요청 스레드가 잡고 있던 락을 물려받지 않습니다.
+(multiprocessing 규칙대로 워커가 실행 스크립트를 __mp_main__으로 다시 import하므로 스크립트 실행 코드는
+if __name__ == '__main__' 아래에 있어야 합니다 - index.py의 app.run)
+"""
+
+import os
+import site
+import threading
+import multiprocessing
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import page_text
+
+# 워커 프로세스에서 'services.page_text'를 import할 수 있도록 sys.path에 추가할 api/ 경로
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ParseTimeout(TimeoutError):
+    """제한시간 안에 파싱 결과를 받지 못함 (대기열 가득 참 포함)"""
+
+
+def _context():
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    # services 패키지 import(1초 이상)는 forkserver에서 한 번만 하고 워커는 그 상태로 fork
+    context.set_forkserver_preload([page_text.__name__])
+    return context
+
+
+class ParsePool:
+    """고정 크기 HTML 파싱 프로세스 풀"""
+
+    DEFAULT_WORKERS = 2
+    DEFAULT_TIMEOUT = 10.0
+    PENDING_PER_WORKER = 2
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers: int = None, timeout: float = None):
+        """
+        Args:
+            workers: 파싱 프로세스 수 (0이면 요청 스레드에서 파싱)
+            timeout: 작업 하나의 최대 대기 시간 (초, 대기열 자리 대기 포함)
+        """
+        self.workers = self.DEFAULT_WORKERS if workers is None else max(0, workers)
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self._slots = threading.BoundedSemaphore(max(1, self.workers * self.PENDING_PER_WORKER))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._stats = {'parsed': 0, 'inline': 0, 'timeouts': 0, 'errors': 0}
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정으로 생성 (SCRAPE_PARSE_WORKERS - Vercel 기본값 0, SCRAPE_PARSE_TIMEOUT)"""
+        workers = os.environ.get('SCRAPE_PARSE_WORKERS', '0' if os.environ.get('VERCEL') else '')
+        timeout = os.environ.get('SCRAPE_PARSE_TIMEOUT')
+        return cls(workers=int(workers) if workers else None, timeout=float(timeout) if timeout else None)
+
+    @classmethod
+    def shared(cls):
+        """프로세스 공용 풀 (SiteCrawler 기본값)"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.from_env()
+            return cls._shared
+
+    def _pool(self):
+        """실행기 (처음 호출 시 생성, 만들 수 없으면 None -> 인라인 파싱)"""
+        with self._lock:
+            if self._executor is None and self.workers > 0:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=_context(),
+                        initializer=site.addsitedir, initargs=(API_DIR,)
+                    )
+                except (OSError, NotImplementedError, ImportError) as e:
+                    print(f"[Scrape] 파싱 프로세스 풀을 만들 수 없어 요청 스레드에서 파싱합니다: {e}")
+                    self.workers = 0
+            return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def extract(self, chunks, content_type: str = None, timeout: float = None,
+                max_bytes: int = page_text.DEFAULT_MAX_BYTES, **options) -> dict:
+        """
+        page_text.extract를 워커 프로세스에서 실행 (옵션은 page_text.extract와 같음, scan은 모듈 함수여야 함)
+
+        Args:
+            chunks: 응답 본문 바이트 청크
+            timeout: 이 호출의 제한시간 (초, 기본 timeout과 작은 쪽)
+
+        Raises:
+            ParseTimeout: 대기열 자리 / 결과를 제한시간 안에 받지 못함
+        """
+        executor = self._pool()
+        if executor is None:
+            self._count('inline')
+            return page_text.extract(chunks, content_type, max_bytes=max_bytes, **options)
+
+        data = page_text.read_capped(chunks, max_bytes)
+        timeout = self.timeout if timeout is None else max(0.0, min(timeout, self.timeout))
+        if not self._slots.acquire(timeout=timeout):
+            self._count('timeouts')
+            raise ParseTimeout("HTML parse queue is full")
+        try:
+            future = executor.submit(page_text.extract, [data], content_type, max_bytes=max_bytes, **options)
+        except (BrokenProcessPool, RuntimeError):
+            self._slots.release()
+            self._reset(executor)
+            self._count('inline')
+            return page_text.extract([data], content_type, max_bytes=max_bytes, **options)
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            result = future.result(timeout=timeout)
+        except futures.TimeoutError:
+            # 실행 중인 작업은 멈출 수 없음 - 대기열 자리는 작업이 끝날 때 반환됨
+            future.cancel()
+            self._count('timeouts')
+            raise ParseTimeout(f"HTML parse took longer than {timeout:.1f}s")
+        except BrokenProcessPool:
+            self._reset(executor)
+            self._count('errors')
+            raise
+        self._count('parsed')
+        return result
+
+    def stats(self) -> dict:
+        """workers / parsed / inline / timeouts / errors"""
+        with self._lock:
+            return dict(self._stats, workers=self.workers)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,218 @@
+"""
+한국 행정구역(시/도, 시/군/구) 사전과 지역 근접도
+
+- 17개 시/도와 별칭(정식 명칭, 약칭, 구 명칭, 영문), 시/도별 시/군/구 목록
+- 시/도 인접 관계(육로 경계)와 BFS로 미리 계산한 거리 단계(TIERS)
+- 자유 입력 문자열("서울 강남구", "경기도 성남시 분당구 ...", "Busan", "전국")을 (시/도, 시/군/구)로 변환
+
+지역은 (시/도 약칭, 시/군/구 또는 None) 튜플로 표현합니다. (JSON 저장 시 리스트로 바뀌어도 그대로 동작)
+"""
+
+from functools import lru_cache
+from collections import deque
+
+NATIONWIDE = '전국'
+NATIONWIDE_ALIASES = ('전국', '전지역', '전 지역', 'nationwide', 'all', 'korea', '全国')
+
+# 시/도 약칭 -> (별칭, 시/군/구 목록)
+PROVINCES = {
+    '서울': (('서울특별시', '서울시', 'seoul'),
+           ('종로구', '중구', '용산구', '성동구', '광진구', '동대문구', '중랑구', '성북구', '강북구', '도봉구',
+            '노원구', '은평구', '서대문구', '마포구', '양천구', '강서구', '구로구', '금천구', '영등포구', '동작구',
+            '관악구', '서초구', '강남구', '송파구', '강동구')),
+    '부산': (('부산광역시', '부산시', 'busan'),
+           ('중구', '서구', '동구', '영도구', '부산진구', '동래구', '남구', '북구', '해운대구', '사하구',
+            '금정구', '강서구', '연제구', '수영구', '사상구', '기장군')),
+    '대구': (('대구광역시', '대구시', 'daegu'),
+           ('중구', '동구', '서구', '남구', '북구', '수성구', '달서구', '달성군', '군위군')),
+    '인천': (('인천광역시', '인천시', 'incheon'),
+           ('중구', '동구', '미추홀구', '연수구', '남동구', '부평구', '계양구', '서구', '강화군', '옹진군')),
+    '광주': (('광주광역시', 'gwangju'),
+           ('동구', '서구', '남구', '북구', '광산구')),
+    '대전': (('대전광역시', '대전시', 'daejeon'),
+           ('동구', '중구', '서구', '유성구', '대덕구')),
+    '울산': (('울산광역시', '울산시', 'ulsan'),
+           ('중구', '남구', '동구', '북구', '울주군')),
+    '세종': (('세종특별자치시', '세종시', 'sejong'),
+           ()),
+    '경기': (('경기도', 'gyeonggi', 'gyeonggi-do'),
+           ('수원시', '성남시', '의정부시', '안양시', '부천시', '광명시', '평택시', '동두천시', '안산시', '고양시',
+            '과천시', '구리시', '남양주시', '오산시', '시흥시', '군포시', '의왕시', '하남시', '용인시', '파주시',
+            '이천시', '안성시', '김포시', '화성시', '광주시', '양주시', '포천시', '여주시', '연천군', '가평군',
+            '양평군')),
+    '강원': (('강원특별자치도', '강원도', 'gangwon', 'gangwon-do'),
+           ('춘천시', '원주시', '강릉시', '동해시', '태백시', '속초시', '삼척시', '홍천군', '횡성군', '영월군',
+            '평창군', '정선군', '철원군', '화천군', '양구군', '인제군', '고성군', '양양군')),
+    '충북': (('충청북도', 'chungbuk', 'chungcheongbuk-do'),
+           ('청주시', '충주시', '제천시', '보은군', '옥천군', '영동군', '증평군', '진천군', '괴산군', '음성군',
+            '단양군')),
+    '충남': (('충청남도', 'chungnam', 'chungcheongnam-do'),
+           ('천안시', '공주시', '보령시', '아산시', '서산시', '논산시', '계룡시', '당진시', '금산군', '부여군',
+            '서천군', '청양군', '홍성군', '예산군', '태안군')),
+    '전북': (('전북특별자치도', '전라북도', 'jeonbuk', 'jeollabuk-do'),
+           ('전주시', '군산시', '익산시', '정읍시', '남원시', '김제시', '완주군', '진안군', '무주군', '장수군',
+            '임실군', '순창군', '고창군', '부안군')),
+    '전남': (('전라남도', 'jeonnam', 'jeollanam-do'),
+           ('목포시', '여수시', '순천시', '나주시', '광양시', '담양군', '곡성군', '구례군', '고흥군', '보성군',
+            '화순군', '장흥군', '강진군', '해남군', '영암군', '무안군', '함평군', '영광군', '장성군', '완도군',
+            '진도군', '신안군')),
+    '경북': (('경상북도', 'gyeongbuk', 'gyeongsangbuk-do'),
+           ('포항시', '경주시', '김천시', '안동시', '구미시', '영주시', '영천시', '상주시', '문경시', '경산시',
+            '의성군', '청송군', '영양군', '영덕군', '청도군', '고령군', '성주군', '칠곡군', '예천군', '봉화군',
+            '울진군', '울릉군')),
+    '경남': (('경상남도', 'gyeongnam', 'gyeongsangnam-do'),
+           ('창원시', '진주시', '통영시', '사천시', '김해시', '밀양시', '거제시', '양산시', '의령군', '함안군',
+            '창녕군', '고성군', '남해군', '하동군', '산청군', '함양군', '거창군', '합천군')),
+    '제주': (('제주특별자치도', '제주도', 'jeju', 'jeju-do'),
+           ('제주시', '서귀포시')),
+}
+
+# 시/도 육로 경계
+ADJACENCY = {
+    '서울': ('경기', '인천'),
+    '인천': ('서울', '경기'),
+    '경기': ('서울', '인천', '강원', '충북', '충남'),
+    '강원': ('경기', '충북', '경북'),
+    '충북': ('경기', '강원', '경북', '전북', '충남', '대전', '세종'),
+    '충남': ('경기', '충북', '전북', '대전', '세종'),
+    '대전': ('충북', '충남', '세종'),
+    '세종': ('충북', '충남', '대전'),
+    '전북': ('충북', '충남', '경북', '경남', '전남'),
+    '전남': ('전북', '광주', '경남'),
+    '광주': ('전남',),
+    '경북': ('강원', '충북', '전북', '경남', '대구', '울산'),
+    '대구': ('경북', '경남'),
+    '울산': ('경북', '경남', '부산'),
+    '경남': ('전북', '전남', '경북', '대구', '울산', '부산'),
+    '부산': ('경남', '울산'),
+    '제주': (),
+}
+
+# 거리 단계: 0 같은 시/군/구, 1 같은 시/도, 2 인접 시/도(또는 전국 활동), 3 두 단계 이내, 4 그 외
+TIER_DISTRICT, TIER_PROVINCE, TIER_ADJACENT, TIER_NEAR, TIER_FAR = 0, 1, 2, 3, 4
+# 지역 정보가 없거나 해석할 수 없는 컨설턴트 (필터/가점 대상 아님)
+TIER_UNKNOWN = 9
+
+# 지역 근접 가점 (최대 10)
+TIER_POINTS = {TIER_DISTRICT: 10, TIER_PROVINCE: 8, TIER_ADJACENT: 5, TIER_NEAR: 2}
+
+PROVINCE_NAMES = tuple(PROVINCES)
+PROVINCE_INDEX = {name: i for i, name in enumerate(PROVINCE_NAMES)}
+
+
+def _hops(start):
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for neighbor in ADJACENCY[current]:
+            if neighbor not in distances:
+                distances[neighbor] = distances[current] + 1
+                queue.append(neighbor)
+    return distances
+
+
+def _province_tier(hops):
+    if hops is None:
+        return TIER_FAR
+    return (TIER_PROVINCE, TIER_ADJACENT, TIER_NEAR)[hops] if hops <= 2 else TIER_FAR
+
+
+# TIERS[target 시/도][consultant 시/도] (같은 시/도는 TIER_PROVINCE, 시/군/구 일치는 호출 측에서 판단)
+TIERS = {
+    target: {other: _province_tier(_hops(target).get(other)) for other in PROVINCE_NAMES}
+    for target in PROVINCE_NAMES
+}
+
+_PROVINCE_ALIASES = {}
+for _name, (_aliases, _) in PROVINCES.items():
+    for _alias in (_name,) + _aliases:
+        _PROVINCE_ALIASES[_alias.lower()] = _name
+
+# 시/군/구 이름 -> 시/도 목록 (중구/동구/고성군 등은 여러 시/도에 존재)
+_DISTRICTS = {}
+for _name, (_, _districts) in PROVINCES.items():
+    for _district in _districts:
+        for _key in {_district, _district[:-1] if len(_district) > 2 else _district}:
+            _DISTRICTS.setdefault(_key, [])
+            if (_name, _district) not in _DISTRICTS[_key]:
+                _DISTRICTS[_key].append((_name, _district))
+
+
+@lru_cache(maxsize=4096)
+def resolve(text):
+    """
+    자유 입력 지역 문자열을 (시/도, 시/군/구 또는 None)으로 변환
+
+    Returns:
+        (시/도 약칭, 시/군/구) / (NATIONWIDE, None) / 해석 불가 시 None
+    """
+    if not text or not isinstance(text, str):
+        return None
+    cleaned = text.strip()
+    if not cleaned:
+        return None
+    if cleaned.lower() in NATIONWIDE_ALIASES:
+        return (NATIONWIDE, None)
+
+    tokens = cleaned.replace(',', ' ').split()
+    # 주소 앞에 우편번호 등이 붙는 경우를 위해 앞쪽 몇 개 토큰에서 시/도를 찾음
+    for i, token in enumerate(tokens[:3]):
+        province = _PROVINCE_ALIASES.get(token.lower())
+        if province is None:
+            continue
+        for next_token in tokens[i + 1:i + 3]:
+            for candidate_province, district in _DISTRICTS.get(next_token, ()):
+                if candidate_province == province:
+                    return (province, district)
+        return (province, None)
+
+    # 시/도 없이 시/군/구만 입력된 경우 - 한 시/도에만 있는 이름일 때만 해석
+    matches = _DISTRICTS.get(tokens[0], ())
+    if len(matches) == 1:
+        return matches[0]
+    return None
+
+
+def resolve_all(terms):
+    """여러 지역 문자열 -> 해석된 지역 목록 (해석 불가 항목 제외, 중복 제거)"""
+    resolved = []
+    for term in terms:
+        region = resolve(term)
+        if region is not None and region not in resolved:
+            resolved.append(region)
+    return resolved
+
+
+def split_regions(value):
+    """Consultant.regions (쉼표 구분) -> 문자열 튜플"""
+    return tuple(dict.fromkeys(r.strip() for r in (value or '').split(',') if r.strip()))
+
+
+def tier(region, target):
+    """컨설턴트 활동 지역 하나와 대상 지역 사이의 거리 단계"""
+    if region is None or target is None:
+        return TIER_UNKNOWN
+    if region[0] == NATIONWIDE:
+        return TIER_ADJACENT
+    if target[0] == NATIONWIDE:
+        return TIER_UNKNOWN
+    if region[0] == target[0]:
+        if region[1] and target[1] and region[1] == target[1]:
+            return TIER_DISTRICT
+        return TIER_PROVINCE
+    return TIERS[target[0]][region[0]]
+
+
+def best_tier(terms, target):
+    """컨설턴트 활동 지역 문자열들 중 대상 지역과 가장 가까운 단계 (해석 가능한 지역이 없으면 TIER_UNKNOWN)"""
+    best = TIER_UNKNOWN
+    for term in terms:
+        best = min(best, tier(resolve(term), target))
+    return best
+
+
+def region_label(target):
+    if target is None:
+        return ''
+    return f"{target[0]} {target[1]}" if target[1] else target[0]
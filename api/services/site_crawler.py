@@ -0,0 +1,301 @@
+"""
+기업 웹사이트 ISO 인증 근거 크롤러
+
+메인 페이지의 첫 번째 인증 링크 하나만 보던 방식은 다른 페이지(회사소개 > 인증현황, 품질경영 등)에 있는
+인증을 놓칩니다. 직렬로 여러 페이지를 받으면 분석이 느려지므로 제한된 동시 크롤링을 합니다.
+
+1. 메인 페이지와 /sitemap.xml을 동시에 조회 (sitemap index면 키워드 점수가 높은 하위 sitemap 몇 개까지)
+2. 같은 사이트 링크 + sitemap URL을 키워드 점수(링크 텍스트/URL의 인증 관련 단어 가중치 합)로 정렬
+3. 점수 상위 max_pages개를 concurrency개씩 동시에 조회 - 전체 시간 예산(time_budget)을 넘기면 남은 페이지는 버림
+4. 페이지별 ISO 언급(정규 코드), 인증번호, 유효기간을 모아 언급마다 발견된 URL을 함께 반환 (iso_scanner)
+
+페이지 본문은 스트리밍으로 max_bytes까지만 받아 page_text로 바로 텍스트를 뽑습니다 (전체 HTML / DOM 트리를 만들지 않음).
+파싱은 ParsePool 워커 프로세스에서 실행되어 요청 스레드가 GIL을 오래 잡지 않습니다.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlsplit, urldefrag
+
+from . import page_text, iso_scanner
+from .http_client import HttpClient
+from .parse_pool import ParsePool
+
+# 링크 텍스트 / URL에 포함되면 인증 페이지일 가능성이 높은 단어와 가중치
+CERT_KEYWORDS = {
+    '인증': 3, 'certif': 3, 'iso': 3, '경영시스템': 3,
+    '품질': 2, 'quality': 2, '환경': 1, 'environment': 1, '안전': 1, 'safety': 1,
+    '회사소개': 1, 'about': 1, 'company': 1, 'award': 1, '수상': 1,
+}
+
+# HTML이 아닌 링크는 받지 않음
+SKIP_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.zip', '.hwp', '.doc', '.docx',
+                   '.xls', '.xlsx', '.ppt', '.pptx', '.mp4', '.css', '.js', '.xml')
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+_KEYWORDS = re.compile('|'.join(re.escape(k) for k in sorted(CERT_KEYWORDS, key=len, reverse=True)))
+_LOC = re.compile(r'<loc>\s*(.*?)\s*</loc>', re.IGNORECASE | re.DOTALL)
+
+
+def keyword_score(*texts) -> int:
+    """링크 텍스트 / URL의 인증 키워드 가중치 합"""
+    joined = ' '.join(t.lower() for t in texts if t)
+    return sum(CERT_KEYWORDS[keyword] for keyword in set(_KEYWORDS.findall(joined)))
+
+
+def _site(netloc: str) -> str:
+    netloc = netloc.lower().split(':')[0]
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+class SiteCrawler:
+    """제한된 동시 다중 페이지 ISO 근거 크롤러"""
+
+    DEFAULT_MAX_PAGES = 6
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_TIME_BUDGET = 15.0
+    DEFAULT_PAGE_TIMEOUT = 5.0
+    DEFAULT_MAX_BYTES = 1024 * 1024
+    CHUNK_SIZE = 16384
+    PREVIEW_CHARS = 1500
+    MAX_SITEMAPS = 3
+    MAX_SITEMAP_URLS = 5000
+
+    def __init__(self, http: HttpClient = None, max_pages: int = None, concurrency: int = None,
+                 time_budget: float = None, page_timeout: float = None, max_bytes: int = None,
+                 parser: ParsePool = None, clock=time.monotonic):
+        """
+        Args:
+            http: 공용 HTTP 클라이언트 (기본: HttpClient.shared())
+            max_pages: 메인 페이지 외에 조회할 최대 후보 페이지 수
+            concurrency: 동시 조회 수
+            time_budget: 사이트 하나의 전체 크롤링 제한시간 (초)
+            page_timeout: 페이지 하나의 응답 제한시간 (초, 남은 예산과 작은 쪽)
+            max_bytes: 페이지 하나에서 읽을 최대 바이트 수 (넘는 부분은 받지 않음)
+            parser: HTML 파싱 프로세스 풀 (기본: ParsePool.shared())
+            clock: 단조 시계 함수 (테스트용)
+        """
+        self.http = http if http is not None else HttpClient.shared()
+        self.max_pages = self.DEFAULT_MAX_PAGES if max_pages is None else max_pages
+        self.concurrency = concurrency or self.DEFAULT_CONCURRENCY
+        self.time_budget = time_budget or self.DEFAULT_TIME_BUDGET
+        self.page_timeout = page_timeout or self.DEFAULT_PAGE_TIMEOUT
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        self.parser = parser if parser is not None else ParsePool.shared()
+        self.clock = clock
+
+    @classmethod
+    def from_env(cls, http: HttpClient = None, parser: ParsePool = None):
+        """
+        환경변수 설정으로 생성
+        (SCRAPE_MAX_PAGES, SCRAPE_CONCURRENCY, SCRAPE_TIME_BUDGET, SCRAPE_PAGE_TIMEOUT, SCRAPE_MAX_BYTES)
+        """
+        def number(name, cast):
+            value = os.environ.get(name)
+            return cast(value) if value else None
+
+        return cls(
+            http=http,
+            parser=parser,
+            max_pages=number('SCRAPE_MAX_PAGES', int),
+            concurrency=number('SCRAPE_CONCURRENCY', int),
+            time_budget=number('SCRAPE_TIME_BUDGET', float),
+            page_timeout=number('SCRAPE_PAGE_TIMEOUT', float),
+            max_bytes=number('SCRAPE_MAX_BYTES', int)
+        )
+
+    def crawl(self, url: str) -> dict:
+        """
+        Returns:
+            {
+                'site_content': 메인 페이지 본문 앞부분,
+                'iso_mentions': 중복 제거 후 정렬한 ISO 정규 코드 목록,
+                'iso_sources': {코드: [발견된 URL, ...]},
+                'certificate_numbers': 인증번호 목록,
+                'expiry_dates': 유효기간 만료일 목록 (YYYY-MM-DD),
+                'certification_page_found': 인증 관련 후보 페이지 존재 여부,
+                'pages_fetched': 조회에 성공한 페이지 수
+            }
+
+        Raises:
+            requests.exceptions.RequestException: 메인 페이지 조회 실패
+        """
+        if not url.startswith('http'):
+            url = 'https://' + url
+        deadline = self.clock() + self.time_budget
+        result = {
+            'site_content': '',
+            'iso_mentions': [],
+            'iso_sources': {},
+            'certificate_numbers': [],
+            'expiry_dates': [],
+            'certification_page_found': False,
+            'pages_fetched': 0
+        }
+        sources = {}
+        found = {'cert_no': set(), 'expiry': set()}
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            sitemap_future = executor.submit(self._sitemap_urls, url, deadline)
+            home = self._get(url, deadline, home=True)
+            if home is None:
+                sitemap_future.cancel()
+                return result
+            home_url, page = home
+            result['site_content'] = page['text']
+            result['pages_fetched'] = 1
+            self._collect(sources, found, home_url, page['mentions'])
+
+            candidates = self._candidates(home_url, page['links'], self._wait_result(sitemap_future, deadline) or [])
+            result['certification_page_found'] = bool(candidates)
+            pages = [candidate_url for candidate_url, _ in candidates[:self.max_pages]]
+            for page_url, hits in self._fetch_all(executor, pages, deadline):
+                result['pages_fetched'] += 1
+                self._collect(sources, found, page_url, hits)
+        finally:
+            # 예산을 넘긴 요청은 기다리지 않음 (HTTP timeout으로 곧 종료됨)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        result['iso_mentions'] = sorted(sources)
+        result['iso_sources'] = {code: sorted(urls) for code, urls in sorted(sources.items())}
+        result['certificate_numbers'] = sorted(found['cert_no'])
+        result['expiry_dates'] = sorted(found['expiry'])
+        return result
+
+    def _collect(self, sources: dict, found: dict, page_url: str, hits):
+        for kind, value in hits:
+            if kind == 'iso':
+                sources.setdefault(value, set()).add(page_url)
+            else:
+                found[kind].add(value)
+
+    def _remaining(self, deadline: float) -> float:
+        return deadline - self.clock()
+
+    def _chunks(self, response, deadline: float):
+        """본문 청크 - 시간 예산을 넘기면 읽기 중단"""
+        for chunk in response.iter_content(self.CHUNK_SIZE):
+            yield chunk
+            if self._remaining(deadline) <= 0:
+                break
+
+    def _get(self, url: str, deadline: float, home: bool = False):
+        """
+        (최종 URL, page_text.extract 결과) - 200이 아니거나 HTML이 아니면 None
+
+        메인 페이지(home)는 본문 앞부분과 링크를, 후보 페이지는 언급만 모읍니다.
+        """
+        remaining = self._remaining(deadline)
+        if remaining <= 0:
+            return None
+        with self.http.stream(url, headers=HEADERS, timeout=min(self.page_timeout, remaining)) as response:
+            if response.status_code != 200:
+                return None
+            content_type = response.headers.get('Content-Type', 'text/html')
+            if 'html' not in content_type:
+                return None
+            page = self.parser.extract(self._chunks(response, deadline), content_type,
+                                       timeout=self._remaining(deadline), scan=iso_scanner.scan,
+                                       preview_chars=self.PREVIEW_CHARS if home else 0,
+                                       max_bytes=self.max_bytes, collect_links=home)
+            return response.url or url, page
+
+    def _get_xml(self, url: str, deadline: float):
+        """sitemap 본문 (max_bytes까지) - 200이 아니면 None"""
+        remaining = self._remaining(deadline)
+        if remaining <= 0:
+            return None
+        with self.http.stream(url, headers=HEADERS, timeout=min(self.page_timeout, remaining)) as response:
+            if response.status_code != 200:
+                return None
+            data = page_text.read_capped(self._chunks(response, deadline), self.max_bytes)
+            encoding = page_text.sniff_charset(response.headers.get('Content-Type', ''), data)
+            return data.decode(encoding, errors='replace')
+
+    def _fetch_page(self, url: str, deadline: float):
+        """후보 페이지 하나 -> (URL, iso_scanner.scan 결과) 또는 None (실패는 무시)"""
+        try:
+            page = self._get(url, deadline)
+        except Exception as e:
+            print(f"[Scrape] 페이지 조회 실패 {url}: {e}")
+            return None
+        if page is None:
+            return None
+        return url, page[1]['mentions']
+
+    def _fetch_all(self, executor, urls, deadline):
+        """후보 페이지 동시 조회 - 예산 안에 끝난 결과만 (완료 순)"""
+        pending = {executor.submit(self._fetch_page, page_url, deadline) for page_url in urls}
+        while pending:
+            remaining = self._remaining(deadline)
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                page = future.result()
+                if page is not None:
+                    yield page
+        for future in pending:
+            future.cancel()
+        if pending:
+            print(f"[Scrape] 시간 예산 초과 - {len(pending)}개 페이지 건너뜀")
+
+    def _wait_result(self, future, deadline):
+        remaining = self._remaining(deadline)
+        if remaining <= 0:
+            future.cancel()
+            return None
+        done, _ = wait([future], timeout=remaining)
+        if not done:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"[Scrape] sitemap 조회 실패: {e}")
+            return None
+
+    def _sitemap_urls(self, url: str, deadline: float) -> list:
+        """/sitemap.xml의 URL 목록 (sitemap index면 점수 높은 하위 sitemap MAX_SITEMAPS개)"""
+        parts = urlsplit(url)
+        xml = self._get_xml(f"{parts.scheme}://{parts.netloc}/sitemap.xml", deadline)
+        if xml is None:
+            return []
+        locs = _LOC.findall(xml)[:self.MAX_SITEMAP_URLS]
+        children = [loc for loc in locs if loc.lower().endswith('.xml')]
+        urls = [loc for loc in locs if not loc.lower().endswith('.xml')]
+        for child in sorted(children, key=lambda loc: -keyword_score(loc))[:self.MAX_SITEMAPS]:
+            child_xml = self._get_xml(child, deadline)
+            if child_xml is not None:
+                urls.extend(_LOC.findall(child_xml)[:self.MAX_SITEMAP_URLS - len(urls)])
+        return urls
+
+    def _candidates(self, home_url: str, links, sitemap_urls) -> list:
+        """
+        같은 사이트의 인증 관련 후보 페이지
+
+        Returns:
+            [(URL, 점수)] 점수 내림차순 (동점은 경로가 짧은 순 - 상위 메뉴 페이지 우선)
+        """
+        site = _site(urlsplit(home_url).netloc)
+        home = urldefrag(home_url)[0].rstrip('/')
+        scores = {}
+        for href, text in list(links) + [(loc, '') for loc in sitemap_urls]:
+            href = href.strip()
+            if not href or href.lower().startswith(('mailto:', 'javascript:', 'tel:', '#')):
+                continue
+            absolute = urldefrag(urljoin(home_url, href))[0]
+            parts = urlsplit(absolute)
+            if parts.scheme not in ('http', 'https') or _site(parts.netloc) != site:
+                continue
+            if parts.path.lower().endswith(SKIP_EXTENSIONS) or absolute.rstrip('/') == home:
+                continue
+            score = keyword_score(text, parts.path, parts.query)
+            if score > scores.get(absolute, 0):
+                scores[absolute] = score
+        return sorted(scores.items(), key=lambda item: (-item[1], len(item[0]), item[0]))
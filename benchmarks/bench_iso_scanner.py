@@ -0,0 +1,125 @@
+"""
+ISO 언급 스캐너 벤치마크 (패턴별 re.findall vs iso_scanner 한 번 훑기)
+
+합성 기업 웹페이지 본문(한글/영문 문장 + 인증 언급 / 인증번호 / 유효기간)을 크기별로 만들어
+기존 방식(패턴 10개 각각 re.findall)과 iso_scanner.scan의 페이지당 시간, 처리량을 비교합니다.
+링크 후보 점수(keyword_score)도 키워드별 부분 문자열 검사와 합친 정규식을 비교합니다.
+
+기존 방식이 찾은 언급을 정규화한 코드가 모두 scanner 결과에 있는지도 확인합니다.
+
+Usage:
+    python benchmarks/bench_iso_scanner.py
+    python benchmarks/bench_iso_scanner.py --sizes 20000,200000 --repeat 20
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api'))
+
+from services import iso_scanner
+from services.iso_registry import normalize
+from services.site_crawler import CERT_KEYWORDS, keyword_score
+
+# 이전 site_crawler의 패턴 목록
+LEGACY_PATTERNS = [
+    r'ISO\s*9001', r'ISO\s*14001', r'ISO\s*45001', r'ISO\s*27001', r'ISO\s*13485', r'IATF\s*16949',
+    r'품질경영시스템', r'환경경영시스템', r'안전보건경영시스템', r'정보보안경영시스템',
+]
+LEGACY_NAMES = {'품질경영시스템': 'ISO 9001', '환경경영시스템': 'ISO 14001', '안전보건경영시스템': 'ISO 45001',
+                '정보보안경영시스템': 'ISO 27001'}
+
+FILLER = ('당사는 고객 만족을 최우선으로 정밀 부품을 생산합니다', '제품 소개', '회사 연혁', '오시는 길', '고객센터',
+          '공지사항', '채용 정보', '사업 분야', '연구 개발', '품질 관리', 'Copyright 2024 All rights reserved',
+          'Our products are shipped worldwide', 'Contact us', '자동차 부품', '반도체 장비', '가공 설비 현황',
+          '서울특별시 강남구 테헤란로 123', 'TEL 02-123-4567', 'FAX 02-765-4321', '개인정보처리방침')
+MENTIONS = ('ISO 9001:2015 인증 획득', 'ISO14001 환경경영시스템', 'KS Q ISO 45001 안전보건경영시스템',
+            'ISO/IEC 27001:2022', 'IATF 16949', '의료기기 품질경영시스템 ISO 13485', 'ISO 9001, 14001 및 45001',
+            'Quality Management System certified', '인증번호: QMS-2021-0077', '유효기간 2024.05.01 ~ 2027.04.30')
+
+
+def synthetic_page(size, seed=11, density=0.02):
+    """본문 텍스트 size자 (density 비율의 조각이 인증 관련)"""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        part = rng.choice(MENTIONS) if rng.random() < density else rng.choice(FILLER)
+        parts.append(part)
+        length += len(part) + 1
+    return ' '.join(parts)[:size]
+
+
+def legacy_scan(text):
+    mentions = []
+    for pattern in LEGACY_PATTERNS:
+        mentions.extend(re.findall(pattern, text, re.IGNORECASE))
+    return mentions
+
+
+def legacy_keyword_score(*texts):
+    joined = ' '.join(t.lower() for t in texts if t)
+    return sum(weight for keyword, weight in CERT_KEYWORDS.items() if keyword in joined)
+
+
+def timed(func, arg, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(arg)
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def run_pages(size, repeat):
+    text = synthetic_page(size)
+    legacy, legacy_ms = timed(legacy_scan, text, repeat)
+    hits, scanner_ms = timed(iso_scanner.scan, text, repeat)
+
+    legacy_codes = {LEGACY_NAMES.get(m) or normalize(m) for m in legacy}
+    codes = {value for kind, value in hits if kind == 'iso'}
+    covered = legacy_codes <= codes
+    mb = len(text.encode('utf-8')) / 1e6
+    print(f"  {size:>9,} chars  legacy {legacy_ms:8.2f}ms ({mb / legacy_ms * 1000:6.1f} MB/s)  "
+          f"scanner {scanner_ms:8.2f}ms ({mb / scanner_ms * 1000:6.1f} MB/s)  "
+          f"codes {len(legacy_codes)} -> {len(codes)}  cert_no/expiry "
+          f"{sum(k != 'iso' for k, _ in hits)}  covered: {covered}")
+    return covered
+
+
+def run_links(count, repeat):
+    rng = random.Random(5)
+    words = ('회사소개', '인증현황', 'product', 'news', 'board', 'quality', 'about', 'recruit', '수상내역', 'contact')
+    links = [(rng.choice(words), f"/{rng.choice(words)}/{i}?page={i % 7}") for i in range(count)]
+
+    def score(func):
+        return [func(text, href) for text, href in links]
+
+    legacy, legacy_ms = timed(lambda _: score(legacy_keyword_score), None, repeat)
+    current, current_ms = timed(lambda _: score(keyword_score), None, repeat)
+    print(f"  {count:>9,} links  legacy {legacy_ms:8.2f}ms  compiled {current_ms:8.2f}ms  "
+          f"identical: {legacy == current}")
+    return legacy == current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='5000,50000,500000,2000000')
+    parser.add_argument('--links', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print("[Bench] page text scan (median)")
+    ok = all([run_pages(int(size), args.repeat) for size in args.sizes.split(',')])
+    print("[Bench] link keyword score (median)")
+    ok = run_links(args.links, args.repeat) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+컨설턴트 매칭 엔진 벤치마크 (vector vs 전체 풀 파이썬 채점)
+
+DB 없이 합성 ConsultantRecord(synthetic_pool)로 컬럼형 스냅샷을 만든 뒤
+같은 매칭 조건을 vector 전략과 전체 풀 _score 루프(기존 방식)로 실행하여
+빌드 시간, 요청당 지연 시간, 결과 일치 여부를 출력합니다.
+
+Usage:
+    python benchmarks/bench_matching_engine.py
+    python benchmarks/bench_matching_engine.py --sizes 10000,100000 --queries 50
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.matching_service import MatchingService
+from synthetic_pool import MIXES, records as synthetic_records, criteria
+
+# sql 전략은 DB가 필요하므로 메모리 벤치마크에서 제외 (bench_matching_service.py)
+
+
+def synthetic_criteria(count, seed=7):
+    """조건 종류(synthetic_pool.MIXES)를 번갈아 섞은 매칭 조건"""
+    per_mix = {mix: criteria(mix, count, seed) for mix in MIXES}
+    return [per_mix[MIXES[i % len(MIXES)]][i] for i in range(count)]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(size, queries):
+    started = time.perf_counter()
+    records = list(synthetic_records(size))
+    print(f"\n[Bench] {size:,} consultants (generated in {time.perf_counter() - started:.2f}s)")
+
+    service = MatchingService(index_max_age=float('inf'), strategy='vector', snapshot_dir='', snapshot_store=False)
+    started = time.perf_counter()
+    service.index.build(records)
+    service.ensure_matrix()
+    print(f"  build[vector]: {time.perf_counter() - started:.2f}s")
+
+    def loop(item):
+        # 전체 풀을 _score로 채점 후 정렬 (지역 제외 포함)
+        target = service._parse_criteria(item)
+        scored = sorted((service._score(r, target) for r in records if not service._is_region_excluded(r, target)),
+                        key=lambda x: (-x['score'], x['consultant'].id))
+        return service._results(scored[:20], None)
+
+    criteria = synthetic_criteria(queries)
+    results = {}
+    for name, match in (('vector', service.match_consultants), ('loop', loop)):
+        timings = []
+        outputs = []
+        for item in criteria:
+            started = time.perf_counter()
+            outputs.append(match(item))
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = [[(r['id'], r['matchScore']) for r in output] for output in outputs]
+        print(f"  {name:>6}: p50 {statistics.median(timings):8.2f}ms  "
+              f"p95 {percentile(timings, 95):8.2f}ms  max {max(timings):8.2f}ms")
+
+    identical = results['vector'] == results['loop']
+    print(f"  identical results: {identical}")
+    return identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--queries', type=int, default=20)
+    args = parser.parse_args()
+
+    ok = True
+    for size in (int(s) for s in args.sizes.split(',')):
+        ok = run(size, args.queries) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
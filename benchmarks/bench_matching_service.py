@@ -0,0 +1,212 @@
+"""
+MatchingService 벤치마크 (합성 SQLite 풀, 전략별 지연 시간 / 메모리 / DB 쿼리 수)
+
+크기별로 치우친 분포의 합성 컨설턴트 풀(synthetic_pool)을 SQLite 파일로 만들고,
+전략마다 별도 프로세스에서 match_consultants를 실행합니다. (전략별 최대 RSS를 섞이지 않게 측정)
+
+측정 항목 (전략 x 조건 종류):
+    cold: 첫 매칭 지연 시간(메모리 레코드/스냅샷 빌드 포함)과 DB 쿼리 수
+    p50 / p95 / p99 / 평균 지연 시간 (ms), 매칭당 DB 쿼리 수
+    peak_rss_mb: 프로세스 최대 RSS, rss_delta_mb: 앱 초기화 이후 증가분
+    digest: 전체 결과 순위 해시 (전략끼리 같아야 함)
+
+--output으로 JSON을 저장하고, --baseline으로 이전 결과와 p95를 비교해 --tolerance배를 넘으면 종료 코드 1을 반환합니다.
+
+Usage:
+    python benchmarks/bench_matching_service.py
+    python benchmarks/bench_matching_service.py --sizes 1000,100000 --queries 50 --output bench.json
+    python benchmarks/bench_matching_service.py --sizes 1000000 --strategies vector,sql --baseline bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic_pool
+from bench_matching_engine import percentile
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_worker(path, strategy, mixes, queries):
+    """한 전략을 현재 프로세스에서 측정 (--worker)"""
+    from sqlalchemy import event
+    from models import db
+    from services.matching_service import MatchingService
+
+    app = synthetic_pool.create_app(path)
+    with app.app_context():
+        statements = [0]
+
+        def count(*args):
+            statements[0] += 1
+
+        event.listen(db.engine, 'before_cursor_execute', count)
+        rss_before = peak_rss_mb()
+        service = MatchingService(index_max_age=float('inf'), strategy=strategy, snapshot_dir='', snapshot_store=False)
+
+        started = time.perf_counter()
+        service.match_consultants(synthetic_pool.criteria('full', 1, seed=0)[0])
+        result = {
+            'cold_ms': (time.perf_counter() - started) * 1000,
+            'cold_queries': statements[0],
+            'mixes': {}
+        }
+
+        digest = hashlib.sha1()
+        for mix in mixes:
+            timings, query_counts = [], []
+            for item in synthetic_pool.criteria(mix, queries):
+                before = statements[0]
+                started = time.perf_counter()
+                matches = service.match_consultants(item)
+                timings.append((time.perf_counter() - started) * 1000)
+                query_counts.append(statements[0] - before)
+                digest.update(json.dumps([(m['id'], m['matchScore']) for m in matches]).encode())
+                # 요청마다 세션을 정리하는 웹 요청과 같은 조건
+                db.session.remove()
+            result['mixes'][mix] = {
+                'p50_ms': statistics.median(timings),
+                'p95_ms': percentile(timings, 95),
+                'p99_ms': percentile(timings, 99),
+                'mean_ms': statistics.fmean(timings),
+                'queries_per_match': statistics.fmean(query_counts)
+            }
+        peak = peak_rss_mb()
+        result['peak_rss_mb'] = peak
+        result['rss_delta_mb'] = None if peak is None else peak - rss_before
+        result['digest'] = digest.hexdigest()
+    return result
+
+
+def measure(path, strategy, mixes, queries):
+    """전략별 별도 프로세스에서 run_worker 실행"""
+    spec = json.dumps({'path': path, 'strategy': strategy, 'mixes': list(mixes), 'queries': queries})
+    completed = subprocess.run([sys.executable, '-W', 'ignore', os.path.abspath(__file__), '--worker', spec],
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{strategy} worker failed:\n{completed.stderr}")
+    # 서비스 로그([Match] ...) 뒤 마지막 줄이 결과 JSON
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """
+    이전 결과와 p95 비교
+
+    Returns:
+        tolerance배를 넘게 느려진 (size, strategy, mix, 이전 p95, 현재 p95) 목록
+    """
+    previous = {(r['size'], r['strategy']): r for r in baseline['results']}
+    regressions = []
+    for r in results:
+        old = previous.get((r['size'], r['strategy']))
+        if old is None:
+            continue
+        for mix, stats in r['mixes'].items():
+            old_stats = old['mixes'].get(mix)
+            if old_stats and stats['p95_ms'] > old_stats['p95_ms'] * tolerance:
+                regressions.append((r['size'], r['strategy'], mix, old_stats['p95_ms'], stats['p95_ms']))
+    return regressions
+
+
+def main():
+    from services.matching_service import STRATEGIES
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--strategies', default=','.join(STRATEGIES))
+    parser.add_argument('--mixes', default=','.join(synthetic_pool.MIXES))
+    parser.add_argument('--queries', type=int, default=30, help='조건 종류별 매칭 수')
+    parser.add_argument('--db-dir', default=os.path.join(tempfile.gettempdir(), 'insightmatch-bench'),
+                        help='합성 풀 SQLite 파일 캐시 디렉터리')
+    parser.add_argument('--output', help='결과 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='p95가 baseline의 몇 배를 넘으면 회귀로 볼지')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        spec = json.loads(args.worker)
+        print(json.dumps(run_worker(spec['path'], spec['strategy'], spec['mixes'], spec['queries'])))
+        return
+
+    mixes = args.mixes.split(',')
+    results = []
+    identical = True
+    for size in (int(s) for s in args.sizes.split(',')):
+        started = time.perf_counter()
+        path = synthetic_pool.populate(args.db_dir, size)
+        print(f"\n[Bench] {size:,} consultants ({path}, ready in {time.perf_counter() - started:.2f}s)")
+        digests = set()
+        for strategy in args.strategies.split(','):
+            result = dict(size=size, strategy=strategy, **measure(path, strategy, mixes, args.queries))
+            results.append(result)
+            digests.add(result['digest'])
+            rss = '' if result['peak_rss_mb'] is None else f"  peak RSS {result['peak_rss_mb']:.0f}MB"
+            print(f"  {strategy:>9}: cold {result['cold_ms']:9.1f}ms ({result['cold_queries']} queries){rss}")
+            for mix, stats in result['mixes'].items():
+                print(f"    {mix:>9}: p50 {stats['p50_ms']:8.2f}ms  p95 {stats['p95_ms']:8.2f}ms  "
+                      f"p99 {stats['p99_ms']:8.2f}ms  {stats['queries_per_match']:.1f} queries/match")
+        print(f"  identical results: {len(digests) == 1}")
+        identical = identical and len(digests) == 1
+
+    report = {
+        'meta': {
+            'created_at': datetime.utcnow().isoformat() + 'Z',
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'queries_per_mix': args.queries,
+            'pool_version': synthetic_pool.POOL_VERSION
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n[Bench] results written to {args.output}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for size, strategy, mix, old, new in regressions:
+            print(f"[Bench] REGRESSION {size:,} {strategy}/{mix}: p95 {old:.2f}ms -> {new:.2f}ms")
+        if not regressions:
+            print(f"[Bench] no p95 regressions over {args.tolerance}x baseline")
+    sys.exit(0 if identical and not regressions else 1)
+
+
+if __name__ == '__main__':
+    main()
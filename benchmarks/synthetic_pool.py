@@ -0,0 +1,201 @@
+"""
+벤치마크용 합성 컨설턴트 풀 / 매칭 조건 생성
+
+실제 데이터처럼 분포가 치우치도록 생성합니다.
+- ISO: ISO 9001 > 14001 > 45001 > ... 순의 Zipf 분포, 일부는 '9001', 'ISO 9001:2015' 같은 다른 표기
+- 업종 / 전문분야: Zipf 분포 (제조/IT가 대부분, 식품/물류 등은 꼬리)
+- 활동 지역: 수도권 편중(서울/경기 약 60%), 일부는 시/군/구까지, 5%는 '전국'
+- 신뢰도: Beta(2, 3) * 100, 리뷰 수: 지수 분포
+
+populate()는 같은 (크기, seed) 풀을 SQLite 파일로 만들어 재사용합니다. (join table / consultant_score / consultant_match_key 포함)
+"""
+
+import os
+import sys
+import json
+import random
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api'))
+
+from flask import Flask
+from sqlalchemy import text
+
+from models import db, Consultant, ConsultantMatchKey, consultant_capability_rows
+from services.consultant_index import ConsultantRecord
+from services import regions
+from services.consultant_query import match_keys
+
+# 생성 규칙이 바뀌면 올려서 캐시된 풀 파일을 다시 만듦
+POOL_VERSION = 2
+
+ISO_CODES = ['ISO 9001', 'ISO 14001', 'ISO 45001', 'ISO 27001', 'IATF 16949', 'ISO 13485', 'ISO 50001',
+             'ISO 22000', 'ISO 37001', 'ISO 22301', 'ISO 20000-1', 'ISO 26000', 'ISO 19443', 'ISO 29001']
+ISO_VARIANTS = {'ISO 9001': ['9001', 'ISO 9001:2015', 'KS Q ISO 9001'], 'ISO 14001': ['ISO14001:2015'],
+                'ISO 45001': ['OHSAS 18001'], 'ISO 27001': ['ISO/IEC 27001:2022']}
+INDUSTRIES = ['제조', 'Manufacturing', 'IT/Software', '건설', 'Automotive', '화학', 'Chemical', '반도체',
+              'Service', 'Medical', '의료기기', 'Energy', '식품', 'Food', 'Logistics', '물류/유통', '금융', '교육']
+SPECIALTIES = ['제조/화학', 'IT/서비스', '건설/안전', '식품/유통', '의료기기', '환경/에너지', None]
+PROJECT_TYPES = ['New', 'Transition', 'Integration']
+ROLES = ['Lead Auditor', 'Auditor', 'Consultant', 'Trainer']
+# 시/도별 가중치 (사업체 수 비율을 대략 반영)
+PROVINCE_WEIGHTS = {'서울': 32, '경기': 28, '인천': 5, '부산': 6, '대구': 4, '경남': 5, '경북': 4, '충남': 4,
+                    '대전': 3, '울산': 2, '광주': 2, '충북': 2, '전북': 1, '전남': 1, '강원': 1, '세종': 1, '제주': 1}
+TARGET_REGIONS = ['서울', '서울특별시 강남구 테헤란로 1', '경기 성남시', '부산', '대전', '울산 남구', '제주', '전국']
+
+# 조건 종류별 매칭 조건 - 실제 요청 비율과 관계없이 종류별로 지연 시간을 따로 측정
+MIXES = ('iso', 'industry', 'full', 'region', 'rare', 'empty')
+
+
+def zipf_weights(count, s=1.1):
+    return [1 / (rank ** s) for rank in range(1, count + 1)]
+
+
+ISO_WEIGHTS = zipf_weights(len(ISO_CODES))
+INDUSTRY_WEIGHTS = zipf_weights(len(INDUSTRIES))
+SPECIALTY_WEIGHTS = zipf_weights(len(SPECIALTIES), 0.8)
+
+
+def _skewed_sample(rng, values, weights, count):
+    """가중치 비복원 추출"""
+    chosen = []
+    while len(chosen) < min(count, len(values)):
+        value = rng.choices(values, weights)[0]
+        if value not in chosen:
+            chosen.append(value)
+    return chosen
+
+
+def _region(rng):
+    province = rng.choices(list(PROVINCE_WEIGHTS), list(PROVINCE_WEIGHTS.values()))[0]
+    districts = regions.PROVINCES[province][1]
+    if districts and rng.random() < 0.3:
+        return f"{province} {rng.choice(districts)}"
+    return province
+
+
+def _regions(rng):
+    if rng.random() < 0.05:
+        return regions.NATIONWIDE
+    if rng.random() < 0.1:
+        return None
+    return ', '.join(_region(rng) for _ in range(rng.choices([1, 2, 3], [70, 22, 8])[0]))
+
+
+def consultant_rows(size, seed=42):
+    """Consultant 컬럼 값 dict (id 1부터)"""
+    rng = random.Random(seed)
+    for i in range(1, size + 1):
+        iso = _skewed_sample(rng, ISO_CODES, ISO_WEIGHTS, rng.choices(range(6), [10, 35, 30, 15, 7, 3])[0])
+        iso = [rng.choice(ISO_VARIANTS[code]) if code in ISO_VARIANTS and rng.random() < 0.1 else code
+               for code in iso]
+        industries = _skewed_sample(rng, INDUSTRIES, INDUSTRY_WEIGHTS, rng.choices(range(4), [10, 45, 30, 15])[0])
+        yield {
+            'id': i,
+            'name': f"Consultant {i}",
+            'avatar': 'C',
+            'specialty': rng.choices(SPECIALTIES, SPECIALTY_WEIGHTS)[0],
+            'experience': f"{rng.randint(1, 30)}년",
+            'rating': rng.choice([None, 3.5, 4.0, 4.2, 4.5, 4.8, 5.0]),
+            'reviews': int(rng.expovariate(1 / 8)),
+            'match_reason': f"reason {i}",
+            'regions': _regions(rng),
+            'iso_experience': json.dumps({code: rng.choice(ROLES) for code in iso} if rng.random() < 0.6 else iso),
+            'industry_experience': json.dumps(industries, ensure_ascii=False),
+            'project_types': json.dumps(rng.sample(PROJECT_TYPES, rng.randint(0, 2))),
+            'verified': rng.random() < 0.25,
+            'trust_score': round(rng.betavariate(2, 3) * 100, 1)
+        }
+
+
+def records(size, seed=42):
+    """DB 없이 ConsultantRecord로 (메모리 엔진 벤치마크용)"""
+    for row in consultant_rows(size, seed):
+        yield ConsultantRecord.from_model(SimpleNamespace(**row))
+
+
+def criteria(mix, count, seed=7):
+    """조건 종류(MIXES)별 매칭 조건 목록"""
+    rng = random.Random(f"{mix}-{seed}")
+    items = []
+    for _ in range(count):
+        item = {}
+        if mix in ('iso', 'full', 'region'):
+            item['recommended_iso'] = [{'code': code} for code in
+                                       _skewed_sample(rng, ISO_CODES, ISO_WEIGHTS, rng.randint(1, 3))]
+        if mix in ('industry', 'full'):
+            item['industry'] = rng.choices(INDUSTRIES, INDUSTRY_WEIGHTS)[0]
+        if mix == 'full':
+            item['project_type'] = rng.choice(PROJECT_TYPES)
+        if mix in ('full', 'region'):
+            item['region'] = rng.choice(TARGET_REGIONS)
+        if mix == 'rare':
+            item['recommended_iso'] = [{'code': rng.choice(ISO_CODES[-4:])}]
+            item['industry'] = rng.choice(INDUSTRIES[-4:])
+        if mix == 'empty':
+            item['industry'] = 'Unknown'
+        items.append(item)
+    return items
+
+
+def create_app(path):
+    """SQLite 파일 풀에 연결된 Flask 앱 (api/index.py의 서비스 초기화 없이 모델만 사용)"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    return app
+
+
+def pool_path(directory, size, seed=42):
+    return os.path.join(directory, f"pool-{size}-{seed}-v{POOL_VERSION}.db")
+
+
+def populate(directory, size, seed=42, chunk=20000):
+    """
+    합성 풀 SQLite 파일 생성 (이미 있으면 재사용)
+
+    ORM 이벤트 대신 consultant_capability_rows / match_keys로 join table / consultant_score / 검색 키 행을 직접 bulk insert합니다.
+
+    Returns:
+        SQLite 파일 경로
+    """
+    path = pool_path(directory, size, seed)
+    if os.path.exists(path):
+        return path
+    os.makedirs(directory, exist_ok=True)
+    temp = path + '.tmp'
+    if os.path.exists(temp):
+        os.remove(temp)
+
+    app = create_app(temp)
+    with app.app_context():
+        db.create_all()
+        db.session.execute(text('PRAGMA synchronous=OFF'))
+        batch = []
+        for row in consultant_rows(size, seed):
+            batch.append(row)
+            if len(batch) >= chunk:
+                _insert(batch)
+                batch = []
+        if batch:
+            _insert(batch)
+        db.session.remove()
+        db.engine.dispose()
+    os.replace(temp, path)
+    return path
+
+
+def _insert(rows):
+    db.session.execute(Consultant.__table__.insert(), rows)
+    tables = {}
+    for row in rows:
+        consultant = SimpleNamespace(**row)
+        for table, capability_rows in consultant_capability_rows(consultant).items():
+            tables.setdefault(table, []).extend(capability_rows)
+        tables.setdefault(ConsultantMatchKey.__table__, []).extend(
+            {'consultant_id': consultant.id, 'key': key} for key in match_keys(ConsultantRecord.from_model(consultant)))
+    for table, capability_rows in tables.items():
+        if capability_rows:
+            db.session.execute(table.insert(), capability_rows)
+    db.session.commit()
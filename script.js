@@ -349,6 +349,7 @@ document.addEventListener('DOMContentLoaded', () => {
     async function pollForResults(jobId) {
         let progress = 0;
         let currentStep = 1;
+        let finished = false;
         const statusMessages = [
             '기업 데이터를 수집하고 있습니다...',
             '웹사이트 정보를 분석하고 있습니다...',
@@ -362,81 +363,136 @@ document.addEventListener('DOMContentLoaded', () => {
         const progressPercentage = document.getElementById('progress-percentage');
         const loadingStatus = document.getElementById('loading-status');
         
-        // Animate progress smoothly
-        const progressInterval = setInterval(() => {
-            if (progress < 90) {
-                progress += Math.random() * 8 + 2;
-                if (progress > 90) progress = 90;
-                
-                if (progressFill) progressFill.style.width = progress + '%';
-                if (progressPercentage) progressPercentage.textContent = Math.floor(progress) + '%';
+        function setProgress(value, message) {
+            progress = Math.max(progress, value);
+            if (progressFill) progressFill.style.width = progress + '%';
+            if (progressPercentage) progressPercentage.textContent = Math.floor(progress) + '%';
+            if (loadingStatus && message) loadingStatus.textContent = message;
+        }
+        
+        function handleCompleted(result) {
+            if (finished) return;
+            finished = true;
+            
+            // Complete progress animation
+            setProgress(100, '분석이 완료되었습니다!');
+            updateLoadingSteps(3, 3, true);
+            
+            // Wait a moment to show completion
+            setTimeout(() => {
+                displayResults(result);
                 
-                // Update status message
-                const messageIndex = Math.floor(progress / 20);
-                if (loadingStatus && statusMessages[messageIndex]) {
-                    loadingStatus.textContent = statusMessages[messageIndex];
+                // Hide loading
+                if (loadingOverlay) {
+                    loadingOverlay.classList.add('hidden');
+                    loadingOverlay.style.display = 'none';
                 }
                 
-                // Update steps
-                if (progress > 30 && currentStep === 1) {
-                    currentStep = 2;
-                    updateLoadingSteps(1, 2);
-                } else if (progress > 70 && currentStep === 2) {
-                    currentStep = 3;
-                    updateLoadingSteps(2, 3);
+                // Show results
+                if (resultsSection) {
+                    resultsSection.classList.remove('hidden');
+                    resultsSection.scrollIntoView({ behavior: 'smooth' });
                 }
+            }, 500);
+        }
+        
+        function handleFailed() {
+            if (finished) return;
+            finished = true;
+            showNotification('분석에 실패했습니다. 다시 시도해주세요.', 'error');
+            if (loadingOverlay) {
+                loadingOverlay.classList.add('hidden');
+                loadingOverlay.style.display = 'none';
             }
-        }, 300);
+            if (formSection) {
+                formSection.style.display = 'block';
+            }
+            showStep(currentStep);
+        }
         
-        const pollInterval = setInterval(async () => {
-            try {
-                const response = await fetch(`/api/analyze/${jobId}`);
-                const data = await response.json();
-
-                if (data.status === 'completed') {
-                    clearInterval(pollInterval);
-                    clearInterval(progressInterval);
-                    
-                    // Complete progress animation
-                    if (progressFill) progressFill.style.width = '100%';
-                    if (progressPercentage) progressPercentage.textContent = '100%';
-                    if (loadingStatus) loadingStatus.textContent = '분석이 완료되었습니다!';
-                    updateLoadingSteps(3, 3, true);
+        // Real progress from the server (SSE stage events)
+        const completedStages = new Set();
+        function handleStage(event) {
+            if (event.stage === 'started') {
+                setProgress(10, statusMessages[0]);
+            } else if (event.stage === 'gov_data' || event.stage === 'scrape') {
+                completedStages.add(event.stage);
+                setProgress(10 + completedStages.size * 25, statusMessages[1]);
+            } else if (event.stage === 'llm' && event.status === 'started') {
+                setProgress(65, statusMessages[2]);
+                currentStep = 2;
+                updateLoadingSteps(1, 2);
+            } else if (event.stage === 'llm') {
+                setProgress(90, statusMessages[4]);
+                currentStep = 3;
+                updateLoadingSteps(2, 3);
+            }
+        }
+        
+        if (window.EventSource) {
+            const source = new EventSource(`/api/analyze/${jobId}/stream`);
+            source.addEventListener('stage', (e) => handleStage(JSON.parse(e.data)));
+            source.addEventListener('completed', (e) => {
+                source.close();
+                handleCompleted(JSON.parse(e.data).result);
+            });
+            source.addEventListener('failed', () => {
+                source.close();
+                handleFailed();
+            });
+            source.addEventListener('timeout', () => {
+                source.close();
+                startPolling();
+            });
+            // Stream unavailable (proxy/serverless limits) -> fall back to polling
+            source.onerror = () => {
+                source.close();
+                if (!finished) startPolling();
+            };
+            return;
+        }
+        
+        startPolling();
+        
+        function startPolling() {
+            // Animate progress smoothly
+            const progressInterval = setInterval(() => {
+                if (progress < 90) {
+                    const next = Math.min(progress + Math.random() * 8 + 2, 90);
                     
-                    // Wait a moment to show completion
-                    setTimeout(() => {
-                        displayResults(data.result);
-                        
-                        // Hide loading
-                        if (loadingOverlay) {
-                            loadingOverlay.classList.add('hidden');
-                            loadingOverlay.style.display = 'none';
-                        }
-                        
-                        // Show results
-                        if (resultsSection) {
-                            resultsSection.classList.remove('hidden');
-                            resultsSection.scrollIntoView({ behavior: 'smooth' });
-                        }
-                    }, 500);
+                    // Update status message
+                    setProgress(next, statusMessages[Math.floor(next / 20)]);
                     
-                } else if (data.status === 'failed') {
-                    clearInterval(pollInterval);
-                    clearInterval(progressInterval);
-                    showNotification('분석에 실패했습니다. 다시 시도해주세요.', 'error');
-                    if (loadingOverlay) {
-                        loadingOverlay.classList.add('hidden');
-                        loadingOverlay.style.display = 'none';
+                    // Update steps
+                    if (progress > 30 && currentStep === 1) {
+                        currentStep = 2;
+                        updateLoadingSteps(1, 2);
+                    } else if (progress > 70 && currentStep === 2) {
+                        currentStep = 3;
+                        updateLoadingSteps(2, 3);
                     }
-                    if (formSection) {
-                        formSection.style.display = 'block';
+                }
+            }, 300);
+            
+            const pollInterval = setInterval(async () => {
+                try {
+                    const response = await fetch(`/api/analyze/${jobId}`);
+                    const data = await response.json();
+
+                    if (data.status === 'completed') {
+                        clearInterval(pollInterval);
+                        clearInterval(progressInterval);
+                        handleCompleted(data.result);
+                    } else if (data.status === 'failed') {
+                        clearInterval(pollInterval);
+                        clearInterval(progressInterval);
+                        handleFailed();
                     }
-                    showStep(currentStep);
+                } catch (error) {
+                    console.error('Polling error:', error);
                 }
-            } catch (error) {
-                console.error('Polling error:', error);
-            }
-        }, 2000);
+            }, 2000);
+        }
     }
     
     function updateLoadingSteps(completedStep, activeStep, allComplete = false) {
@@ -0,0 +1,75 @@
+"""
+api/ 모듈 테스트 지원
+
+api/ 와 server/ 는 둘 다 top-level 'models', 'services' 모듈을 사용하므로
+같은 pytest 프로세스에서 import하면 sys.modules에서 서로 충돌합니다.
+load_api()는 api/ 모듈을 격리해서 import한 뒤 sys.modules / sys.path를 원래대로 되돌립니다.
+"""
+
+import os
+import sys
+import tempfile
+import importlib
+from contextlib import contextmanager
+
+from flask import Flask
+
+API_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'api'))
+_TOP_LEVEL = ('models', 'services')
+_api_modules = {}
+
+
+def _is_shared_name(name):
+    return name.split('.')[0] in _TOP_LEVEL
+
+
+def load_api(*names):
+    """api/ 기준으로 모듈을 import하여 반환 (예: load_api('models', 'services.matching_service'))"""
+    with api_modules():
+        modules = [importlib.import_module(name) for name in names]
+    return modules[0] if len(modules) == 1 else modules
+
+
+@contextmanager
+def api_modules():
+    """
+    블록 안에서만 api/ 모듈을 sys.modules / sys.path에 올려둠 (load_api도 이 안에서 import)
+
+    ProcessPoolExecutor로 넘기는 함수는 pickle이 모듈 이름으로 다시 찾으므로 호출하는 동안 api/ 모듈이 보여야 합니다.
+    """
+    saved_modules = {k: sys.modules.pop(k) for k in list(sys.modules) if _is_shared_name(k)}
+    saved_path = list(sys.path)
+    sys.modules.update(_api_modules)
+    sys.path.insert(0, API_DIR)
+    try:
+        yield
+    finally:
+        for k in list(sys.modules):
+            if _is_shared_name(k):
+                _api_modules[k] = sys.modules.pop(k)
+        sys.modules.update(saved_modules)
+        sys.path[:] = saved_path
+
+
+def create_test_app():
+    """임시 SQLite 파일을 사용하는 Flask 앱 (워커 스레드가 같은 DB를 보도록 파일 DB 사용)"""
+    models = load_api('models')
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['TESTING'] = True
+    models.db.init_app(app)
+    with app.app_context():
+        models.db.create_all()
+    app.db_path = path
+    return app
+
+
+def dispose_test_app(app):
+    models = load_api('models')
+    with app.app_context():
+        models.db.session.remove()
+        models.db.engine.dispose()
+    os.remove(app.db_path)
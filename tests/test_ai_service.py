@@ -0,0 +1,124 @@
+import os
+import time
+import unittest
+
+from tests.api_support import load_api
+
+ai_service = load_api('services.ai_service')
+llm_cache = load_api('services.llm_cache')
+
+
+class SlowCorpInfoService:
+    def get_enhanced_company_info(self, company_name=None, crno=None, bzno=None):
+        time.sleep(0.3)
+        return {
+            'found': True,
+            'company_name': company_name,
+            'basic_info': {'corp_name': company_name, 'employee_count': 120, 'main_business': '제조'},
+            'affiliates': [],
+            'subsidiaries': [],
+            'risk_indicators': {}
+        }
+
+
+class TestAnalyzeStages(unittest.TestCase):
+    def setUp(self):
+        self._api_key = os.environ.pop('GOOGLE_API_KEY', None)
+        self.service = ai_service.AIService()
+        self.service.corp_info_service = SlowCorpInfoService()
+
+        def slow_scrape(url, company_name):
+            time.sleep(0.3)
+            return {'site_content': 'ISO 9001', 'iso_mentions': ['ISO 9001'], 'certification_page_found': False}
+
+        self.service._scrape_iso_info = slow_scrape
+
+    def tearDown(self):
+        if self._api_key is not None:
+            os.environ['GOOGLE_API_KEY'] = self._api_key
+
+    def test_gov_data_and_scrape_run_concurrently(self):
+        events = []
+        started = time.perf_counter()
+        result = self.service.analyze(
+            {'companyName': '테스트', 'companyUrl': 'example.com'},
+            on_stage=lambda stage, report: events.append((stage, report['status']))
+        )
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(sorted(events), [('gov_data', 'ok'), ('scrape', 'ok')])
+        self.assertTrue(result['stages']['gov_data']['found'])
+        self.assertEqual(result['stages']['scrape']['iso_mentions'], 1)
+        self.assertGreaterEqual(result['stages']['scrape']['elapsed_ms'], 250)
+
+    def test_stage_error_is_reported(self):
+        def broken_scrape(url, company_name):
+            raise ValueError('scrape failed')
+
+        self.service._scrape_iso_info = broken_scrape
+        result = self.service.analyze({'companyName': '테스트'})
+
+        self.assertEqual(result['stages']['scrape']['status'], 'error')
+        self.assertEqual(result['stages']['scrape']['error'], 'scrape failed')
+        self.assertEqual(result['stages']['gov_data']['status'], 'ok')
+
+
+class TestLLMResultCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.cache = llm_cache.LLMResultCache(':memory:', ttl=60, stale_ttl=600, clock=lambda: self.now)
+        self.calls = 0
+
+    def _generate(self):
+        self.calls += 1
+        return {'risk_score': 70 + self.calls}
+
+    def test_key_ignores_whitespace_only_changes(self):
+        self.assertEqual(
+            llm_cache.prompt_cache_key('m', 'analyze  this\n   company'),
+            llm_cache.prompt_cache_key('m', 'analyze this company')
+        )
+        self.assertNotEqual(
+            llm_cache.prompt_cache_key('m', 'analyze this company'),
+            llm_cache.prompt_cache_key('other', 'analyze this company')
+        )
+
+    def test_fresh_hit_skips_generation(self):
+        first, status = self.cache.get_or_generate('k', self._generate)
+        self.assertEqual(status, 'miss')
+        first['risk_score'] = 0  # callers mutate results; the cache must not see it
+
+        second, status = self.cache.get_or_generate('k', self._generate)
+        self.assertEqual(status, 'hit')
+        self.assertEqual(second, {'risk_score': 71})
+        self.assertEqual(self.calls, 1)
+
+    def test_stale_entry_is_served_and_refreshed_in_background(self):
+        self.cache.get_or_generate('k', self._generate)
+        self.now += 120
+
+        value, status = self.cache.get_or_generate('k', self._generate)
+        self.assertEqual((value, status), ({'risk_score': 71}, 'stale'))
+
+        deadline = time.time() + 5
+        while self.cache.stats()['refreshes'] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        value, status = self.cache.get_or_generate('k', self._generate)
+        self.assertEqual((value, status), ({'risk_score': 72}, 'hit'))
+
+    def test_expired_entry_is_used_when_generation_fails(self):
+        self.cache.get_or_generate('k', self._generate)
+        self.now += 10000
+
+        def failing():
+            raise RuntimeError('Gemini down')
+
+        value, status = self.cache.get_or_generate('k', failing)
+        self.assertEqual((value, status), ({'risk_score': 71}, 'fallback'))
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_generate('missing', failing)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+import time
+import uuid
+import threading
+import unittest
+
+from tests.api_support import load_api, create_test_app, dispose_test_app
+
+models = load_api('models')
+analysis_queue = load_api('services.analysis_queue')
+
+
+class TestAnalysisQueue(unittest.TestCase):
+    def setUp(self):
+        self.app = create_test_app()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        dispose_test_app(self.app)
+
+    def _handler(self, intake_data, on_stage=None):
+        with self.lock:
+            self.calls.append(intake_data['companyName'])
+        if intake_data.get('fail'):
+            raise RuntimeError('boom')
+        return {'company_name': intake_data['companyName']}
+
+    def _enqueue(self, name, **extra):
+        job_id = str(uuid.uuid4())
+        with self.app.app_context():
+            job = models.AnalysisJob(id=job_id, company_name=name, status='processing')
+            job.set_intake_data(dict(companyName=name, **extra))
+            models.db.session.add(job)
+            models.db.session.commit()
+        return job_id
+
+    def _wait_for(self, job_ids, timeout=10):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self.app.app_context():
+                jobs = [models.AnalysisJob.query.get(j) for j in job_ids]
+                if all(j.status in ('completed', 'failed') for j in jobs):
+                    return {j.id: (j.status, j.get_result(), j.error) for j in jobs}
+                models.db.session.rollback()
+            time.sleep(0.05)
+        self.fail('jobs did not finish')
+
+    def test_workers_process_each_job_once(self):
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=3, poll_interval=0.05)
+        job_ids = [self._enqueue(f'Company {i}') for i in range(8)]
+        queue.start()
+        try:
+            results = self._wait_for(job_ids)
+        finally:
+            queue.stop()
+
+        self.assertEqual(sorted(self.calls), sorted(f'Company {i}' for i in range(8)))
+        for status, result, _ in results.values():
+            self.assertEqual(status, 'completed')
+            self.assertIn('company_name', result)
+
+    def test_handler_error_marks_job_failed(self):
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=1, poll_interval=0.05)
+        job_id = self._enqueue('Broken', fail=True)
+        queue.start()
+        try:
+            results = self._wait_for([job_id])
+        finally:
+            queue.stop()
+
+        status, _, error = results[job_id]
+        self.assertEqual(status, 'failed')
+        self.assertEqual(error, 'boom')
+
+    def test_run_now_claims_only_once(self):
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=0)
+        job_id = self._enqueue('Inline')
+        with self.app.app_context():
+            self.assertTrue(queue.run_now(job_id))
+            self.assertFalse(queue.run_now(job_id))
+            self.assertEqual(models.AnalysisJob.query.get(job_id).status, 'completed')
+        self.assertEqual(self.calls, ['Inline'])
+
+    def test_stage_events_are_recorded_for_snapshot(self):
+        def handler(intake_data, on_stage):
+            threads = [threading.Thread(target=on_stage, args=(stage, {'status': 'ok'})) for stage in ('gov_data', 'scrape')]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            on_stage('llm', {'status': 'started'})
+            return {'ok': True}
+
+        queue = analysis_queue.AnalysisQueue(self.app, handler, workers=0)
+        job_id = self._enqueue('Staged')
+        with self.app.app_context():
+            queue.run_now(job_id)
+
+        snapshot = queue.snapshot(job_id)
+        stages = [event['stage'] for event in snapshot['progress']]
+        self.assertEqual(snapshot['status'], 'completed')
+        self.assertEqual(stages[0], 'started')
+        self.assertEqual(sorted(stages[1:3]), ['gov_data', 'scrape'])
+        self.assertEqual(stages[3], 'llm')
+        self.assertEqual(snapshot['result'], {'ok': True})
+
+
+class TestAnalysisCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.app = create_test_app()
+        self.calls = 0
+
+    def tearDown(self):
+        dispose_test_app(self.app)
+
+    def _handler(self, intake_data, on_stage=None):
+        self.calls += 1
+        return {'company_name': intake_data['companyName']}
+
+    def _submit(self, queue, **intake):
+        job = models.AnalysisJob(id=str(uuid.uuid4()), company_name=intake.get('companyName'), status='processing')
+        job.set_intake_data(intake)
+        return queue.submit(job).id
+
+    def test_dedup_key_normalizes_company_identity(self):
+        key = analysis_queue.analysis_dedup_key
+        base = {'companyName': '(주)테스트', 'companyUrl': 'https://www.test.co.kr/', 'standards': ['ISO 9001', 'ISO 14001']}
+        same = {'companyName': '테스트', 'companyUrl': 'test.co.kr', 'standards': ['ISO 14001', 'ISO 9001'], 'budget': 'x'}
+        self.assertEqual(key(base), key(same))
+        self.assertNotEqual(key(base), key(dict(base, readiness='Advanced')))
+        self.assertEqual(key({'crno': '110111-0000000', 'companyName': 'A'}), key({'crno': '1101110000000', 'companyName': 'B'}))
+
+    def test_duplicate_submissions_share_one_run(self):
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=0)
+        with self.app.app_context():
+            leader_id = self._submit(queue, companyName='삼성전자')
+            follower_id = self._submit(queue, companyName='삼성전자')
+            other_id = self._submit(queue, companyName='삼성전자', industry='IT')
+
+            self.assertTrue(queue.run_now(leader_id))
+            self.assertFalse(queue.run_now(follower_id))
+            follower = queue.resolve(models.AnalysisJob.query.get(follower_id))
+
+            self.assertEqual(follower.leader_id, leader_id)
+            self.assertEqual(follower.status, 'completed')
+            self.assertEqual(follower.get_result(), {'company_name': '삼성전자'})
+            self.assertEqual(self.calls, 1)
+            self.assertIsNone(models.AnalysisJob.query.get(other_id).leader_id)
+
+    def test_on_complete_output_is_shared_with_followers(self):
+        def on_complete(job):
+            job.set_matches({'company': job.get_result()['company_name']})
+
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=0, on_complete=on_complete)
+        with self.app.app_context():
+            leader_id = self._submit(queue, companyName='현대차')
+            follower_id = self._submit(queue, companyName='현대차')
+            queue.run_now(leader_id)
+            late_id = self._submit(queue, companyName='현대차')
+
+            for job_id in (leader_id, follower_id, late_id):
+                self.assertEqual(models.AnalysisJob.query.get(job_id).get_matches(), {'company': '현대차'})
+
+    def test_recently_completed_job_is_reused(self):
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=0)
+        with self.app.app_context():
+            leader_id = self._submit(queue, companyName='LG화학')
+            queue.run_now(leader_id)
+            late_id = self._submit(queue, companyName='LG화학')
+            late = models.AnalysisJob.query.get(late_id)
+
+            self.assertEqual(late.status, 'completed')
+            self.assertEqual(late.get_result(), {'company_name': 'LG화학'})
+            self.assertEqual(self.calls, 1)
+
+    def test_stream_without_workers_runs_leader_of_follower(self):
+        # 워커 0개에서 SSE 스트림(stream_analysis)이 중복 요청 작업을 여는 경우
+        queue = analysis_queue.AnalysisQueue(self.app, self._handler, workers=0)
+        with self.app.app_context():
+            leader_id = self._submit(queue, companyName='SK하이닉스')
+            follower_id = self._submit(queue, companyName='SK하이닉스')
+
+        snapshot = queue.snapshot(follower_id)
+        self.assertEqual((snapshot['status'], snapshot['leader_id']), ('processing', leader_id))
+        self.assertIsNone(queue.snapshot(leader_id)['leader_id'])
+        with self.app.app_context():
+            self.assertFalse(queue.run_now(follower_id))
+
+        queue.run_detached(snapshot['leader_id'] or follower_id)
+        deadline = time.time() + 10
+        while queue.snapshot(follower_id)['status'] == 'processing' and time.time() < deadline:
+            queue.wait_for_update(0.05)
+
+        snapshot = queue.snapshot(follower_id)
+        self.assertEqual(snapshot['status'], 'completed')
+        self.assertEqual(snapshot['result'], {'company_name': 'SK하이닉스'})
+        self.assertEqual(self.calls, 1)
+
+
+class TestSchemaUpgrade(unittest.TestCase):
+    # 큐 도입 전 analysis_job 테이블 (기존 배포 DB)
+    BASELINE_DDL = (
+        "CREATE TABLE analysis_job (id VARCHAR(36) NOT NULL PRIMARY KEY, company_name VARCHAR(100), "
+        "url VARCHAR(200), status VARCHAR(20), result TEXT, intake_data TEXT, created_at DATETIME)"
+    )
+
+    def setUp(self):
+        self.app = create_test_app()
+        with self.app.app_context():
+            models.db.session.execute(models.text('DROP TABLE analysis_job'))
+            models.db.session.execute(models.text(self.BASELINE_DDL))
+            models.db.session.execute(models.text(
+                "INSERT INTO analysis_job (id, company_name, status, intake_data) "
+                "VALUES ('old-job', 'Legacy', 'processing', '{\"companyName\": \"Legacy\"}')"
+            ))
+            models.db.session.commit()
+
+    def tearDown(self):
+        dispose_test_app(self.app)
+
+    def test_missing_columns_are_added_idempotently(self):
+        with self.app.app_context():
+            models.db.create_all()
+            models.upgrade_schema()
+            models.upgrade_schema()
+
+            inspector = models.sa_inspect(models.db.engine)
+            columns = {column['name'] for column in inspector.get_columns('analysis_job')}
+            indexes = {index['name'] for index in inspector.get_indexes('analysis_job')}
+            self.assertEqual(columns, set(models.AnalysisJob.__table__.columns.keys()))
+            self.assertEqual(indexes, {index.name for index in models.AnalysisJob.__table__.indexes})
+            self.assertEqual(models.AnalysisJob.query.get('old-job').attempts, 0)
+
+            queue = analysis_queue.AnalysisQueue(self.app, lambda intake, on_stage=None: {'ok': True}, workers=0)
+            self.assertTrue(queue.run_now('old-job'))
+            job = models.AnalysisJob.query.get('old-job')
+            self.assertEqual((job.status, job.get_result(), job.attempts), ('completed', {'ok': True}, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
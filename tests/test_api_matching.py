@@ -0,0 +1,461 @@
+import os
+import json
+import uuid
+import random
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from tests.api_support import load_api, create_test_app, dispose_test_app
+
+models = load_api('models')
+matching_service = load_api('services.matching_service')
+regions = load_api('services.regions')
+iso_registry = load_api('services.iso_registry')
+industry_taxonomy = load_api('services.industry_taxonomy')
+
+ISO_CODES = ['ISO 9001', 'ISO 14001', 'ISO 45001', 'ISO 27001', 'ISO 13485', 'IATF 16949', '9001', '27001',
+             'ISO 9001:2015', 'ISO/IEC 27001:2022', 'OHSAS 18001', 'ISO 99999']
+INDUSTRIES = ['Manufacturing', 'Chemical', 'IT', 'IT/Software', 'Service', 'Construction', 'Medical',
+              'Automotive', 'Energy', '제조', '건설', '']
+SPECIALTIES = ['제조/화학', 'IT/서비스', '건설/안전', 'Manufacturing', 'IT', None, '']
+PROJECT_TYPES = ['New', 'Transition', 'Integration']
+REGIONS = [None, '', '서울', '서울 강남구, 경기', '부산', '전국', '제주', '경기 성남시', 'Busan, 울산', '대전, 세종', 'xyz']
+TARGET_REGIONS = ['서울', '서울특별시 강남구 테헤란로 1', '부산', '대전', '제주', '강원', '전국', 'Atlantis']
+
+
+def reference_match(consultants, criteria):
+    """기존 MatchingService.match_consultants 루프 (id 순으로 조회, ISO 코드 정규화 / 업종은 분류 노드로 비교)"""
+    target_industry = criteria.get('industry', '')
+    target_iso = iso_registry.normalize_all(iso['code'] for iso in criteria.get('recommended_iso', []))
+    target_project_type = criteria.get('project_type', '')
+
+    target_nodes = industry_taxonomy.target_nodes(target_industry)
+
+    def is_industry_match(terms):
+        return any(not industry_taxonomy.resolve(term).isdisjoint(target_nodes) for term in terms)
+
+    scored = []
+    for c in consultants:
+        score = 0
+        details = []
+        consultant_iso = iso_registry.normalize_all(json.loads(c.iso_experience) if c.iso_experience else {})
+        matched = [iso for iso in target_iso if iso in consultant_iso]
+        if target_iso:
+            score += (len(matched) / len(target_iso)) * 30
+            if matched:
+                details.append(f"ISO {', '.join(matched)} 경험")
+        industries = json.loads(c.industry_experience) if c.industry_experience else []
+        if is_industry_match(industries):
+            score += 25
+            details.append(f"{target_industry} 분야 전문")
+        elif c.specialty and is_industry_match([c.specialty]):
+            score += 15
+            details.append(f"{target_industry} 관련 경험")
+        projects = json.loads(c.project_types) if c.project_types else []
+        if target_project_type and target_project_type in projects:
+            score += 15
+            details.append(f"{target_project_type} 프로젝트 경험")
+        trust = (c.trust_score or 0) * 0.1
+        if c.verified:
+            trust += 10
+        score += min(trust, 20)
+        if (c.reviews or 0) > 10:
+            score += 5
+        if (c.rating or 0) >= 4.5:
+            score += 5
+        scored.append((c, score, details))
+
+    scored.sort(key=lambda x: x[1], reverse=True)
+    if not scored or scored[0][1] < 10:
+        top = sorted(consultants, key=lambda x: x.trust_score or 0, reverse=True)[:3]
+        return [(c.id, 95, "분야별 최우수 전문가 (강력 추천)") for c in top]
+    return [(c.id, round(score), details[0] if details else c.match_reason) for c, score, details in scored[:20]]
+
+
+def random_consultant(rng, i):
+    iso = rng.sample(ISO_CODES, rng.randint(0, 3))
+    return models.Consultant(
+        name=f"Consultant {i}",
+        specialty=rng.choice(SPECIALTIES),
+        match_reason=f"reason {i}",
+        iso_experience=json.dumps({code: 'Auditor' for code in iso} if rng.random() < 0.5 else iso),
+        industry_experience=json.dumps(rng.sample(INDUSTRIES, rng.randint(0, 3))),
+        project_types=json.dumps(rng.sample(PROJECT_TYPES, rng.randint(0, 2))),
+        verified=rng.random() < 0.5,
+        trust_score=rng.choice([None, 0.0, 40.0, 50.0, 70.0, 88.0, 95.5]),
+        rating=rng.choice([None, 3.5, 4.5, 4.9]),
+        reviews=rng.choice([None, 0, 5, 11, 40]),
+        regions=rng.choice(REGIONS)
+    )
+
+
+def random_criteria(rng):
+    criteria = {
+        'industry': rng.choice(INDUSTRIES + ['Manufacturing/Parts', 'Unknown']),
+        'recommended_iso': [{'code': code} for code in rng.sample(ISO_CODES, rng.randint(0, 3))]
+    }
+    if rng.random() < 0.5:
+        criteria['project_type'] = rng.choice(PROJECT_TYPES)
+    return criteria
+
+
+class TestApiMatchingService(unittest.TestCase):
+    def setUp(self):
+        self.app = create_test_app()
+        self.service = matching_service.MatchingService()
+        rng = random.Random(7)
+        with self.app.app_context():
+            for i in range(300):
+                models.db.session.add(random_consultant(rng, i))
+            models.db.session.commit()
+
+    def tearDown(self):
+        dispose_test_app(self.app)
+
+    def _reference(self, criteria):
+        consultants = models.Consultant.query.order_by(models.Consultant.id).all()
+        return reference_match(consultants, criteria)
+
+    def _summary(self, results):
+        return [(r['id'], r['matchScore'], r['matchReason']) for r in results]
+
+    def test_matches_reference_ranking(self):
+        for strategy in matching_service.STRATEGIES:
+            service = matching_service.MatchingService(strategy=strategy)
+            rng = random.Random(11)
+            with self.app.app_context():
+                for _ in range(60):
+                    criteria = random_criteria(rng)
+                    self.assertEqual(
+                        self._summary(service.match_consultants(criteria)),
+                        self._reference(criteria),
+                        (strategy, criteria)
+                    )
+
+    def test_region_filter_matches_full_scan(self):
+        rng = random.Random(17)
+        with self.app.app_context():
+            records = [matching_service.ConsultantRecord.from_model(c)
+                       for c in models.Consultant.query.order_by(models.Consultant.id)]
+            for i in range(60):
+                # 요청 지역(제외 + 가점) / 공공데이터 기업 주소(가점만)
+                if i % 3:
+                    criteria = dict(random_criteria(rng), region=rng.choice(TARGET_REGIONS))
+                else:
+                    criteria = dict(random_criteria(rng), gov_data={'address': rng.choice(TARGET_REGIONS)})
+                target = self.service._parse_criteria(criteria)
+                # 전체 풀을 _score로 채점 후 지역 제외 - 전략별 후보 선별/벡터화 결과와 같아야 함
+                expected = sorted(
+                    (self.service._score(r, target) for r in records if not self.service._is_region_excluded(r, target)),
+                    key=lambda x: (-x['score'], x['consultant'].id)
+                )[:20]
+                expected = [(x['consultant'].id, round(x['score'])) for x in expected]
+                if expected and expected[0][1] >= 10:
+                    for strategy in matching_service.STRATEGIES:
+                        service = matching_service.MatchingService(strategy=strategy)
+                        actual = [(r['id'], r['matchScore']) for r in service.match_consultants(criteria)]
+                        self.assertEqual(actual, expected, (strategy, criteria))
+
+    def test_company_address_adds_points_without_excluding(self):
+        address = {'gov_data': {'address': '서울특별시 강남구 테헤란로 152'}}
+        requested = self.service._parse_criteria({'region': '서울 강남구'})
+        inferred = self.service._parse_criteria(address)
+        self.assertEqual((requested['region'], requested['region_filter']), (('서울', '강남구'), True))
+        self.assertEqual((inferred['region'], inferred['region_filter']), (('서울', '강남구'), False))
+
+        with self.app.app_context():
+            busan = {c.id for c in models.Consultant.query.filter_by(regions='부산')}
+            seoul = matching_service.ConsultantRecord.from_model(models.Consultant.query.filter_by(regions='서울').first())
+            self.assertTrue(busan)
+            points = self.service._score(seoul, inferred)['score'] - self.service._score(seoul, dict(inferred, region=None))['score']
+            self.assertEqual(points, regions.TIER_POINTS[regions.TIER_PROVINCE])
+            for strategy in matching_service.STRATEGIES:
+                service = matching_service.MatchingService(strategy=strategy)
+                # 서울 기준 '부산'만 활동하는 컨설턴트는 요청 지역일 때만 제외
+                explicit = {r['id'] for r in service.match_consultants({'region': '서울 강남구'}, limit=300)}
+                implicit = {r['id'] for r in service.match_consultants(address, limit=300)}
+                self.assertFalse(explicit & busan, strategy)
+                self.assertEqual(implicit & busan, busan, strategy)
+
+    def test_vector_scores_equal_loop_scores(self):
+        rng = random.Random(5)
+        with self.app.app_context():
+            matrix = self.service.ensure_matrix()
+            for _ in range(30):
+                target = self.service._parse_criteria(dict(random_criteria(rng), region=rng.choice(TARGET_REGIONS)))
+                scores = matrix.score(target, regions.TIER_FAR)
+                expected = [self.service._score(record, target)['score'] for record in matrix.records]
+                self.assertEqual(scores.tolist(), expected, target)
+
+    def test_batch_matches_individual_calls(self):
+        rng = random.Random(3)
+        criteria_list = [random_criteria(rng) for _ in range(20)]
+        for strategy in matching_service.STRATEGIES:
+            service = matching_service.MatchingService(strategy=strategy)
+            with self.app.app_context():
+                self.assertEqual(
+                    service.match_batch(criteria_list, limit=5),
+                    [service.match_consultants(criteria, limit=5) for criteria in criteria_list]
+                )
+
+    def test_join_tables_follow_json_fields(self):
+        def rows(consultant_id):
+            return (
+                sorted(r.iso_code for r in models.ConsultantIso.query.filter_by(consultant_id=consultant_id)),
+                sorted(r.industry for r in models.ConsultantIndustry.query.filter_by(consultant_id=consultant_id)),
+                sorted(r.region for r in models.ConsultantRegion.query.filter_by(consultant_id=consultant_id))
+            )
+
+        with self.app.app_context():
+            consultant = models.Consultant(
+                name='Synced', iso_experience=json.dumps({'ISO 9001': 'Lead Auditor'}),
+                industry_experience=json.dumps(['Chemical', 'Chemical', 'IT']), regions='서울, 경기'
+            )
+            models.db.session.add(consultant)
+            models.db.session.commit()
+            self.assertEqual(rows(consultant.id), (['ISO 9001'], ['Chemical', 'IT'], ['경기', '서울']))
+            self.assertEqual(models.ConsultantIso.query.get((consultant.id, 'ISO 9001')).role, 'Lead Auditor')
+
+            consultant.iso_experience = json.dumps(['ISO 14001', 'ISO 45001'])
+            consultant.regions = None
+            models.db.session.commit()
+            self.assertEqual(rows(consultant.id), (['ISO 14001', 'ISO 45001'], ['Chemical', 'IT'], []))
+
+            consultant_id = consultant.id
+            models.db.session.delete(consultant)
+            models.db.session.commit()
+            self.assertEqual(rows(consultant_id), ([], [], []))
+
+            total = models.ConsultantIndustry.query.count()
+            models.rebuild_consultant_capabilities()
+            self.assertEqual(models.ConsultantIndustry.query.count(), total)
+
+    def test_match_keys_follow_changes_and_lookup_tables(self):
+        consultant_query = load_api('services.consultant_query')
+        with self.app.app_context():
+            def keys(consultant_id):
+                return sorted(r.key for r in models.ConsultantMatchKey.query.filter_by(consultant_id=consultant_id))
+
+            consultant = models.Consultant(
+                name='Keyed', iso_experience=json.dumps(['9001']), industry_experience=json.dumps(['반도체 제조']),
+                project_types=json.dumps(['New']), regions='서울 강남구, 전국, xyz'
+            )
+            models.db.session.add(consultant)
+            models.db.session.commit()
+            semiconductor = industry_taxonomy.TAXONOMY.codes[min(industry_taxonomy.resolve('반도체'))]
+            self.assertEqual(keys(consultant.id), sorted([
+                'iso:ISO 9001', f'industry:{semiconductor}', 'project_type:New',
+                'region:서울', 'region:서울/강남구', 'region:전국'
+            ]))
+            consultant.specialty = 'Underwater Basket Weaving'
+            models.db.session.commit()
+            self.assertIn('specialty:=underwater basket weaving', keys(consultant.id))
+            consultant_id = consultant.id
+            models.db.session.delete(consultant)
+            models.db.session.commit()
+            self.assertEqual(keys(consultant_id), [])
+
+            # 지문이 없거나 다르면 전체 재생성, 같으면 그대로
+            total = models.ConsultantMatchKey.query.count()
+            self.assertTrue(consultant_query.ensure_match_keys())
+            self.assertFalse(consultant_query.ensure_match_keys())
+            with mock.patch.object(consultant_query, 'lookup_fingerprint', return_value='changed'):
+                self.assertTrue(consultant_query.ensure_match_keys())
+            self.assertEqual(models.ConsultantMatchKey.query.count(), total)
+
+            # 후보 / 정적 점수 상위 조회는 용어 해석 없이 SQL 두 번
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            models.event.listen(models.db.engine, 'before_cursor_execute', listener)
+            try:
+                service = matching_service.MatchingService(strategy='sql')
+                target = service._parse_criteria({'industry': 'Chemical', 'region': '부산', 'project_type': 'New',
+                                                  'recommended_iso': [{'code': 'ISO 9001'}]})
+                consultant_query.load_candidates(target, 20, service._region_limit(target))
+            finally:
+                models.event.remove(models.db.engine, 'before_cursor_execute', listener)
+            self.assertEqual(len(statements), 2, statements)
+
+            # 시/군/구 단위 제외(거리 단계 0)까지 전체 채점(vector)과 같은 결과
+            for max_tier in range(regions.TIER_FAR + 1):
+                sql = matching_service.MatchingService(strategy='sql', region_max_tier=max_tier)
+                vector = matching_service.MatchingService(strategy='vector', region_max_tier=max_tier)
+                for region in TARGET_REGIONS:
+                    criteria = {'industry': 'IT', 'region': region}
+                    self.assertEqual(sql.match_consultants(criteria, limit=300),
+                                     vector.match_consultants(criteria, limit=300), (max_tier, region))
+
+    def test_static_scores_and_trust_fallback(self):
+        with self.app.app_context():
+            consultant = models.Consultant(name='Leader', trust_score=100.0, verified=False,
+                                           industry_experience=json.dumps(['Chemical']))
+            models.db.session.add(consultant)
+            models.db.session.commit()
+            self.assertEqual(models.ConsultantScore.query.get(consultant.id).static_score, 10.0)
+            consultant.verified = True
+            consultant.reviews = 20
+            models.db.session.commit()
+            self.assertEqual(models.ConsultantScore.query.get(consultant.id).static_score, 25.0)
+
+            services = [matching_service.MatchingService(strategy=strategy) for strategy in matching_service.STRATEGIES]
+            for service in services:
+                service.ensure_matrix()
+            # 신뢰도 순위를 만든 뒤의 변경도 반영
+            consultant.trust_score = 0.0
+            models.db.session.commit()
+            for service in services:
+                service.refresh_consultant(consultant)
+
+            consultants = models.Consultant.query.all()
+            expected_trust = sorted(consultants, key=lambda c: (-(c.trust_score or 0), c.id))[:3]
+            self.assertNotIn(consultant.id, [c.id for c in expected_trust])
+            for service in services:
+                with service._pool() as index:
+                    fallback = service._fallback_consultants(index)
+                self.assertEqual([c.id for c in fallback], [c.id for c in expected_trust], service.strategy)
+
+    def test_index_follows_consultant_changes(self):
+        criteria = {'industry': 'Semiconductor', 'recommended_iso': [{'code': 'ISO 50001'}]}
+        with self.app.app_context():
+            self.service.match_consultants(criteria)
+
+            newcomer = models.Consultant(
+                name='Newcomer', iso_experience=json.dumps({'ISO 50001': 'Lead Auditor'}),
+                industry_experience=json.dumps(['Semiconductor']), trust_score=10.0
+            )
+            models.db.session.add(newcomer)
+            models.db.session.commit()
+            self.service.refresh_consultant(newcomer)
+            self.assertEqual(self.service.match_consultants(criteria)[0]['name'], 'Newcomer')
+            self.assertEqual(self._summary(self.service.match_consultants(criteria)), self._reference(criteria))
+
+            models.db.session.delete(newcomer)
+            models.db.session.commit()
+            self.service.remove_consultant(newcomer.id)
+            self.assertEqual(self._summary(self.service.match_consultants(criteria)), self._reference(criteria))
+
+
+class TestMaterializedMatches(unittest.TestCase):
+    def setUp(self):
+        self.app = create_test_app()
+        self.service = matching_service.MatchingService(materialize_limit=5, materialize_spare=2)
+        self.rng = random.Random(23)
+        with self.app.app_context():
+            for i in range(60):
+                models.db.session.add(random_consultant(self.rng, i))
+            self.job_ids = []
+            for _ in range(8):
+                job = models.AnalysisJob(id=str(uuid.uuid4()), status='completed', finished_at=datetime.utcnow())
+                job.set_result(random_criteria(self.rng))
+                models.db.session.add(job)
+                self.job_ids.append(job.id)
+            models.db.session.commit()
+            for job_id in self.job_ids:
+                self.service.materialize(models.AnalysisJob.query.get(job_id))
+            models.db.session.commit()
+
+    def tearDown(self):
+        dispose_test_app(self.app)
+
+    def assertMatchesLive(self):
+        live = matching_service.MatchingService()
+        for job_id in self.job_ids:
+            job = models.AnalysisJob.query.get(job_id)
+            expected = live.match_consultants(job.get_result(), limit=5)
+            self.assertEqual(self.service.job_matches(job, limit=5), expected)
+
+    def test_materialized_matches_equal_live_scoring(self):
+        with self.app.app_context():
+            self.assertMatchesLive()
+            stored = models.AnalysisJob.query.get(self.job_ids[0]).get_matches()
+            self.assertEqual(len(stored['items']), 7)
+
+    def test_consultant_changes_are_applied_incrementally(self):
+        with self.app.app_context():
+            for step in range(40):
+                action = self.rng.random()
+                consultants = models.Consultant.query.order_by(models.Consultant.id).all()
+                if action < 0.2:
+                    consultant = random_consultant(self.rng, 1000 + step)
+                    models.db.session.add(consultant)
+                    models.db.session.commit()
+                    self.service.refresh_consultant(consultant)
+                elif action < 0.4:
+                    consultant = self.rng.choice(consultants)
+                    models.db.session.delete(consultant)
+                    models.db.session.commit()
+                    self.service.remove_consultant(consultant.id)
+                else:
+                    consultant = self.rng.choice(consultants)
+                    consultant.verified = not consultant.verified
+                    consultant.trust_score = self.rng.choice([None, 10.0, 50.0, 70.0, 99.0])
+                    models.db.session.commit()
+                    self.service.refresh_consultant(consultant)
+                self.assertMatchesLive()
+
+    def test_invalidate_clears_stored_matches(self):
+        with self.app.app_context():
+            self.service.invalidate()
+            job = models.AnalysisJob.query.get(self.job_ids[0])
+            self.assertIsNone(job.matches)
+            self.assertMatchesLive()
+            self.assertIsNotNone(models.AnalysisJob.query.get(self.job_ids[0]).matches)
+
+
+
+class TestBatchMatchEndpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        fd, cls.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        # 서버리스 설정 (워커 / 파싱 풀 없음) + 임시 DB
+        with mock.patch.dict(os.environ, {'VERCEL': '1', 'DATABASE_URL': f'sqlite:///{cls.db_path}'}):
+            cls.index = load_api('index')
+        cls.client = cls.index.app.test_client()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.index.app.app_context():
+            models.db.session.remove()
+            models.db.engine.dispose()
+        os.remove(cls.db_path)
+
+    def test_non_string_criteria_values_are_rejected(self):
+        for field in ('industry', 'region', 'project_type'):
+            criteria = [{'industry': 'IT', 'region': '서울'}, {field: ['IT', '서울']}]
+            response = self.client.post('/api/consultants/match/batch', json={'criteria': criteria})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()['criteria_index'], 1)
+            self.assertIn(f'criteria[1].{field}', response.get_json()['error'])
+
+    def test_malformed_nested_values_are_rejected(self):
+        payloads = [
+            ({'criteria': [{}, {'gov_data': {'main_business': ['x']}}]}, 'criteria_index', 'criteria[1].gov_data.main_business'),
+            ({'criteria': [{'gov_data': ['x']}]}, 'criteria_index', 'criteria[0].gov_data'),
+            ({'criteria': [{'recommended_iso': 'ISO 9001'}]}, 'criteria_index', 'criteria[0].recommended_iso'),
+            ({'criteria': [{'recommended_iso': [{'code': ['ISO 9001']}]}]}, 'criteria_index', 'criteria[0].recommended_iso'),
+            ({'job_ids': ['a', ['a']]}, 'job_index', 'job_ids[1]'),
+            ({'job_ids': [{'id': 'a'}]}, 'job_index', 'job_ids[0]'),
+        ]
+        for payload, key, message in payloads:
+            response = self.client.post('/api/consultants/match/batch', json=payload)
+            self.assertEqual(response.status_code, 400, payload)
+            self.assertIn(message, response.get_json()['error'])
+            self.assertIn(key, response.get_json())
+
+    def test_string_and_null_criteria_values_are_matched(self):
+        criteria = [{'industry': 'IT', 'region': None, 'project_type': 'New'}, {'industry': None},
+                    {'recommended_iso': None, 'gov_data': {'main_business': '반도체 제조', 'address': None}}]
+        response = self.client.post('/api/consultants/match/batch', json={'criteria': criteria})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([entry['criteria_index'] for entry in response.get_json()['results']], [0, 1, 2])
+
+        response = self.client.post('/api/consultants/match/batch', json={'job_ids': ['missing', 7]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([entry['job_id'] for entry in response.get_json()['results']], ['missing', 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import os
+import sys
+import time
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from tests.api_support import load_api, API_DIR
+
+corp_info_service = load_api('services.corp_info_service')
+corp_cache = load_api('services.corp_cache')
+http_client = load_api('services.http_client')
+
+OUTLINE = {
+    'success': True,
+    'total_count': 1,
+    'items': [{'crno': '1101110000000', 'corpNm': '(주)테스트', 'enpEmpeCnt': 120}]
+}
+
+
+class StubCorpInfoService(corp_info_service.CorpInfoService):
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = delays
+        self.calls = []
+
+    def get_corp_outline(self, corp_name=None, crno=None, num_of_rows=10, page_no=1):
+        self.calls.append('outline')
+        return dict(OUTLINE)
+
+    def get_affiliate(self, crno, bas_dt=None, num_of_rows=10, page_no=1, timeout=10):
+        self.calls.append('affiliate')
+        time.sleep(self.delays['affiliate'])
+        return {'success': True, 'total_count': 1, 'items': [{'afilCmpyNm': 'A'}]}
+
+    def get_subsidiary(self, crno, bas_dt=None, num_of_rows=10, page_no=1, timeout=10):
+        self.calls.append('subsidiary')
+        time.sleep(self.delays['subsidiary'])
+        return {'success': True, 'total_count': 1, 'items': [{'sbrdEnpNm': 'S'}]}
+
+
+class TestEnhancedCompanyInfo(unittest.TestCase):
+    def test_related_lookups_run_concurrently(self):
+        service = StubCorpInfoService({'affiliate': 0.3, 'subsidiary': 0.3})
+        started = time.perf_counter()
+        result = service.get_enhanced_company_info('테스트')
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(result['affiliates'], [{'afilCmpyNm': 'A'}])
+        self.assertEqual(result['subsidiaries'], [{'sbrdEnpNm': 'S'}])
+
+    def test_single_deadline_drops_slow_lookup(self):
+        service = StubCorpInfoService({'affiliate': 0.0, 'subsidiary': 0.5})
+        started = time.perf_counter()
+        result = service.get_enhanced_company_info('테스트', related_timeout=0.1)
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(result['affiliates'], [{'afilCmpyNm': 'A'}])
+        self.assertEqual(result['subsidiaries'], [])
+
+    def test_basic_info_only_mode_skips_related_lookups(self):
+        service = StubCorpInfoService({'affiliate': 0.0, 'subsidiary': 0.0})
+        result = service.get_enhanced_company_info('테스트', include_related=False)
+
+        self.assertTrue(result['found'])
+        self.assertEqual(service.calls, ['outline'])
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def api_payload(items, result_code='00'):
+    return {'response': {
+        'header': {'resultCode': result_code, 'resultMsg': 'NORMAL SERVICE.'},
+        'body': {'totalCount': len(items), 'items': {'item': items} if items else ''}
+    }}
+
+
+class TestCorpInfoCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        fd, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.cache = corp_cache.CorpInfoCache(
+            self.path, ttls={'outline': 60}, negative_ttl=10, clock=lambda: self.now
+        )
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_ttl_and_negative_ttl(self):
+        self.cache.set('outline', 'a', {'success': True, 'items': [1]})
+        self.cache.set('outline', 'b', {'success': False, 'items': [], 'not_found': True}, negative=True)
+
+        self.now += 30
+        self.assertEqual(self.cache.get('outline', 'a')['items'], [1])
+        self.assertIsNone(self.cache.get('outline', 'b'))
+
+        self.now += 31
+        self.assertIsNone(self.cache.get('outline', 'a'))
+        self.assertEqual(self.cache.stats()['outline'], {'hits': 1, 'negative_hits': 0, 'misses': 2, 'stores': 2})
+
+    def test_entries_persist_across_instances(self):
+        self.cache.set('affiliate', 'k', {'success': True, 'items': ['x']})
+        reopened = corp_cache.CorpInfoCache(self.path, clock=lambda: self.now)
+        self.assertEqual(reopened.get('affiliate', 'k')['items'], ['x'])
+
+    def test_service_serves_repeat_lookups_from_cache(self):
+        service = corp_info_service.CorpInfoService(cache=self.cache, http=corp_info_service.HttpClient())
+        responses = {
+            'getCorpOutline_V2': api_payload([{'crno': '1101110000000', 'corpNm': '(주)테스트'}]),
+            'getAffiliate_V2': api_payload([]),
+        }
+
+        def fake_get(url, params=None, timeout=None, queue_timeout=None):
+            return FakeResponse(responses[url.rsplit('/', 1)[1]])
+
+        with mock.patch.object(service.http, 'get', side_effect=fake_get) as get:
+            # 법인등록번호가 있으면 번호로만 조회 / 캐시 (호출자의 회사명 표기와 무관)
+            first = service.get_corp_outline(corp_name='(주) 테스트', crno='110111-0000000')
+            second = service.get_corp_outline(corp_name='테스트', crno='1101110000000')
+            self.assertNotIn('corpNm', get.call_args.kwargs['params'])
+            self.assertFalse(service.get_affiliate('1101110000000')['success'])
+            self.assertFalse(service.get_affiliate('1101110000000')['success'])
+            self.assertEqual(get.call_count, 2)
+
+            # 법인명 조회는 API에 보내는 이름 그대로 캐시
+            service.get_corp_outline(corp_name='(주) 테스트')
+            service.get_corp_outline(corp_name='테스트')
+            service.get_corp_outline(corp_name='테스트')
+            self.assertEqual(get.call_count, 4)
+            self.assertEqual(get.call_args.kwargs['params']['corpNm'], '테스트')
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.cache.stats()['affiliate']['negative_hits'], 1)
+
+    def test_malformed_responses_are_not_cached(self):
+        service = corp_info_service.CorpInfoService(cache=self.cache, http=corp_info_service.HttpClient())
+        payloads = [
+            {},
+            {'response': {'body': {'totalCount': 0, 'items': ''}}},
+            {'response': {'header': {'resultMsg': 'SERVICE ERROR'}, 'body': {'totalCount': 0}}},
+            ['unexpected'],
+        ]
+        for payload in payloads:
+            for lookup in (lambda: service.get_corp_outline(corp_name='테스트'),
+                           lambda: service.get_affiliate('1101110000000'),
+                           lambda: service.get_subsidiary('1101110000000')):
+                with mock.patch.object(service.http, 'get', return_value=FakeResponse(payload)) as get:
+                    self.assertFalse(lookup()['success'])
+                    self.assertFalse(lookup()['success'])
+                self.assertEqual(get.call_count, 2, payload)
+
+    def test_api_errors_are_not_cached(self):
+        service = corp_info_service.CorpInfoService(cache=self.cache, http=corp_info_service.HttpClient())
+        with mock.patch.object(service.http, 'get',
+                               return_value=FakeResponse(api_payload([], result_code='22'))) as get:
+            service.get_subsidiary('1101110000000')
+            service.get_subsidiary('1101110000000')
+        self.assertEqual(get.call_count, 2)
+
+    def test_busy_host_is_not_cached_as_missing(self):
+        service = corp_info_service.CorpInfoService(cache=self.cache, http=corp_info_service.HttpClient())
+        busy = http_client.HostBusy('Too many concurrent requests')
+        responses = [busy, FakeResponse(api_payload([{'corpNm': 'A'}]))]
+        with mock.patch.object(service.http, 'get', side_effect=responses) as get:
+            self.assertFalse(service.get_corp_outline(corp_name='테스트')['success'])
+            self.assertTrue(service.get_corp_outline(corp_name='테스트')['success'])
+            self.assertTrue(service.get_corp_outline(corp_name='테스트')['success'])
+        self.assertEqual(get.call_count, 2)
+        # 공공데이터 API 호출은 호스트 빈 자리를 응답 제한시간까지 기다림
+        self.assertEqual(get.call_args.kwargs['queue_timeout'], get.call_args.kwargs['timeout'])
+
+
+class TestStandaloneImport(unittest.TestCase):
+    def test_importable_from_services_directory(self):
+        # 루트 스크립트(test_corp_api.py 등)는 api/services를 sys.path에 넣고 패키지 없이 import함
+        code = "import sys; sys.path.insert(0, sys.argv[1]); import corp_info_service; corp_info_service.CorpInfoService"
+        result = subprocess.run([sys.executable, '-c', code, os.path.join(API_DIR, 'services')],
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import time
+import threading
+import unittest
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tests.api_support import load_api
+
+http_client = load_api('services.http_client')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if self.path.startswith('/slow'):
+                time.sleep(0.2)
+            status = 404 if self.path.startswith('/missing') else 200
+            body = b'ok'
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.connections = set()
+        self.server.active = 0
+        self.server.max_active = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_repeat_requests_reuse_connection(self):
+        client = http_client.HttpClient()
+        for _ in range(5):
+            self.assertEqual(client.get(self.base + '/a').text, 'ok')
+        self.assertEqual(client.get(self.base + '/missing').status_code, 404)
+
+        self.assertEqual(len(self.server.connections), 1)
+        stats = client.stats()[self.base]
+        self.assertEqual((stats['requests'], stats['http_errors']), (6, 1))
+        client.close()
+        self.assertEqual(client.stats(), {})
+
+    def test_per_host_limit_and_stats(self):
+        client = http_client.HttpClient(max_per_host=2, connect_timeout=2)
+        threads = [threading.Thread(target=client.get, args=(self.base + '/slow',)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        client.get(self.base + '/missing')
+
+        self.assertEqual(self.server.max_active, 2)
+        self.assertEqual(len(self.server.connections), 2)
+        stats = client.stats()[self.base]
+        self.assertEqual((stats['requests'], stats['errors'], stats['http_errors'], stats['busy']), (7, 0, 1, 0))
+        self.assertGreaterEqual(stats['max_ms'], 200)
+
+    def test_busy_host_fails_within_connect_timeout(self):
+        client = http_client.HttpClient(max_per_host=1, connect_timeout=0.05)
+        slow = threading.Thread(target=client.get, args=(self.base + '/slow',))
+        slow.start()
+        time.sleep(0.05)
+        with self.assertRaises(http_client.requests.exceptions.RequestException):
+            client.get(self.base + '/a')
+        slow.join()
+        self.assertEqual(client.stats()[self.base]['busy'], 1)
+
+    def test_queue_timeout_waits_for_busy_host(self):
+        client = http_client.HttpClient(max_per_host=1, connect_timeout=0.05)
+        slow = threading.Thread(target=client.get, args=(self.base + '/slow',))
+        slow.start()
+        time.sleep(0.05)
+        self.assertEqual(client.get(self.base + '/a', queue_timeout=2).text, 'ok')
+        slow.join()
+        self.assertEqual(client.stats()[self.base]['busy'], 0)
+
+    def test_host_limits_override_default(self):
+        client = http_client.HttpClient(max_per_host=1, host_limits={'127.0.0.1': 3}, connect_timeout=2)
+        threads = [threading.Thread(target=client.get, args=(self.base + '/slow',)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.server.max_active, 3)
+
+        with mock.patch.dict(os.environ, {'HTTP_HOST_LIMITS': 'Example.com=2, apis.data.go.kr:443=20'}):
+            limits = http_client.HttpClient.from_env().host_limits
+        self.assertEqual(limits, {'apis.data.go.kr': 16, 'example.com': 2, 'apis.data.go.kr:443': 20})
+        self.assertEqual(http_client.HttpClient(max_per_host=4)._limit('http://apis.data.go.kr'), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from tests.api_support import load_api
+
+industry_taxonomy = load_api('services.industry_taxonomy')
+TAXONOMY = industry_taxonomy.TAXONOMY
+
+
+def codes(nodes):
+    return sorted(TAXONOMY.codes[n] if TAXONOMY.is_node(n) else n for n in nodes)
+
+
+class TestIndustryTaxonomy(unittest.TestCase):
+    def test_korean_and_english_aliases(self):
+        self.assertEqual(industry_taxonomy.resolve('제조'), industry_taxonomy.resolve('Manufacturing'))
+        self.assertEqual(codes(industry_taxonomy.resolve('IT/Software')), ['J62'])
+        self.assertEqual(codes(industry_taxonomy.resolve('화학/소재')), ['C20'])
+        self.assertEqual(codes(industry_taxonomy.resolve('의료기기')), ['C27'])
+        self.assertEqual(codes(industry_taxonomy.resolve('Medical')), ['Q86'])
+        self.assertEqual(codes(industry_taxonomy.resolve('1차금속')), ['C24'])
+        self.assertEqual(codes(industry_taxonomy.resolve('비금속 광물')), ['C23'])
+
+    def test_short_aliases_need_word_boundaries(self):
+        self.assertEqual(codes(industry_taxonomy.resolve('Unit')), ['unit'])
+        self.assertEqual(codes(industry_taxonomy.resolve('IT 서비스')), ['J'])
+        self.assertEqual(industry_taxonomy.resolve(''), frozenset())
+        self.assertEqual(industry_taxonomy.resolve(None), frozenset())
+
+    def test_registry_texts(self):
+        # 공공데이터 표준산업분류명(sicNm) / 주요사업(enpMainBizNm)
+        self.assertEqual(codes(industry_taxonomy.resolve('전자부품, 컴퓨터, 영상, 음향 및 통신장비 제조업')), ['C26'])
+        self.assertEqual(codes(industry_taxonomy.resolve('반도체 제조 및 판매')), ['C26'])
+        self.assertEqual(codes(industry_taxonomy.resolve('물류/유통')), ['G', 'H52'])
+
+    def test_parent_and_child_sectors_match(self):
+        semiconductor = industry_taxonomy.target_nodes('반도체')
+        self.assertFalse(industry_taxonomy.resolve('Manufacturing').isdisjoint(semiconductor))
+        self.assertTrue(industry_taxonomy.resolve('Chemical').isdisjoint(semiconductor))
+        manufacturing = industry_taxonomy.target_nodes('제조업')
+        self.assertFalse(industry_taxonomy.resolve('Automotive').isdisjoint(manufacturing))
+        self.assertTrue(industry_taxonomy.resolve('Finance').isdisjoint(manufacturing))
+
+    def test_target_nodes_fall_back_to_registry_fields(self):
+        self.assertEqual(industry_taxonomy.target_nodes('', '반도체 제조', '전자부품 제조업'),
+                         industry_taxonomy.target_nodes('반도체'))
+        # 분석 결과 업종을 해석할 수 있으면 공공데이터 업종은 쓰지 않음
+        self.assertEqual(industry_taxonomy.target_nodes('Finance', '반도체 제조'),
+                         industry_taxonomy.target_nodes('Finance'))
+        # 분류에 없는 업종은 같은 표기끼리만 일치
+        self.assertEqual(industry_taxonomy.target_nodes('Other'), ['other'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from tests.api_support import load_api
+
+iso_registry = load_api('services.iso_registry')
+
+
+class TestIsoRegistry(unittest.TestCase):
+    def test_normalize_spellings(self):
+        for code in ('ISO 9001', '9001', 'iso9001:2015', 'ISO 9001 (2015)', 'KS Q ISO 9001', ' ISO  9001 '):
+            self.assertEqual(iso_registry.normalize(code), 'ISO 9001', code)
+        self.assertEqual(iso_registry.normalize('ISO/IEC 27001:2022'), 'ISO 27001')
+        self.assertEqual(iso_registry.normalize('IATF16949'), 'IATF 16949')
+        self.assertEqual(iso_registry.normalize('ISO/TS 16949'), 'IATF 16949')
+        self.assertEqual(iso_registry.normalize('ISO/IEC 20000-1:2018'), 'ISO 20000-1')
+        self.assertEqual(iso_registry.normalize('FSSC 22000'), 'FSSC 22000')
+        self.assertEqual(iso_registry.normalize('ISO 22000'), 'ISO 22000')
+        self.assertIsNone(iso_registry.normalize(''))
+        self.assertIsNone(iso_registry.normalize(None))
+        self.assertEqual(iso_registry.normalize('HACCP'), 'HACCP')
+
+    def test_aliases(self):
+        self.assertEqual(iso_registry.normalize('OHSAS 18001:2007'), 'ISO 45001')
+        self.assertEqual(iso_registry.normalize('ISO 20000'), 'ISO 20000-1')
+        self.assertEqual(iso_registry.normalize_all(['9001', 'ISO 9001:2015', 'OHSAS 18001', 'ISO 45001']),
+                         ('ISO 9001', 'ISO 45001'))
+
+    def test_mask_overlap(self):
+        registry = iso_registry.IsoRegistry()
+        consultant = registry.mask(['ISO 9001', 'ISO 14001', 'ISO 45001'])
+        target = registry.mask(['ISO 14001', 'ISO 45001', 'ISO 27001'])
+        self.assertEqual(iso_registry.popcount(consultant & target), 2)
+        self.assertEqual(registry.codes(consultant & target), ['ISO 14001', 'ISO 45001'])
+        # 목록에 없는 표준은 뒤쪽 비트를 새로 받음 (64비트를 넘어도 동작)
+        extra = ['ISO %d' % (60000 + i) for i in range(80)]
+        mask = registry.mask(extra)
+        self.assertEqual(iso_registry.popcount(mask), 80)
+        self.assertEqual(registry.bit(extra[0]), len(iso_registry.STANDARDS))
+        self.assertEqual(registry.codes(mask), extra)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from tests.api_support import load_api
+
+iso_scanner = load_api('services.iso_scanner')
+
+
+class TestIsoScanner(unittest.TestCase):
+    def test_standard_codes_are_normalized(self):
+        text = ('ISO 9001:2015, 14001 및 45001 인증 보유 / KS Q ISO 9001 / ISO/IEC 27001:2022 / iso13485 / '
+                'IATF16949 / TS 16949 / OHSAS 18001 / AS9100D / ISO 9001-2015 / ISO 3166 국가코드 / ISO 8601')
+        self.assertEqual(iso_scanner.iso_codes(text), [
+            'ISO 9001', 'ISO 14001', 'ISO 45001', 'ISO 27001', 'ISO 13485', 'IATF 16949', 'AS 9100',
+        ])
+        # 연도 / 목록에 없는 표준 번호는 코드가 아님
+        self.assertNotIn(('iso', 'ISO 2015'), iso_scanner.scan('ISO 9001, 2015년 획득'))
+
+    def test_korean_and_english_system_names(self):
+        text = ('의료기기 품질경영시스템 인증, 환경 경영 시스템, 안전보건경영시스템, 정보보호경영시스템 / '
+                'Quality Management Systems and an Information-Security Management System')
+        self.assertEqual([value for _, value in iso_scanner.scan(text)], [
+            'ISO 13485', 'ISO 14001', 'ISO 45001', 'ISO 27001', 'ISO 9001', 'ISO 27001',
+        ])
+
+    def test_certificate_numbers_and_expiry_dates(self):
+        text = ('인증번호: KR-QMS-12345 / Certificate No. 0123456 / 등록번호 : 없음 / '
+                '유효기간 : 2023년 1월 2일 ~ 2026년 1월 1일 / Valid until: 2027-03-15 / Expiry date 2027.13.01')
+        self.assertEqual(iso_scanner.scan(text), [
+            ('cert_no', 'KR-QMS-12345'), ('cert_no', '0123456'),
+            ('expiry', '2026-01-01'), ('expiry', '2027-03-15'),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
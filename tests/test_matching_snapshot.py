@@ -0,0 +1,144 @@
+import os
+import json
+import random
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from tests.api_support import load_api, create_test_app, dispose_test_app
+from tests.test_api_matching import TARGET_REGIONS, random_consultant, random_criteria, reference_match
+
+models = load_api('models')
+matching_service = load_api('services.matching_service')
+matching_snapshot = load_api('services.matching_snapshot')
+regions = load_api('services.regions')
+
+
+class TestMatchingSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.app = create_test_app()
+        self.directory = tempfile.mkdtemp()
+        rng = random.Random(23)
+        with self.app.app_context():
+            for i in range(200):
+                models.db.session.add(random_consultant(rng, i))
+            models.db.session.commit()
+
+    def tearDown(self):
+        dispose_test_app(self.app)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _summary(self, results):
+        return [(r['id'], r['matchScore'], r['matchReason']) for r in results]
+
+    def test_decoded_matrix_scores_equal_built_matrix(self):
+        service = matching_service.MatchingService()
+        rng = random.Random(29)
+        with self.app.app_context():
+            matrix = service.ensure_matrix()
+            snapshot = matching_snapshot.decode(matching_snapshot.encode(matrix))
+            self.assertEqual(snapshot.size, matrix.size)
+            self.assertEqual(snapshot.fallback_rows.tolist(), matrix.fallback_rows.tolist())
+            for row in (0, 57, matrix.size - 1):
+                self.assertEqual(snapshot.records[row].id, matrix.records[row].id)
+                self.assertEqual(snapshot.records[row].iso, matrix.records[row].iso)
+                self.assertEqual(snapshot.records[row].regions, matrix.records[row].regions)
+            for _ in range(30):
+                target = service._parse_criteria(dict(random_criteria(rng), region=rng.choice(TARGET_REGIONS)))
+                self.assertEqual(snapshot.score(target, regions.TIER_NEAR).tolist(),
+                                 matrix.score(target, regions.TIER_NEAR).tolist(), target)
+
+    def test_workers_share_published_generations(self):
+        builder = matching_service.MatchingService(snapshot_dir=self.directory)
+        reader = matching_service.MatchingService(snapshot_dir=self.directory)
+        criteria = {'industry': 'Semiconductor', 'recommended_iso': [{'code': 'ISO 50001'}]}
+        with self.app.app_context():
+            builder.match_consultants(criteria)
+            self.assertEqual(reader.ensure_matrix().size, 200)
+            self.assertEqual(reader.shared.generation, builder.shared.generation)
+            self.assertFalse(reader.index.is_built)
+
+            newcomer = models.Consultant(
+                name='Newcomer', iso_experience=json.dumps({'ISO 50001': 'Lead Auditor'}),
+                industry_experience=json.dumps(['Semiconductor']), trust_score=10.0
+            )
+            models.db.session.add(newcomer)
+            models.db.session.commit()
+            builder.refresh_consultant(newcomer)
+
+            # 다른 워커는 다음 요청에서 새 세대에 붙음
+            self.assertEqual(reader.match_consultants(criteria)[0]['name'], 'Newcomer')
+            self.assertEqual(reader.shared.generation, 2)
+            consultants = models.Consultant.query.order_by(models.Consultant.id).all()
+            rng = random.Random(31)
+            for _ in range(20):
+                criteria = random_criteria(rng)
+                self.assertEqual(self._summary(reader.match_consultants(criteria)),
+                                 reference_match(consultants, criteria), criteria)
+
+    def _stored_service(self, name):
+        service = matching_service.MatchingService(snapshot_store=True)
+        service.stored = matching_snapshot.StoredSnapshot(os.path.join(self.directory, name))
+        return service
+
+    def test_stored_snapshot_survives_cold_start(self):
+        criteria = {'industry': 'Manufacturing', 'recommended_iso': [{'code': 'ISO 9001'}], 'project_type': 'New'}
+        with self.app.app_context():
+            writer = self._stored_service('writer')
+            expected = writer.match_consultants(criteria)
+            self.assertIsNotNone(writer.stored.token)
+
+            # 새 인스턴스: DB에 저장된 스냅샷을 로컬 파일로 받아 mmap (빌드 없음)
+            cold = self._stored_service('cold')
+            self.assertEqual(cold.match_consultants(criteria), expected)
+            self.assertEqual(cold.stored.token, writer.stored.token)
+            self.assertTrue(os.path.exists(cold.stored.path(cold.stored.token)))
+
+            # 컨설턴트 변경(모델 이벤트) -> data_version 증가 -> 오래된 스냅샷 감지 후 다시 빌드
+            consultant = models.Consultant.query.get(1)
+            consultant.iso_experience = json.dumps(['ISO 9001'])
+            consultant.industry_experience = json.dumps(['Manufacturing'])
+            consultant.project_types = json.dumps(['New'])
+            consultant.trust_score = 100.0
+            consultant.verified = True
+            models.db.session.commit()
+            self.assertEqual(cold.match_consultants(criteria)[0]['id'], 1)
+            self.assertNotEqual(cold.stored.token, writer.stored.token)
+            consultants = models.Consultant.query.order_by(models.Consultant.id).all()
+            self.assertEqual(self._summary(writer.match_consultants(criteria)), reference_match(consultants, criteria))
+
+            # 형식 버전이 다른 스냅샷은 사용하지 않음
+            models.MatchingSnapshot.query.update({models.MatchingSnapshot.format_version: 0})
+            models.db.session.commit()
+            token = writer.stored.token
+            writer.match_consultants(criteria)
+            self.assertNotEqual(writer.stored.token, token)
+
+    def test_snapshot_from_other_lookup_tables_is_rebuilt(self):
+        criteria = {'industry': 'Manufacturing', 'recommended_iso': [{'code': 'ISO 9001'}], 'region': '서울'}
+        with self.app.app_context():
+            writer = self._stored_service('writer')
+            expected = writer.match_consultants(criteria)
+            shared = matching_service.MatchingService(snapshot_dir=self.directory)
+            shared.match_consultants(criteria)
+            token, generation = writer.stored.token, shared.shared.generation
+            data = matching_snapshot.encode(writer.ensure_matrix())
+            self.assertEqual(matching_snapshot.read_header(data)['fingerprint'], matching_snapshot.lookup_fingerprint())
+
+            # ISO / 업종 / 지역 표를 고친 배포: 형식 버전이 같아도 이전 스냅샷은 miss
+            with mock.patch.object(matching_snapshot, 'lookup_fingerprint', return_value='changed'):
+                with self.assertRaises(ValueError):
+                    matching_snapshot.decode(data)
+                cold = self._stored_service('cold')
+                self.assertEqual(cold.match_consultants(criteria), expected)
+                self.assertNotEqual(cold.stored.token, token)
+                self.assertFalse(os.path.exists(cold.stored.path(token)))
+
+                worker = matching_service.MatchingService(snapshot_dir=self.directory)
+                self.assertEqual(worker.match_consultants(criteria), expected)
+                self.assertEqual(worker.shared.generation, generation + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from tests.api_support import load_api
+
+page_text, iso_scanner = load_api('services.page_text', 'services.iso_scanner')
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestPageText(unittest.TestCase):
+    def test_text_links_and_mentions_across_chunks(self):
+        html = ('<html><head><title>테스트</title><style>.iso9001{}</style>'
+                '<script>var x = "ISO 14001";</script></head><body>'
+                '<h1>품질 &amp; 인증</h1><p>' + '가' * 9000 + '</p>'
+                '<a href="/cert">인증 <b>현황</b></a><p>ISO</p><p>9001 품질경영시스템 인증</p>'
+                '</body></html>').encode('utf-8')
+        page = page_text.extract(_chunks(html, 7), 'text/html; charset=utf-8', scan=iso_scanner.scan,
+                                 preview_chars=20)
+
+        self.assertEqual(page['text'], '테스트 품질 & 인증 가가가가가가가가')
+        self.assertEqual(page['links'], [('/cert', '인증 현황')])
+        self.assertEqual(set(page['mentions']), {('iso', 'ISO 9001')})
+        self.assertEqual((page['encoding'], page['bytes'], page['truncated']), ('utf-8', len(html), False))
+
+    def test_charset_sniffing(self):
+        body = '<p>ISO 9001 인증 획득</p>'.encode('cp949')
+        meta = b'<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr"></head>' + body
+        for content_type, data in (('text/html; charset=EUC-KR', body), ('text/html', meta), ('text/html', body)):
+            page = page_text.extract([data], content_type)
+            self.assertEqual((page['encoding'], page['text']), ('cp949', 'ISO 9001 인증 획득'))
+
+        bom = page_text.extract([b'\xef\xbb\xbf<p>\xec\x9d\xb8\xec\xa6\x9d</p>'], 'text/html')
+        self.assertEqual((bom['encoding'], bom['text']), ('utf-8-sig', '인증'))
+
+    def test_stops_at_byte_and_text_caps(self):
+        html = ('<html><body><p>ISO 45001</p>' + '<p>본문</p>' * 50000 + '<p>ISO 27001</p></body></html>')
+        data = html.encode('utf-8')
+
+        capped = page_text.extract(_chunks(data, 16384), 'text/html', scan=iso_scanner.scan,
+                                   max_bytes=50000)
+        self.assertTrue(capped['truncated'])
+        self.assertEqual(capped['bytes'], 50000)
+        self.assertEqual(capped['mentions'], [('iso', 'ISO 45001')])
+
+        chunks = iter(_chunks(data, 1024))
+        limited = page_text.extract(chunks, 'text/html', scan=iso_scanner.scan, max_text=3000)
+        self.assertTrue(limited['truncated'])
+        self.assertEqual(limited['mentions'], [('iso', 'ISO 45001')])
+        # 텍스트 상한에 걸리면 나머지 청크는 읽지 않음
+        self.assertGreater(len(list(chunks)), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
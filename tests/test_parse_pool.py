@@ -0,0 +1,46 @@
+import unittest
+
+from tests.api_support import load_api, api_modules
+
+parse_pool, iso_scanner = load_api('services.parse_pool', 'services.iso_scanner')
+
+PAGE = ('<html><body><h1>테스트 주식회사</h1><a href="/cert">인증현황</a>'
+        '<p>ISO 9001:2015 / 환경경영시스템 인증번호: EMS-1234</p></body></html>').encode('utf-8')
+
+
+def _chunks(data: bytes, size: int = 1024):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestParsePool(unittest.TestCase):
+    def setUp(self):
+        self.pool = parse_pool.ParsePool(workers=1, timeout=30)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_worker_result_matches_inline(self):
+        inline = parse_pool.ParsePool(workers=0).extract(_chunks(PAGE), 'text/html', scan=iso_scanner.scan)
+        with api_modules():
+            pooled = self.pool.extract(_chunks(PAGE), 'text/html', scan=iso_scanner.scan)
+
+        self.assertEqual(pooled, inline)
+        self.assertEqual(pooled['links'], [('/cert', '인증현황')])
+        self.assertEqual(pooled['mentions'], [('iso', 'ISO 9001'), ('iso', 'ISO 14001'), ('cert_no', 'EMS-1234')])
+        self.assertEqual(self.pool.stats(), {'workers': 1, 'parsed': 1, 'inline': 0, 'timeouts': 0, 'errors': 0})
+
+    def test_timeout_keeps_pool_usable(self):
+        large = ('<html><body>' + '<p>제품 소개 ISO 9001</p>' * 20000 + '</body></html>').encode('utf-8')
+        with api_modules():
+            with self.assertRaises(parse_pool.ParseTimeout):
+                self.pool.extract(_chunks(large, 65536), 'text/html', timeout=0.05, scan=iso_scanner.scan,
+                                  max_bytes=len(large))
+            # 시간 초과된 작업이 끝나면 같은 워커가 다음 작업을 처리
+            result = self.pool.extract(_chunks(PAGE), 'text/html', scan=iso_scanner.scan)
+
+        self.assertIn(('iso', 'ISO 9001'), result['mentions'])
+        self.assertEqual(self.pool.stats()['timeouts'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
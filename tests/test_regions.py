@@ -0,0 +1,41 @@
+import unittest
+
+from tests.api_support import load_api
+
+regions = load_api('services.regions')
+
+
+class TestRegions(unittest.TestCase):
+    def test_resolve_names_and_addresses(self):
+        self.assertEqual(regions.resolve('서울 강남구'), ('서울', '강남구'))
+        self.assertEqual(regions.resolve('(06234) 서울특별시 강남구 테헤란로 152'), ('서울', '강남구'))
+        self.assertEqual(regions.resolve('경기도 성남시 분당구 판교역로'), ('경기', '성남시'))
+        self.assertEqual(regions.resolve('Busan'), ('부산', None))
+        self.assertEqual(regions.resolve('전라북도'), ('전북', None))
+        self.assertEqual(regions.resolve('수원'), ('경기', '수원시'))
+        self.assertEqual(regions.resolve('전국'), (regions.NATIONWIDE, None))
+        # 여러 시/도에 있는 시/군/구만으로는 해석하지 않음
+        self.assertIsNone(regions.resolve('중구'))
+        self.assertIsNone(regions.resolve('고성군'))
+        self.assertIsNone(regions.resolve('Atlantis'))
+
+    def test_tiers(self):
+        seoul_gangnam = ('서울', '강남구')
+        self.assertEqual(regions.best_tier(['서울 강남구'], seoul_gangnam), regions.TIER_DISTRICT)
+        self.assertEqual(regions.best_tier(['서울 마포구'], seoul_gangnam), regions.TIER_PROVINCE)
+        self.assertEqual(regions.best_tier(['경기'], seoul_gangnam), regions.TIER_ADJACENT)
+        self.assertEqual(regions.best_tier(['충남'], seoul_gangnam), regions.TIER_NEAR)
+        self.assertEqual(regions.best_tier(['부산', '제주'], seoul_gangnam), regions.TIER_FAR)
+        self.assertEqual(regions.best_tier(['부산', '경기'], seoul_gangnam), regions.TIER_ADJACENT)
+        self.assertEqual(regions.best_tier(['전국'], ('제주', None)), regions.TIER_ADJACENT)
+        self.assertEqual(regions.best_tier(['미정'], seoul_gangnam), regions.TIER_UNKNOWN)
+
+    def test_adjacency_is_symmetric(self):
+        for province, neighbors in regions.ADJACENCY.items():
+            for neighbor in neighbors:
+                self.assertIn(province, regions.ADJACENCY[neighbor])
+                self.assertEqual(regions.TIERS[province][neighbor], regions.TIER_ADJACENT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import time
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tests.api_support import load_api
+
+http_client, parse_pool, site_crawler = load_api('services.http_client', 'services.parse_pool', 'services.site_crawler')
+
+PAGES = {
+    '/': '<html><body><h1>테스트 주식회사</h1><p>정밀 부품 제조</p>'
+         '<a href="/about">회사소개</a> <a href="/cert/iso">인증현황</a> <a href="/news">뉴스</a>'
+         '<a href="https://other.example.com/iso">외부 인증기관</a> <a href="/brochure-iso.pdf">ISO 브로셔</a>'
+         '<a href="mailto:iso@example.com">문의</a> <a href="/certification-slow">인증서 다운로드</a>'
+         '</body></html>',
+    '/about': '<html><body>회사 연혁</body></html>',
+    '/cert/iso': '<html><body>ISO 9001 품질경영시스템 인증 / ISO 14001 인증 보유'
+                 '<table><tr><td>인증번호</td><td>QMS-2021-077</td><td>유효기간</td>'
+                 '<td>2024.05.01 ~ 2027.04.30</td></tr></table></body></html>',
+    '/quality/iso-policy': '<html><body>ISO 45001 안전보건경영시스템 인증 획득, ISO 9001 유지</body></html>',
+    '/news': '<html><body>ISO 27001 뉴스</body></html>',
+    '/large/': '<html><body><p>ISO 14001 환경</p>' + '<p>' + '제품 소개 ' * 200000 + '</p>'
+               '<p>ISO 27001 정보보안</p><a href="/cert/iso">인증현황</a></body></html>',
+    '/sitemap.xml': '<?xml version="1.0"?><urlset><url><loc>{base}/quality/iso-policy</loc></url>'
+                    '<url><loc>{base}/news</loc></url></urlset>',
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        if self.path == '/certification-slow':
+            time.sleep(self.server.slow)
+        page = PAGES.get(self.path, '<html><body>ISO 13485 인증서</body></html>'
+                         if self.path == '/certification-slow' else None)
+        if page is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = page.format(base=self.server.base).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml' if self.path.endswith('.xml') else 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            # 상한까지만 읽고 연결을 닫은 클라이언트
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSiteCrawler(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.paths = []
+        self.server.slow = 0
+        self.server.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = self.server.base
+        self.http = http_client.HttpClient()
+        # 프로세스 풀은 test_parse_pool에서 검증 - 여기서는 요청 스레드에서 파싱
+        self.parser = parse_pool.ParsePool(workers=0)
+
+    def tearDown(self):
+        self.http.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_collects_mentions_from_links_and_sitemap(self):
+        crawler = site_crawler.SiteCrawler(http=self.http, parser=self.parser, max_pages=3)
+        result = crawler.crawl(self.base + '/')
+
+        self.assertTrue(result['site_content'].startswith('테스트 주식회사'))
+        self.assertTrue(result['certification_page_found'])
+        self.assertEqual(result['pages_fetched'], 4)
+        self.assertEqual(result['iso_sources']['ISO 9001'],
+                         sorted([self.base + '/cert/iso', self.base + '/quality/iso-policy']))
+        self.assertEqual(result['iso_sources']['ISO 45001'], [self.base + '/quality/iso-policy'])
+        self.assertIn('ISO 13485', result['iso_mentions'])
+        self.assertEqual(result['iso_mentions'], sorted(result['iso_sources']))
+        self.assertEqual((result['certificate_numbers'], result['expiry_dates']), (['QMS-2021-077'], ['2027-04-30']))
+        # 점수 0인 페이지 / 다른 사이트 / PDF / mailto는 받지 않음
+        self.assertNotIn('/news', self.server.paths)
+        self.assertNotIn('/about', self.server.paths)
+        self.assertNotIn('/brochure-iso.pdf', self.server.paths)
+
+    def test_time_budget_drops_slow_pages(self):
+        self.server.slow = 2
+        crawler = site_crawler.SiteCrawler(http=self.http, parser=self.parser, max_pages=3, time_budget=0.6)
+        started = time.monotonic()
+        result = crawler.crawl(self.base + '/')
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertIn('ISO 45001', result['iso_mentions'])
+        self.assertNotIn('ISO 13485', result['iso_mentions'])
+
+    def test_large_page_is_read_up_to_byte_cap(self):
+        crawler = site_crawler.SiteCrawler(http=self.http, parser=self.parser, max_bytes=64 * 1024)
+        result = crawler.crawl(self.base + '/large/')
+
+        # 상한 뒤의 본문과 링크(/cert/iso)는 읽지 않음
+        self.assertIn('ISO 14001', result['iso_mentions'])
+        self.assertNotIn('ISO 27001', result['iso_mentions'])
+        self.assertNotIn('/cert/iso', self.server.paths)
+        self.assertTrue(result['site_content'].startswith('ISO 14001 환경 제품 소개'))
+        self.assertEqual(len(result['site_content']), 1500)
+        self.assertEqual(self.http.stats()[self.base]['errors'], 0)
+
+    def test_candidate_ranking(self):
+        crawler = site_crawler.SiteCrawler(http=self.http, parser=self.parser)
+        home = 'https://www.example.com/'
+        candidates = crawler._candidates(home, [
+            ('/company/history', '연혁'),
+            ('/quality', '품질경영'),
+            ('https://example.com/cert/iso9001', 'ISO 인증'),
+            ('#top', '인증'),
+            ('/', '홈 인증'),
+        ], ['https://example.com/board/list?category=certification'])
+        self.assertEqual([url for url, _ in candidates], [
+            'https://example.com/cert/iso9001',
+            'https://www.example.com/quality',
+            'https://example.com/board/list?category=certification',
+            'https://www.example.com/company/history',
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()